@@ -1,34 +1,68 @@
+import os
+import runpy
 import subprocess
 import sys
-from typing import Optional
+from typing import List, Optional
 
 import typer
 
 app = typer.Typer(help="Neon Gridiron ULTRA: Unified CLI")
 
 
+def _exit_code(exc: SystemExit) -> int:
+    """The status the interpreter would have exited with for this SystemExit."""
+    if exc.code is None or isinstance(exc.code, int):
+        return exc.code or 0
+    typer.echo(exc.code, err=True)
+    return 1
+
+
+def _run_in_process(target: str, argv: Optional[List[str]] = None, module: bool = False):
+    """
+    Run a script (or `-m` module) as __main__ in this interpreter instead of a new one.
+    sys.argv and sys.path are set up as `python target` would and restored afterwards;
+    the target's sys.exit() becomes this command's exit status.
+    """
+    saved_argv, saved_path = sys.argv, sys.path[:]
+    sys.argv = [target] + list(argv or [])
+    if not module:
+        sys.path.insert(0, os.path.dirname(os.path.abspath(target)))
+    try:
+        if module:
+            runpy.run_module(target, run_name="__main__", alter_sys=True)
+        else:
+            runpy.run_path(target, run_name="__main__")
+    except SystemExit as exc:
+        code = _exit_code(exc)
+        if code:
+            raise typer.Exit(code) from None
+    finally:
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+
+
 @app.command()
 def ultra():
     """Launch the full stack (API + Training + Viewer)."""
     typer.echo("🚀 Launching Neon Gridiron ULTRA Stack...")
     # This will refer to run_ultra.py which I will refactor next
-    subprocess.run([sys.executable, "run_ultra.py"])
+    _run_in_process("run_ultra.py")
 
 
 @app.command()
 def train():
     """Start the RL training league."""
     typer.echo("🏆 Starting RL Training League...")
-    subprocess.run([sys.executable, "-m", "ai.training.league"])
+    _run_in_process("ai.training.league", module=True)
 
 
 @app.command()
 def server():
     """Start the Telemetry API server (Uvicorn)."""
     typer.echo("📡 Starting Telemetry Server...")
-    subprocess.run(
-        [sys.executable, "-m", "uvicorn", "server.app:app", "--host", "127.0.0.1", "--port", "8000"]
-    )
+    import uvicorn
+
+    uvicorn.run("server.app:app", host="127.0.0.1", port=8000)
 
 
 @app.command()
@@ -54,7 +88,7 @@ def replay(file1: str, file2: Optional[str] = None):
     """View or compare replay files."""
     if file2:
         typer.echo(f"🧐 Comparing {file1} and {file2}...")
-        subprocess.run([sys.executable, "tools/replay_diff.py", file1, file2])
+        _run_in_process("tools/replay_diff.py", [file1, file2])
     else:
         typer.echo(f"📺 Playing replay {file1}...")
         # Placeholder for playback tool
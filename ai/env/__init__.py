@@ -1,5 +1,12 @@
 """Environment package for Neon Gridiron."""
 
-from ai.env.neon_env import NeonFootballEnv
-
 __all__ = ["NeonFootballEnv"]
+
+
+def __getattr__(name):
+    # Resolved on first use so `ai.env.vec_rules` & co. don't pay for gymnasium
+    if name == "NeonFootballEnv":
+        from ai.env.neon_env import NeonFootballEnv
+
+        return NeonFootballEnv
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
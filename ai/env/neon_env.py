@@ -6,9 +6,24 @@ import gymnasium as gym
 import numpy as np
 from gymnasium import spaces
 
+from ai.env.tick_cache import TickCache
+from ai.training.reward_engine import DEGENERATE_PENALTY, DEGENERATE_THRESHOLD
 from sim.core.rng import DeterministicRNG
 from sim.core.rules import RulesEngine
-from sim.core.state import BallState, MatchState, PlayerState, TeamID
+from sim.core.spatial import SpatialContext
+from sim.core.state import (
+    BallState,
+    GoalEvent,
+    MatchArrays,
+    MatchEvent,
+    MatchSnapshot,
+    MatchState,
+    PlayerState,
+    TeamID,
+)
+
+# Observation encoding indexed by PlayerRole code (GK, DEF, MID, FWD)
+_ROLE_OBS = np.array([0.1, 0.3, 0.5, 0.7])
 
 
 class NeonFootballEnv(gym.Env[np.ndarray, np.ndarray]):
@@ -20,6 +35,10 @@ class NeonFootballEnv(gym.Env[np.ndarray, np.ndarray]):
         super().__init__()
         self.config = config or {}
         self.seed_value = int(self.config.get("seed", 42))
+        # Physics ticks per agent decision (frame skip); analyst/observation run once per decision
+        self.action_repeat = int(self.config.get("action_repeat", 1))
+        if self.action_repeat < 1:
+            raise ValueError(f"action_repeat must be >= 1, got {self.action_repeat}")
         self.rng = DeterministicRNG(self.seed_value)
 
         self.action_space = spaces.Box(low=-1.0, high=1.0, shape=(56,), dtype=np.float32)
@@ -34,15 +53,40 @@ class NeonFootballEnv(gym.Env[np.ndarray, np.ndarray]):
         self.physics = PhysicsEngine((600.0, 400.0), self.rng)
         self.rules = RulesEngine((600.0, 400.0))
         
+        # Compiled config (configs/compiler.py), shared by every env of the process;
+        # reload_config() swaps in edited configs between matches
+        from configs.compiler import ConfigStore
+        self.config_store = ConfigStore.shared(self.config.get("season"))
+        self.config_table = self.config_store.table
+        self._apply_physics_config(self.config_table)
+
         from ai.training.reward_engine import RewardEngine
-        self.reward_engine = RewardEngine()
+        self.reward_engine = RewardEngine(table=self.config_table)
         
-        from ai.explainability.tactical_analyst import TacticalAnalyst
-        self.analyst = TacticalAnalyst()
+        from ai.explainability.tactical_analyst import POSSESSION_WINDOW_TICKS, TacticalAnalyst
+        # The analyst samples once per decision, so its window (in samples) shrinks with
+        # action_repeat to keep the carousel penalty on the same 5-second timescale
+        window = -(-POSSESSION_WINDOW_TICKS // self.action_repeat)
+        self.analyst = TacticalAnalyst(possession_windows=(window,))
+        # Per-tick derived metrics (analyst output, distances, possession) shared by all readers
+        self.metrics = TickCache()
+
+        from sim.core.abilities import AbilityManager
+        from sim.core.referee import Referee
+        self.abilities = AbilityManager(table=self.config_table)
+        self.referee = Referee(
+            self.config_table.penalty_limit("foul_threshold"),
+            self.config_table.penalty_limit("yellow_card_limit"),
+            self.config_table.penalty_limit("red_card_limit"),
+        )
         
-        self.state = MatchState(players=[], ball=BallState())
-        self.max_steps = 600
+        # Columnar match state; players/ball are views into self.state.arrays
+        self.state = MatchState(players=[], ball=BallState(), arrays=MatchArrays(14))
+        self.max_steps = 600  # physics ticks per episode, independent of action_repeat
         self._step_count = 0
+        # Ball position at the start of the current tick, for the swept goal check
+        self._ball_prev = np.zeros(2)
+        self.goal_time: float | None = None  # match time (ticks) the last goal crossed the line
 
     def reset(
         self,
@@ -55,123 +99,282 @@ class NeonFootballEnv(gym.Env[np.ndarray, np.ndarray]):
             self.seed_value = int(seed)
         self.rng.reset(self.seed_value)
         self._step_count = 0
-
-        # Reset Physics
-        self.physics = None
-        from sim.core.physics import PhysicsEngine
-        self.physics = PhysicsEngine((600.0, 400.0), self.rng)
+        self.goal_time = None
 
         self.state.tick = 0
         self.state.score = {TeamID.BLUE: 0, TeamID.RED: 0}
         self.state.events = []
+        self.abilities.reset()
+        self.referee.reset()
+        self.analyst.reset()
+        self.metrics.invalidate()
         
+        # Physics: spawn once, then reset the same Space in place every episode
+        formation = self._kickoff_formation()
+        if self.physics.player_map:
+            self.physics.reset_formation((300.0, 200.0), formation)
+        else:
+            self.physics.spawn_ball((300.0, 200.0))
+            for pid, pos in formation.items():
+                self.physics.spawn_player(pid, pos)
+        arrays = self.state.arrays
+        self.physics.read_state(arrays.kinematics)
+
         # Spawn Ball
-        self.state.ball = BallState(
-            pos=np.array([300.0, 200.0], dtype=np.float32),
-            vel=np.zeros(2, dtype=np.float32),
-        )
-        self.physics.spawn_ball((300.0, 200.0))
+        self.state.ball = BallState.view(arrays)
 
-        # Spawn Players with Roles
-        self.state.players = []
-        from sim.core.state import PlayerRole
+        # Spawn Players with Roles (slots 0-6 blue, 7-13 red)
+        from sim.core.state import ROLE_CODES, PlayerRole
         roles = [PlayerRole.GK, PlayerRole.DEF, PlayerRole.DEF, PlayerRole.MID, PlayerRole.MID, PlayerRole.FWD, PlayerRole.FWD]
-        
+        arrays.team[:7] = TeamID.BLUE.value
+        arrays.team[7:] = TeamID.RED.value
+        arrays.role[:] = [ROLE_CODES[r] for r in roles] * 2
+        arrays.stamina[:] = 100.0
+        arrays.energy[:] = 100.0
+        arrays.heat[:] = 0.0
+        self.state.players = [
+            PlayerState.view(arrays, slot, pid) for slot, pid in enumerate(formation)
+        ]
+        self.abilities.bind(arrays.ids)
+        self.referee.bind(arrays.ids)
+
+        return self._build_observation(), {"seed": self.seed_value}
+
+    def reload_config(self) -> bool:
+        """
+        Re-check the config sources and hot-swap the table if they changed.
+        Call between matches (before reset()); returns whether a new table was applied.
+        """
+        table = self.config_store.refresh()
+        if table is self.config_table:
+            return False
+        self._apply_config(table)
+        return True
+
+    def _apply_config(self, table):
+        """Hot-swap a recompiled ConfigTable; only called between matches."""
+        self.config_table = table
+        self._apply_physics_config(table)
+        self.reward_engine.load_table(table)
+        self.abilities.load_table(table)
+        self.referee.foul_threshold = table.penalty_limit("foul_threshold")
+        self.referee.yellow_limit = table.penalty_limit("yellow_card_limit")
+        self.referee.red_limit = table.penalty_limit("red_card_limit")
+
+    def _apply_physics_config(self, table):
+        self.physics.set_damping(
+            table.scalars["physics.damping"], table.scalars["physics.air_drag"]
+        )
+
+    def snapshot(self, canonicalize: bool = False) -> MatchSnapshot:
+        """
+        Capture the running match so it can be restored or forked into another env.
+        Read-only by default; canonicalize=True also rebuilds this env's physics from the
+        snapshot (PhysicsEngine.canonicalize) so it continues exactly like its restores.
+        """
+        arrays = self.state.arrays
+        points, cards = self.referee.discipline_table(arrays.ids)
+        return MatchSnapshot(
+            tick=self.state.tick,
+            step_count=self._step_count,
+            score=(self.state.score[TeamID.BLUE], self.state.score[TeamID.RED]),
+            bodies=self.physics.canonicalize() if canonicalize else self.physics.snapshot(),
+            resources=np.stack([arrays.stamina, arrays.energy, arrays.heat], axis=1),
+            cooldowns=self.abilities.cooldown_table(arrays.ids),
+            penalty_points=points,
+            cards=cards,
+            rng_state=self.rng.get_state(),
+            analyst_state=self.analyst.get_state(),
+            possession_team=self.state.possession_team,
+            possession_player_id=self.state.possession_player_id,
+        )
+
+    def restore(self, snap: MatchSnapshot) -> np.ndarray:
+        """Rewind (or fork) to a snapshot; returns the observation at that tick."""
+        if not self.physics.player_map:
+            self.reset()
+        arrays = self.state.arrays
+        self.physics.restore(snap.bodies)
+        self.physics.read_state(arrays.kinematics)
+        arrays.stamina[:] = snap.resources[:, 0]
+        arrays.energy[:] = snap.resources[:, 1]
+        arrays.heat[:] = snap.resources[:, 2]
+
+        self.state.tick = snap.tick
+        self._step_count = snap.step_count
+        self.goal_time = None
+        self.state.score = {TeamID.BLUE: snap.score[0], TeamID.RED: snap.score[1]}
+        self.state.events = []
+        self.state.possession_team = snap.possession_team
+        self.state.possession_player_id = snap.possession_player_id
+        self.rng.set_state(snap.rng_state)
+        self.abilities.load_cooldown_table(arrays.ids, snap.cooldowns)
+        self.referee.load_discipline_table(arrays.ids, snap.penalty_points, snap.cards)
+        self.analyst.load_state(snap.analyst_state)
+        self.metrics.invalidate()
+        return self._build_observation()
+
+    @staticmethod
+    def _kickoff_formation() -> dict[str, tuple[float, float]]:
+        formation = {}
         for idx in range(7):
-            pid = f"blue_{idx}"
-            pos = (120.0 + idx * 20.0, 60.0 + idx * 40.0)
-            self.state.players.append(
-                PlayerState(id=pid, team=TeamID.BLUE, role=roles[idx], pos=np.array(pos))
+            formation[f"blue_{idx}"] = (120.0 + idx * 20.0, 60.0 + idx * 40.0)
+        for idx in range(7):
+            formation[f"red_{idx}"] = (480.0 - idx * 20.0, 60.0 + idx * 40.0)
+        return formation
+
+    def step(self, action: np.ndarray) -> tuple[np.ndarray, float, bool, bool, dict[str, Any]]:
+        action = np.asarray(action, dtype=np.float32).reshape(self.action_space.shape)
+        # Action is (56,) -> 14 players * [dx, dy, kick, dash]
+        # For simplicity in this env, we control all players
+        reward, terminated, truncated, ticks = self._advance(action.reshape(-1, 4))
+        info: dict[str, Any] = {"ticks": ticks}
+        if terminated:
+            info["goal_time"] = self.goal_time
+        return self._build_observation(), reward, terminated, truncated, info
+
+    def step_many(
+        self,
+        actions: np.ndarray,
+        out: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray] | None = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict[str, Any]]:
+        """
+        Open-loop rollout of a (T, 56) action sequence, stopping at episode end.
+        Results are written into (T, 64) obs, (T,) reward, terminated and truncated arrays,
+        either preallocated via `out` or allocated here; the returned arrays are views
+        trimmed to the steps actually taken (info["steps"]).
+        """
+        actions = np.asarray(actions, dtype=np.float32)
+        horizon = actions.shape[0]
+        controls = actions.reshape(horizon, -1, 4)
+        if out is None:
+            out = (
+                np.zeros((horizon,) + self.observation_space.shape, dtype=np.float32),
+                np.zeros(horizon, dtype=np.float64),
+                np.zeros(horizon, dtype=bool),
+                np.zeros(horizon, dtype=bool),
             )
-            self.physics.spawn_player(pid, pos)
+        obs, rewards, terminated, truncated = out
 
-        for idx in range(7):
-            pid = f"red_{idx}"
-            pos = (480.0 - idx * 20.0, 60.0 + idx * 40.0)
-            self.state.players.append(
-                PlayerState(id=pid, team=TeamID.RED, role=roles[idx], pos=np.array(pos))
+        steps = 0
+        ticks = 0
+        while steps < horizon:
+            reward, term, trunc, taken = self._advance(controls[steps])
+            self._build_observation(out=obs[steps])
+            rewards[steps] = reward
+            terminated[steps] = term
+            truncated[steps] = trunc
+            ticks += taken
+            steps += 1
+            if term or trunc:
+                break
+
+        info = {"steps": steps, "ticks": ticks}
+        return obs[:steps], rewards[:steps], terminated[:steps], truncated[:steps], info
+
+    def _advance(self, controls: np.ndarray) -> tuple[float, bool, bool, int]:
+        """Run one agent decision (action_repeat physics ticks) and return reward/flags/ticks."""
+        reward = 0.0
+        ticks = 0
+        for sub in range(self.action_repeat):
+            ticks += 1
+            # 1. Physics Engine integration (kicks fire on the decision tick only)
+            self._physics_tick(controls, kick=sub == 0)
+
+            # Swept over the tick, so a shot that tunnels past the line still counts
+            goal_team, goal_fraction = self.rules.goal_crossing(
+                prev_pos=self._ball_prev, ball_pos=self.state.ball.pos
             )
-            self.physics.spawn_player(pid, pos)
+            terminated = goal_team is not None
+            if terminated:
+                self.goal_time = self.state.tick - 1 + goal_fraction
+                self.state.events.append(GoalEvent(
+                    event_id=f"goal_{self.state.tick}",
+                    tick=self.state.tick,
+                    actor_id=self.state.possession_player_id,
+                    team_scored=goal_team,
+                ))
 
-        return self._build_observation(), {"seed": self.seed_value}
+            # 2. Reward calculation (goals arrive as GOAL events)
+            tick_reward = self.reward_engine.calculate(
+                self.state, self.state.events, TeamID.BLUE, self.spatial_context()
+            )
+            truncated = self._step_count >= self.max_steps
+            decision_end = terminated or truncated or sub == self.action_repeat - 1
 
-    def step(self, action: np.ndarray) -> tuple[np.ndarray, float, bool, bool, dict[str, Any]]:
-        action = np.asarray(action, dtype=np.float32).reshape(self.action_space.shape)
-        
+            # 3. Tactical Analysis, once per decision
+            if decision_end:
+                tactical_data = self.tactical_analysis()
+                self.state.pressure_index = tactical_data['pressure_index']
+
+                # Apply degenerate penalty
+                if tactical_data['degenerate_score'] > DEGENERATE_THRESHOLD:
+                    tick_reward += DEGENERATE_PENALTY  # Penalty for carousel possession
+
+            if goal_team is not None:
+                self.state.score[goal_team] += 1
+            reward += tick_reward
+
+            # Clear events for next tick to avoid double counting
+            self.state.events = []
+
+            if decision_end:
+                break
+
+        return reward, bool(terminated), bool(truncated), ticks
+
+    def _physics_tick(self, controls: np.ndarray, kick: bool = True):
+        """Drain stamina, apply one tick of player controls and advance physics by 1/60s."""
+        # Kicks are checked against the positions the tick starts from
+        spatial = self.spatial_context() if kick and (controls[:, 2] > 0.5).any() else None
         self.state.tick += 1
         self._step_count += 1
+
+        arrays = self.state.arrays
+        dash = controls[:, 3] > 0.5
+
+        # Stamina drain, for the whole squad at once
+        drain = 0.01 + np.linalg.norm(controls[:, 0:2], axis=1).astype(np.float64) * 0.05
+        drain[dash] += 0.5
+        np.maximum(0.0, arrays.stamina - drain, out=arrays.stamina)
+
+        # Apply force if stamina remains
+        active = arrays.stamina > 1.0
+        self.physics.apply_actions(controls[:, 0:2], dash, active)
+        if kick:
+            kickers = np.flatnonzero(active & (controls[:, 2] > 0.5))
+        else:
+            kickers = ()
+        for i in kickers:
+            player = self.state.players[i]
+            force = (controls[i, 0], controls[i, 1])
+            if self.rules.check_interaction(player.pos, self.state.ball.pos, spatial, i):
+                self.physics.apply_ball_impulse(force)
+                event_type = "SHOT" if np.linalg.norm(force) > 0.8 else "PASS"
+                self.state.events.append(MatchEvent(
+                    event_id=f"tick_{self.state.tick}_{player.id}",
+                    tick=self.state.tick,
+                    event_type=event_type,
+                    actor_id=player.id
+                ))
+                # Note: Simple pass detection (who touched before?)
+                # In full sim, this would use possession_player_id
+                if event_type == "PASS":
+                     self.analyst.record_pass(player.team, player.id, "unnamed_target")
         
-        # 1. Physics Engine integration
-        # Action is (28,) -> 7 players * [dx, dy, kick, dash]
-        # For simplicity in this env, we control all players
-        for i, player in enumerate(self.state.players):
-            base = i * 4
-            p_action = action[base:base+4]
-            force = (p_action[0], p_action[1])
-            kick = p_action[2] > 0.5
-            dash = p_action[3] > 0.5
-            
-            # Stamina drain
-            drain = 0.01 + (float(np.linalg.norm(force)) * 0.05)
-            if dash: drain += 0.5
-            player.stamina = max(0.0, player.stamina - drain)
-            
-            # Apply force if stamina remains
-            if player.stamina > 1.0:
-                self.physics.apply_action(player.id, force, dash=dash)
-                if kick:
-                    if self.rules.check_interaction(player.pos, self.state.ball.pos):
-                        self.physics.apply_ball_impulse(force)
-                        event_type = "SHOT" if np.linalg.norm(force) > 0.8 else "PASS"
-                        self.state.events.append(MatchEvent(
-                            event_id=f"tick_{self.state.tick}_{player.id}",
-                            tick=self.state.tick,
-                            event_type=event_type,
-                            actor_id=player.id
-                        ))
-                        # Note: Simple pass detection (who touched before?)
-                        # In full sim, this would use possession_player_id
-                        if event_type == "PASS":
-                             self.analyst.record_pass(player.team, player.id, "unnamed_target")
-        
+        self.abilities.update_columns(arrays.energy, arrays.heat)
+        self._ball_prev[:] = arrays.kinematics[0, 0:2]
         self.physics.step(1.0/60.0)
-        
-        # Sync state from physics
-        for player in self.state.players:
-            p, v = self.physics.get_player_data(player.id)
-            player.pos = p
-            player.vel = v
-            
-        bp, bv = self.physics.get_ball_data()
-        self.state.ball.pos = bp
-        self.state.ball.vel = bv
 
-        # 2. Tactical Analysis
-        tactical_data = self.analyst.analyze_tick(self.state)
-        self.state.pressure_index = tactical_data['pressure_index']
-        
-        # 3. Reward calculation
-        reward = self.reward_engine.calculate(self.state, self.state.events, TeamID.BLUE)
-        
-        # Apply degenerate penalty
-        if tactical_data['degenerate_score'] > 0.8:
-            reward -= 0.1 # Penalty for carousel possession
-
-        goal_team = self.rules.check_goal(self.state.ball.pos)
-        terminated = goal_team is not None
-        if goal_team is TeamID.BLUE:
-            self.state.score[TeamID.BLUE] += 1
-            reward += self.reward_engine.cfg['sparse']['goal_scored']
-        elif goal_team is TeamID.RED:
-            self.state.score[TeamID.RED] += 1
-            reward += self.reward_engine.cfg['sparse']['goal_conceded']
-
-        truncated = self._step_count >= self.max_steps
-
-        # Clear events for next tick to avoid double counting
-        self.state.events = []
+        # Fouls from this step's player contacts, judged on the pre-step kinematics
+        if self.physics.contacts.count:
+            kin = arrays.kinematics[1:]
+            self.state.events += self.referee.process_contacts(
+                *self.physics.contacts.view(), self.state.tick, kin[:, 2:4], kin[:, 0:2]
+            )
 
-        return self._build_observation(), reward, bool(terminated), bool(truncated), {}
+        # Sync state from physics (players and ball are views into the arrays)
+        self.physics.read_state(arrays.kinematics)
 
     def _calculate_basic_reward(self) -> float:
         # Distance to goal reward
@@ -180,8 +383,12 @@ class NeonFootballEnv(gym.Env[np.ndarray, np.ndarray]):
 
         return obs
 
-    def _build_observation(self) -> np.ndarray:
-        obs = np.zeros(64, dtype=np.float32)
+    def _build_observation(self, out: np.ndarray | None = None) -> np.ndarray:
+        if out is None:
+            obs = np.zeros(64, dtype=np.float32)
+        else:
+            obs = out
+            obs[:] = 0.0
         # 1. Ball (4)
         obs[0:2] = self.state.ball.pos / 600.0
         obs[2:4] = self.state.ball.vel / 20.0
@@ -189,21 +396,36 @@ class NeonFootballEnv(gym.Env[np.ndarray, np.ndarray]):
         # 2. Players (Reduced set to fit 60 remaining slots)
         # Each player: pos(2), team_code(1), role_encoded(1) = 4 values
         # We can fit 15 players (all 14)
-        cursor = 4
-        for i, player in enumerate(self.state.players):
-            if i >= 14: break
-            obs[cursor:cursor+2] = player.pos / 600.0
-            obs[cursor+2] = 0.1 if player.team == TeamID.BLUE else 0.9
-            # Role encoding: GK=0.1, DEF=0.3, MID=0.5, FWD=0.7
-            role_map = {"GK": 0.1, "DEF": 0.3, "MID": 0.5, "FWD": 0.7}
-            obs[cursor+3] = role_map.get(player.role.name[:3], 0.5)
-            cursor += 4
+        cols = self.state.columns()
+        n = min(cols.num_players, 14)
+        block = obs[4:4 + 4 * n].reshape(n, 4)
+        block[:, 0:2] = cols.pos[:n] / 600.0
+        block[:, 2] = np.where(cols.team[:n] == TeamID.BLUE.value, 0.1, 0.9)
+        # Role encoding: GK=0.1, DEF=0.3, MID=0.5, FWD=0.7
+        block[:, 3] = _ROLE_OBS[cols.role[:n]]
             
         return obs
 
+    def tactical_analysis(self) -> dict[str, Any]:
+        """Analyst output for the current tick; the analyst itself runs once per tick."""
+        return self.metrics.get(
+            "analyst",
+            self.state.tick,
+            lambda: self.analyst.analyze_tick(self.state, self.spatial_context()),
+        )
+
+    def spatial_context(self) -> SpatialContext:
+        """Distances, nearest neighbours and ball-owner candidates for the current tick."""
+        return self.metrics.get(
+            "spatial",
+            self.state.tick,
+            lambda: SpatialContext.from_state(self.state, self.rules.interaction_radius),
+        )
+
     def get_telemetry_frame(self) -> dict:
         """Returns a v2.2.0 compatible telemetry frame."""
-        analyst_data = self.analyst.analyze_tick(self.state)
+        analyst_data = self.tactical_analysis()
+        owner = self.spatial_context().owner
         
         frame = {
             "v": "2.2.0",
@@ -216,19 +438,32 @@ class NeonFootballEnv(gym.Env[np.ndarray, np.ndarray]):
             "p": [],
             "pressure": float(analyst_data['pressure_index']),
             "compactness": {k.name: float(v) for k, v in analyst_data['compactness'].items()},
+            "poss": None if owner < 0 else self.state.arrays.ids[owner],
+            # What this tick's reward saw, so tools/relabel_rewards.py can reproduce it
+            "possession": -1 if self.state.possession_team is None
+            else self.state.possession_team.value,
+            "degenerate": float(analyst_data['degenerate_score']),
             "o": {
                 "attn": [] # Attention map to be filled if available
             }
         }
         
-        for p in self.state.players:
+        cols = self.state.columns()
+        for pid, team, pos, vel, st, en in zip(
+            cols.ids,
+            cols.team.tolist(),
+            cols.pos.tolist(),
+            cols.vel.tolist(),
+            cols.stamina.tolist(),
+            cols.energy.tolist(),
+        ):
             frame["p"].append({
-                "id": p.id,
-                "team": 0 if p.team == TeamID.BLUE else 1,
-                "pos": [float(p.pos[0]), float(p.pos[1])],
-                "vel": [float(p.vel[0]), float(p.vel[1])],
-                "st": float(p.stamina),
-                "en": float(p.energy)
+                "id": pid,
+                "team": 0 if team == TeamID.BLUE.value else 1,
+                "pos": pos,
+                "vel": vel,
+                "st": st,
+                "en": en
             })
             
         return frame
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import os
+from typing import Any
+
+import numpy as np
+
+from ai.env import vec_rules
+from ai.env.shared_arrays import SharedArrays
+from ai.env.worker_pool import worker_context
+from ai.training.reward_engine import RewardEngine
+from configs.compiler import ConfigStore
+
+# Flat [N, ...] buffers shared by the trainer and every worker: name -> (per-env shape, dtype)
+_LAYOUT = {
+    "pos": ((15, 2), np.float32),
+    "vel": ((15, 2), np.float32),
+    "actions": ((14, 2), np.float32),
+    "obs": ((vec_rules.OBS_DIM,), np.float32),
+    "rewards": ((), np.float32),
+    "terminated": ((), np.bool_),
+    "truncated": ((), np.bool_),
+    "episode_return": ((), np.float32),
+    "episode_length": ((), np.int64),
+    "final_return": ((), np.float32),
+    "final_length": ((), np.int64),
+    "goal_fraction": ((), np.float32),
+}
+
+
+def _shard_worker(conn, shm_name, num_envs, lo, hi, seed, config):
+    """Worker loop: owns envs [lo, hi) of the shared buffers and steps them on command."""
+    from sim.ultra.vectorized_phys import VectorizedNeonPhysics
+
+    shared = SharedArrays(_LAYOUT, num_envs, shm_name)
+    v = {key: arr[lo:hi] for key, arr in shared.views.items()}
+    phys = VectorizedNeonPhysics(
+        hi - lo, friction=config["friction"], backend="numpy", seed=seed
+    )
+    # The engine steps in place, so pointing it at the shared slices publishes every tick
+    phys.pos, phys.vel = v["pos"], v["vel"]
+    goal_line = phys.bounds[0, 0]
+    mouth = vec_rules.goal_half_width(phys.field_height)
+    width, height = phys.field_width, phys.field_height
+    forces = np.empty_like(v["actions"])
+    event_counts = np.zeros((hi - lo, 4))  # EVENT_COLUMNS
+
+    try:
+        while True:
+            cmd = conn.recv()
+            if cmd == "step":
+                np.clip(v["actions"], -1.0, 1.0, out=forces)
+                np.multiply(forces, config["action_scale"], out=forces)
+                phys.step(forces)
+                v["episode_length"] += 1
+
+                blue_goal, red_goal, fraction = vec_rules.swept_goal_masks(
+                    phys.ball_path[:, 0], phys.ball_path[:, 1], goal_line, mouth
+                )
+                v["goal_fraction"][:] = fraction
+                v["rewards"][:] = vec_rules.shaped_rewards(
+                    config["reward_engine"], phys.pos[:, 0], blue_goal, red_goal, width,
+                    event_counts,
+                )
+                v["episode_return"] += v["rewards"]
+                np.logical_or(blue_goal, red_goal, out=v["terminated"])
+                np.greater_equal(v["episode_length"], config["max_steps"], out=v["truncated"])
+                v["truncated"] &= ~v["terminated"]
+
+                done = np.flatnonzero(v["terminated"] | v["truncated"])
+                if done.size:
+                    v["final_return"][done] = v["episode_return"][done]
+                    v["final_length"][done] = v["episode_length"][done]
+                    phys.reset(done)
+                    v["episode_return"][done] = 0.0
+                    v["episode_length"][done] = 0
+                vec_rules.write_observation(v["obs"], phys.pos, phys.vel, width, height)
+            elif cmd == "reset":
+                phys.reset()
+                v["episode_return"][:] = 0.0
+                v["episode_length"][:] = 0
+                vec_rules.write_observation(v["obs"], phys.pos, phys.vel, width, height)
+            elif isinstance(cmd, tuple) and cmd[0] == "load_table":
+                config["reward_engine"].load_table(cmd[1])
+            elif cmd == "close":
+                break
+            conn.send(True)
+    finally:
+        v = {}
+        phys.pos = phys.vel = None
+        shared.close()
+        conn.close()
+
+
+class ShardedVectorizedEnv:
+    """
+    N vectorized matches split across worker processes that step in lockstep.
+    Positions, velocities, actions, observations, rewards and episode stats live in
+    one shared-memory block, so the trainer reads flat [N, ...] arrays without copies.
+    Workers run the NumPy physics backend and never import torch.
+    """
+
+    obs_dim = vec_rules.OBS_DIM
+
+    def __init__(
+        self,
+        num_envs: int = 1024,
+        num_workers: int | None = None,
+        max_steps: int = 600,
+        season: str | None = None,
+        profile: str = "baseline",
+        seed: int = 0,
+        calibration: dict[str, float] | None = None,
+        start_method: str | None = None,
+    ):
+        self.num_envs = num_envs
+        self.num_workers = max(1, min(num_workers or os.cpu_count() or 1, num_envs))
+        self.max_steps = max_steps
+
+        # Workers get the compiled table inside their RewardEngine; reload_config() resends it
+        self.config_store = ConfigStore.shared(season)
+        self.config_table = self.config_store.table
+        config = {
+            "reward_engine": RewardEngine(
+                profile=profile, pitch_width=60.0, table=self.config_table
+            ),
+            "max_steps": max_steps,
+            "friction": 0.98,
+            "action_scale": vec_rules.default_action_scale(60.0),
+        }
+        if calibration is not None:
+            # Fitted against PhysicsEngine by tools/physics_parity.py
+            config["friction"] = calibration["friction"]
+            config["action_scale"] = calibration["action_scale"]
+
+        self._shared = SharedArrays(_LAYOUT, num_envs)
+        for key, arr in self._shared.views.items():
+            setattr(self, key, arr)
+
+        ctx = worker_context(start_method)
+        bounds = np.linspace(0, num_envs, self.num_workers + 1).astype(int)
+        seeds = np.random.SeedSequence(seed).spawn(self.num_workers)
+        self._conns = []
+        self._procs = []
+        for rank in range(self.num_workers):
+            parent, child = ctx.Pipe()
+            proc = ctx.Process(
+                target=_shard_worker,
+                args=(child, self._shared.name, num_envs, bounds[rank], bounds[rank + 1],
+                      seeds[rank], config),
+                daemon=True,
+            )
+            proc.start()
+            child.close()
+            self._conns.append(parent)
+            self._procs.append(proc)
+        self.shards = list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+
+    def _broadcast(self, cmd: Any):
+        for conn in self._conns:
+            conn.send(cmd)
+        for conn in self._conns:
+            conn.recv()
+
+    def reload_config(self) -> bool:
+        """
+        Re-check the config sources and, if they changed, send every worker the new
+        table. Call between steps; returns whether a new table was applied.
+        """
+        table = self.config_store.refresh()
+        if table is self.config_table:
+            return False
+        self.config_table = table
+        self._broadcast(("load_table", table))
+        return True
+
+    def reset(self) -> tuple[np.ndarray, dict[str, Any]]:
+        """Reset every env; returns the shared [N, obs_dim] observation array."""
+        self._broadcast("reset")
+        return self.obs, {}
+
+    def step(
+        self, actions: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict[str, Any]]:
+        """
+        actions: [N, 14, 2] normalized forces, copied into the shared action buffer
+        (pass None after writing self.actions directly). All returned arrays are shared
+        views that the next step() overwrites. Finished envs are already reset; their
+        episode return/length are in info["final_return"]/info["final_length"], and
+        info["goal_fraction"] is when in the tick the ball reached a goal line.
+        """
+        if actions is not None:
+            np.copyto(self.actions, actions, casting="same_kind")
+        self._broadcast("step")
+        info = {
+            "final_return": self.final_return,
+            "final_length": self.final_length,
+            "goal_fraction": self.goal_fraction,
+        }
+        return self.obs, self.rewards, self.terminated, self.truncated, info
+
+    def close(self):
+        if not self._procs:
+            return
+        for conn in self._conns:
+            try:
+                conn.send("close")
+            except (BrokenPipeError, OSError):
+                pass
+        for proc in self._procs:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+        for conn in self._conns:
+            conn.close()
+        self._procs = []
+        self._conns = []
+        for key in self._shared.views:
+            setattr(self, key, None)
+        self._shared.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
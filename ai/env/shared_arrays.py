@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from multiprocessing import shared_memory
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+Layout = Dict[str, Tuple[Tuple[int, ...], Any]]
+
+
+class SharedArrays:
+    """One SharedMemory block carved into named [N, ...] NumPy views."""
+
+    def __init__(self, layout: Layout, num_envs: int, name: str | None = None):
+        """layout maps buffer name -> (per-env shape, dtype); name attaches to an existing block."""
+        offsets = {}
+        size = 0
+        for key, (shape, dtype) in layout.items():
+            dtype = np.dtype(dtype)
+            size = -(-size // dtype.alignment) * dtype.alignment
+            offsets[key] = size
+            size += num_envs * int(np.prod(shape, dtype=np.int64)) * dtype.itemsize
+
+        self.owner = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=self.owner, size=max(size, 1))
+        self.name = self.shm.name
+        self.views = {
+            key: np.ndarray(
+                (num_envs, *shape), dtype=dtype, buffer=self.shm.buf, offset=offsets[key]
+            )
+            for key, (shape, dtype) in layout.items()
+        }
+
+    def close(self):
+        self.views = {}
+        try:
+            self.shm.close()
+        except BufferError:
+            pass  # caller still holds views; the mapping goes away with them
+        if self.owner:
+            self.shm.unlink()
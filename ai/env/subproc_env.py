@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import traceback
+from typing import Any
+
+import numpy as np
+
+from ai.env.shared_arrays import SharedArrays
+from ai.env.worker_pool import worker_context
+from configs.compiler import ConfigStore
+
+OBS_SIZE = 64
+ACTION_SIZE = 56
+
+# Shared [N, ...] buffers: name -> (per-env shape, dtype)
+_LAYOUT = {
+    "obs": ((OBS_SIZE,), np.float32),
+    "actions": ((ACTION_SIZE,), np.float32),
+    "rewards": ((), np.float64),
+    "terminated": ((), np.bool_),
+    "truncated": ((), np.bool_),
+    "final_obs": ((OBS_SIZE,), np.float32),
+    "ticks": ((), np.int64),
+}
+
+
+def _env_worker(conn, shm_name, num_envs, lo, hi, seed_seq, config, table):
+    """Worker loop: hosts NeonFootballEnv instances [lo, hi) and serves pipe commands."""
+    from ai.env.neon_env import NeonFootballEnv
+
+    # The parent's compiled config becomes this process's shared store
+    ConfigStore.adopt(table)
+
+    shared = SharedArrays(_LAYOUT, num_envs, shm_name)
+    v = {key: arr[lo:hi] for key, arr in shared.views.items()}
+    rng = np.random.default_rng(seed_seq)
+    envs = [NeonFootballEnv(dict(config)) for _ in range(hi - lo)]
+
+    def episode_seed() -> int:
+        return int(rng.integers(2**31 - 1))
+
+    try:
+        while True:
+            cmd = conn.recv()
+            try:
+                if cmd == "step":
+                    obs, actions = v["obs"], v["actions"]
+                    for i, env in enumerate(envs):
+                        ob, reward, terminated, truncated, info = env.step(actions[i])
+                        v["rewards"][i] = reward
+                        v["terminated"][i] = terminated
+                        v["truncated"][i] = truncated
+                        v["ticks"][i] = info["ticks"]
+                        if terminated or truncated:
+                            v["final_obs"][i] = ob
+                            ob, _ = env.reset(seed=episode_seed())
+                        obs[i] = ob
+                elif cmd == "reset":
+                    for i, env in enumerate(envs):
+                        v["obs"][i], _ = env.reset(seed=episode_seed())
+                elif cmd == "close":
+                    break
+                conn.send(None)
+            except Exception:
+                conn.send(traceback.format_exc())
+    finally:
+        v = {}
+        shared.close()
+        conn.close()
+
+
+class NeonSubprocVecEnv:
+    """
+    Vector env running NeonFootballEnv copies in worker processes.
+    Observations (64 floats), actions (56 floats), rewards and done flags live in
+    shared memory; the pipes only carry one-word commands. Each worker draws its
+    episode seeds from its own stream of one base SeedSequence, and finished envs
+    reset themselves (the last observation is kept in info["final_obs"]).
+    Workers are forked from a preloaded forkserver by default (see worker_context)
+    and reuse the config table compiled here.
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        config: dict[str, Any] | None = None,
+        seed: int = 0,
+        envs_per_worker: int = 1,
+        start_method: str | None = None,
+    ):
+        self.num_envs = num_envs
+        self.config = dict(config or {})
+        self._shared = SharedArrays(_LAYOUT, num_envs)
+        for key, arr in self._shared.views.items():
+            setattr(self, key, arr)
+
+        num_workers = -(-num_envs // max(1, envs_per_worker))
+        bounds = np.linspace(0, num_envs, num_workers + 1).astype(int)
+        seeds = np.random.SeedSequence(seed).spawn(num_workers)
+        table = ConfigStore.shared(self.config.get("season")).table
+        ctx = worker_context(start_method)
+        self._conns = []
+        self._procs = []
+        for rank in range(num_workers):
+            parent, child = ctx.Pipe()
+            proc = ctx.Process(
+                target=_env_worker,
+                args=(child, self._shared.name, num_envs, bounds[rank], bounds[rank + 1],
+                      seeds[rank], self.config, table),
+                daemon=True,
+            )
+            proc.start()
+            child.close()
+            self._conns.append(parent)
+            self._procs.append(proc)
+        self.num_workers = num_workers
+
+    def _broadcast(self, cmd: str):
+        for conn in self._conns:
+            conn.send(cmd)
+        errors = [err for err in (conn.recv() for conn in self._conns) if err is not None]
+        if errors:
+            raise RuntimeError(f"NeonSubprocVecEnv worker failed:\n{errors[0]}")
+
+    def reset(self) -> tuple[np.ndarray, dict[str, Any]]:
+        """Reset every env; returns the shared [N, 64] observation array."""
+        self._broadcast("reset")
+        return self.obs, {}
+
+    def step(
+        self, actions: np.ndarray | None = None
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict[str, Any]]:
+        """
+        actions: [N, 56], copied into the shared action buffer (pass None after writing
+        self.actions directly). Returned arrays are shared views overwritten by the next step().
+        """
+        if actions is not None:
+            np.copyto(self.actions, actions, casting="same_kind")
+        self._broadcast("step")
+        info = {"final_obs": self.final_obs, "ticks": self.ticks}
+        return self.obs, self.rewards, self.terminated, self.truncated, info
+
+    def close(self):
+        if not self._procs:
+            return
+        for conn in self._conns:
+            try:
+                conn.send("close")
+            except (BrokenPipeError, OSError):
+                pass
+        for proc in self._procs:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+        for conn in self._conns:
+            conn.close()
+        self._procs = []
+        self._conns = []
+        for key in self._shared.views:
+            setattr(self, key, None)
+        self._shared.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+
+class TickCache:
+    """
+    Derived match metrics memoized for the current tick.
+    The first get() of a key in a tick computes it; later readers in the same tick
+    (reward, telemetry, observation) share the value. Moving to another tick drops
+    everything. Reset and restore can land on an already-seen tick number with a
+    different match state, so callers must invalidate() explicitly there.
+    """
+
+    def __init__(self):
+        self.tick: int | None = None
+        self._values: dict[str, Any] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, tick: int, compute: Callable[[], Any]) -> Any:
+        if tick != self.tick:
+            self._values.clear()
+            self.tick = tick
+        if key in self._values:
+            self.hits += 1
+            return self._values[key]
+        self.misses += 1
+        value = self._values[key] = compute()
+        return value
+
+    def invalidate(self):
+        self._values.clear()
+        self.tick = None
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from typing import Any
+
+import torch
+
+from ai.env import vec_rules
+from ai.training.reward_engine import RewardEngine
+from configs.compiler import ConfigStore
+from sim.ultra.vectorized_phys import VectorizedNeonPhysics
+
+
+class UltraVectorizedEnv:
+    """
+    Batched Neon Gridiron environment on top of VectorizedNeonPhysics.
+    N matches live in one set of tensors; observations, rewards, goals, auto-reset
+    and episode statistics are all computed batched on the physics device.
+
+    Field coordinates are centred on the kickoff spot: BLUE attacks +x, RED attacks -x.
+    """
+
+    obs_dim = vec_rules.OBS_DIM
+
+    def __init__(
+        self,
+        num_envs: int = 1024,
+        device: str = "cuda",
+        max_steps: int = 600,
+        season: str | None = None,
+        profile: str = "baseline",
+        seed: int | None = None,
+        calibration: dict[str, float] | None = None,
+    ):
+        # Kickoff jitter draws from the physics' own generator, not the global torch RNG
+        self.phys = VectorizedNeonPhysics(num_envs, device, seed=seed)
+        self.device = self.phys.device
+        self.num_envs = num_envs
+        self.max_steps = max_steps
+
+        # Compiled config (configs/compiler.py); reload_config() swaps in edited configs
+        self.config_store = ConfigStore.shared(season)
+        self.config_table = self.config_store.table
+        self.reward_engine = RewardEngine(
+            profile=profile, pitch_width=self.phys.field_width, table=self.config_table
+        )
+
+        self.goal_half_width = vec_rules.goal_half_width(self.phys.field_height)
+        self.action_scale = vec_rules.default_action_scale(self.phys.field_width)
+        if calibration is not None:
+            # Fitted against PhysicsEngine by tools/physics_parity.py
+            self.phys.friction = calibration["friction"]
+            self.action_scale = calibration["action_scale"]
+
+        n = num_envs
+        self.obs = torch.zeros((n, self.obs_dim), device=self.device)
+        self.event_counts = torch.zeros((n, 4), device=self.device)  # EVENT_COLUMNS
+        self.score = torch.zeros((n, 2), dtype=torch.int64, device=self.device)
+        self.episode_length = torch.zeros(n, dtype=torch.int64, device=self.device)
+        self.episode_return = torch.zeros(n, device=self.device)
+        self.episodes_completed = 0
+        self.completed_length_sum = 0
+        self.goals_scored = torch.zeros(2, dtype=torch.int64, device=self.device)
+
+    def reload_config(self) -> bool:
+        """
+        Re-check the config sources and hot-swap the reward weights if they changed.
+        Call between episodes; returns whether a new table was applied.
+        """
+        table = self.config_store.refresh()
+        if table is self.config_table:
+            return False
+        self.config_table = table
+        self.reward_engine.load_table(table)
+        return True
+
+    def reset(self) -> tuple[torch.Tensor, dict[str, Any]]:
+        """Reset every env; returns the [N, obs_dim] observation."""
+        self.phys.reset()
+        self.score.zero_()
+        self.episode_length.zero_()
+        self.episode_return.zero_()
+        return self._build_observation(), {}
+
+    def step(
+        self, actions: torch.Tensor
+    ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, dict[str, Any]]:
+        """
+        actions: [N, 14, 2] normalized player forces in [-1, 1].
+        Finished envs are reset in place; their last observation is in info["final_obs"]
+        and their episode return/length in info["episode_return"]/info["episode_length"]
+        (valid where info["done"] is set). info["goal_fraction"] is when in the tick the
+        ball reached a goal line (swept, so fast shots are not missed).
+        """
+        phys = self.phys
+        phys.step(actions.clamp(-1.0, 1.0) * self.action_scale)
+        self.episode_length += 1
+
+        blue_goal, red_goal, goal_fraction = vec_rules.swept_goal_masks(
+            phys.ball_path[:, 0], phys.ball_path[:, 1], phys.bounds[0, 0], self.goal_half_width
+        )
+        rewards = vec_rules.shaped_rewards(
+            self.reward_engine, phys.pos[:, 0], blue_goal, red_goal, phys.field_width,
+            self.event_counts,
+        )
+        self.episode_return += rewards
+        self.score[:, 0] += blue_goal
+        self.score[:, 1] += red_goal
+
+        terminated = blue_goal | red_goal
+        truncated = ~terminated & (self.episode_length >= self.max_steps)
+        done = terminated | truncated
+
+        obs = self._build_observation()
+        info: dict[str, Any] = {"done": done, "goal_fraction": goal_fraction}
+        if done.any():
+            info["final_obs"] = obs.clone()
+            info["episode_return"] = self.episode_return.clone()
+            info["episode_length"] = self.episode_length.clone()
+            info["final_score"] = self.score.clone()
+            self.goals_scored[0] += blue_goal.sum()
+            self.goals_scored[1] += red_goal.sum()
+
+            idx = done.nonzero().squeeze(1)
+            self.episodes_completed += len(idx)
+            self.completed_length_sum += int(self.episode_length[idx].sum())
+            phys.reset(idx)
+            self.score[idx] = 0
+            self.episode_length[idx] = 0
+            self.episode_return[idx] = 0.0
+            obs = self._build_observation()
+
+        return obs, rewards, terminated, truncated, info
+
+    def _build_observation(self) -> torch.Tensor:
+        """[N, obs_dim]: ball pos, ball vel, then per player pos and vel (normalized)."""
+        phys = self.phys
+        return vec_rules.write_observation(
+            self.obs, phys.pos, phys.vel, phys.field_width, phys.field_height
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Aggregate statistics of the episodes completed since construction."""
+        completed = max(self.episodes_completed, 1)
+        return {
+            "episodes": self.episodes_completed,
+            "goals_blue": int(self.goals_scored[0]),
+            "goals_red": int(self.goals_scored[1]),
+            "mean_episode_length": self.completed_length_sum / completed,
+        }
@@ -0,0 +1,80 @@
+"""
+Batched match rules shared by the vectorized environments.
+
+Every function only uses arithmetic, comparisons and slicing, so it runs unchanged
+on torch tensors (UltraVectorizedEnv) and NumPy arrays (ShardedVectorizedEnv workers).
+Coordinates follow VectorizedNeonPhysics: centred pitch, BLUE attacks +x.
+"""
+
+OBS_DIM = 4 + 14 * 4  # ball pos/vel + 14 players pos/vel
+VEL_SCALE = 20.0
+
+
+def goal_half_width(field_height: float) -> float:
+    """Same proportions as RulesEngine on the 600x400 pitch: an 80px goal mouth."""
+    return field_height * (80.0 / 400.0) / 2
+
+
+def default_action_scale(field_width: float) -> float:
+    """Same push as PhysicsEngine.apply_action (2000 N on a 70 kg player), in pitch units."""
+    return 2000.0 / 70.0 * (field_width / 600.0)
+
+
+def swept_goal_masks(start, end, goal_line, mouth_half_width):
+    """
+    Swept goal check over each ball's path this tick, start -> end ([N, 2] centred).
+    A goal counts where the path crosses x = +-goal_line inside the mouth, however far
+    past the line the tick carried the ball; a ball already on the line scores when it
+    ends inside the mouth. Returns BLUE/RED masks and the fraction of the tick at
+    which the ball reached the line (1.0 where it did not cross).
+    """
+    x0, y0, x1, y1 = start[:, 0], start[:, 1], end[:, 0], end[:, 1]
+    dx, dy = x1 - x0, y1 - y0
+    dx_safe = dx + (dx == 0)  # no crossing where the ball did not move along x
+    t_blue = (goal_line - x0) / dx_safe
+    t_red = (-goal_line - x0) / dx_safe
+    blue_cross = (x0 < goal_line) & (x1 >= goal_line)
+    red_cross = (x0 > -goal_line) & (x1 <= -goal_line)
+    end_in_mouth = abs(y1) < mouth_half_width
+
+    blue_goal = (blue_cross & (abs(y0 + t_blue * dy) < mouth_half_width)) | (
+        (x0 >= goal_line) & (x1 >= goal_line) & end_in_mouth
+    )
+    red_goal = (red_cross & (abs(y0 + t_red * dy) < mouth_half_width)) | (
+        (x0 <= -goal_line) & (x1 <= -goal_line) & end_in_mouth
+    )
+    fraction = 1.0 + blue_cross * (t_blue - 1.0) + red_cross * (t_red - 1.0)
+    return blue_goal, red_goal, fraction
+
+
+def shaped_rewards(
+    reward_engine, ball_pos, blue_goal, red_goal, field_width: float, event_counts
+):
+    """
+    BLUE-perspective rewards from RewardEngine.calculate_batch (built with
+    pitch_width=field_width). event_counts is a preallocated [N, 4] buffer in
+    EVENT_COLUMNS order; the goals are written into its GOAL_FOR/GOAL_AGAINST columns.
+    """
+    event_counts[:, 2] = blue_goal
+    event_counts[:, 3] = red_goal
+    # RewardEngine measures x from the BLUE goal line; a uniform shift keeps distances
+    rewards, _ = reward_engine.calculate_batch(
+        ball_pos + field_width / 2, event_counts=event_counts
+    )
+    return rewards
+
+
+def write_observation(obs, pos, vel, field_width: float, field_height: float):
+    """
+    Fill [N, OBS_DIM] obs in place: ball pos, ball vel, then per player pos and vel.
+    Positions are normalized by the half extents, velocities by VEL_SCALE.
+    """
+    half_w, half_h = field_width / 2, field_height / 2
+    obs[:, 0] = pos[:, 0, 0] / half_w
+    obs[:, 1] = pos[:, 0, 1] / half_h
+    obs[:, 2:4] = vel[:, 0] / VEL_SCALE
+    obs[:, 4::4] = pos[:, 1:, 0] / half_w
+    obs[:, 5::4] = pos[:, 1:, 1] / half_h
+    obs[:, 6::4] = vel[:, 1:, 0] / VEL_SCALE
+    obs[:, 7::4] = vel[:, 1:, 1] / VEL_SCALE
+    return obs
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import multiprocessing as mp
+
+# Imported once by the forkserver; every worker forked from it starts with these loaded
+WORKER_PRELOAD = (
+    "numpy",
+    "ai.env.neon_env",
+    "ai.env.shared_arrays",
+    "ai.env.vec_rules",
+    "ai.explainability.tactical_analyst",
+    "ai.training.reward_engine",
+    "configs.compiler",
+    "sim.core.abilities",
+    "sim.core.physics",
+    "sim.core.referee",
+    "sim.ultra.vectorized_phys",
+)
+
+
+def worker_context(start_method: str | None = None):
+    """
+    multiprocessing context for env worker processes.
+    Defaults to forkserver where the platform has it: one server process imports
+    WORKER_PRELOAD (gymnasium, pymunk, the rules) the first time a worker is needed,
+    and every later worker of this process - across vec envs - is forked from it.
+    Workers therefore start warm and never inherit the parent's torch/CUDA state.
+    Parsed configs are not re-read by workers; vec envs pass them the compiled
+    ConfigTable (see ConfigStore.adopt).
+    """
+    if start_method is None and "forkserver" in mp.get_all_start_methods():
+        start_method = "forkserver"
+    ctx = mp.get_context(start_method)
+    if start_method == "forkserver":
+        # Only takes effect before the server starts, so the list is fixed per process
+        ctx.set_forkserver_preload(list(WORKER_PRELOAD))
+    return ctx
@@ -0,0 +1,160 @@
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+from sim.core.state import TeamID
+
+# Pixel thresholds on the 600x400 pitch; pass scale=field_width/600 for other pitches
+COMPACTNESS_SPREAD = 150.0
+PRESSURE_RADIUS = 80.0
+TEAMS = (TeamID.BLUE, TeamID.RED)
+
+
+def batch_compactness(positions: np.ndarray, team: np.ndarray, scale: float = 1.0) -> np.ndarray:
+    """
+    [N, P, 2] positions and [P] or [N, P] team codes -> [N, 2] compactness (BLUE, RED).
+    1.0 = every player on the team centroid, 0.0 = average spread >= 150px; 0.0 for empty teams.
+    """
+    out = np.zeros((len(positions), len(TEAMS)))
+    team = np.broadcast_to(team, positions.shape[:2])
+    for k, code in enumerate(TEAMS):
+        mask = team == code.value
+        count = mask.sum(1)
+        weights = mask[..., None]
+        centroid = (positions * weights).sum(1) / np.maximum(count, 1)[:, None]
+        dists = np.linalg.norm(positions - centroid[:, None], axis=2)
+        avg_dist = (dists * mask).sum(1) / np.maximum(count, 1)
+        compact = np.clip(1.0 - avg_dist / (COMPACTNESS_SPREAD * scale), 0.0, 1.0)
+        out[:, k] = np.where(count > 0, compact, 0.0)
+    return out
+
+
+def batch_pressure(
+    positions: np.ndarray,
+    team: np.ndarray,
+    carrier: np.ndarray,
+    scale: float = 1.0,
+    dists: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    [N] pressure on the ball carrier: mean of (1 - d/80px) over opponents within 80px.
+    carrier is an [N, P] one-hot mask (all False when nobody has the ball); dists are
+    optional precomputed [N, P] distances from the carrier (a SpatialContext row).
+    """
+    team = np.broadcast_to(team, positions.shape[:2])
+    radius = PRESSURE_RADIUS * scale
+    has_carrier = carrier.any(1)
+    carrier_team = (team * carrier).sum(1)
+    opponents = (team != carrier_team[:, None]) & (team <= TeamID.RED.value) & has_carrier[:, None]
+
+    if dists is None:
+        carrier_pos = (positions * carrier[..., None]).sum(1)
+        dists = np.linalg.norm(positions - carrier_pos[:, None], axis=2)
+    nearby = opponents & (dists < radius)
+    count = nearby.sum(1)
+    total = ((1.0 - dists / radius) * nearby).sum(1)
+    return np.where(count > 0, total / np.maximum(count, 1), 0.0)
+
+
+class BatchTacticalAnalyst:
+    """
+    TacticalAnalyst for N matches at once: compactness, pressure and carousel
+    detection as [N]-shaped arrays. The possession windows are the batched
+    counterpart of RollingStats: one [N, team, capacity] ring buffer with running
+    Welford mean/M2 per window, updated with masked array ops each tick.
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        possession_windows: Sequence[int] = (300,),
+        carousel_std: float = 20.0,
+        scale: float = 1.0,
+    ):
+        self.num_envs = num_envs
+        self.windows = tuple(sorted({int(w) for w in possession_windows}))
+        self.capacity = self.windows[-1]
+        self.carousel_std = carousel_std * scale
+        self.scale = scale
+        self.values = np.zeros((num_envs, len(TEAMS), self.capacity))
+        self.count = np.zeros((num_envs, len(TEAMS)), dtype=np.int64)
+        self.mean = np.zeros((num_envs, len(TEAMS), len(self.windows)))
+        self.m2 = np.zeros_like(self.mean)
+
+    def reset(self, env_ids: Optional[np.ndarray] = None):
+        rows = slice(None) if env_ids is None else env_ids
+        self.count[rows] = 0
+        self.mean[rows] = 0.0
+        self.m2[rows] = 0.0
+
+    def analyze(
+        self,
+        positions: np.ndarray,
+        team: np.ndarray,
+        carrier: np.ndarray,
+        ball_x: np.ndarray,
+    ) -> Dict[str, Any]:
+        """
+        positions [N, P, 2], team [P] or [N, P] codes, carrier [N, P] one-hot possession
+        mask, ball_x [N]. Returns compactness [N, 2], pressure_index [N] and
+        degenerate_score [N] (1.0 while the team on the ball runs a carousel).
+        """
+        team = np.broadcast_to(team, positions.shape[:2])
+        possession = np.where(carrier.any(1), (team * carrier).sum(1), -1)
+        return {
+            "compactness": batch_compactness(positions, team, self.scale),
+            "pressure_index": batch_pressure(positions, team, carrier, self.scale),
+            "degenerate_score": self._detect_degenerate_possession(possession, ball_x),
+        }
+
+    def _detect_degenerate_possession(
+        self, possession: np.ndarray, ball_x: np.ndarray
+    ) -> np.ndarray:
+        score = np.zeros(self.num_envs)
+        rows = np.flatnonzero((possession == TeamID.BLUE.value) | (possession == TeamID.RED.value))
+        if rows.size == 0:
+            return score
+
+        # A turnover ends the other team's spell on the ball
+        held = possession[rows]
+        other = 1 - held
+        self.count[rows, other] = 0
+        self.mean[rows, other] = 0.0
+        self.m2[rows, other] = 0.0
+
+        x = ball_x[rows].astype(np.float64)
+        count = self.count[rows, held]
+        for j, w in enumerate(self.windows):
+            mean = self.mean[rows, held, j]
+            old = self.values[rows, held, (count - w) % self.capacity]
+            filling = count < w
+            # Welford add while the window fills, fused remove+add once it is full
+            added_mean = mean + (x - mean) / (count + 1)
+            slid_mean = mean + (x - old) / w
+            new_mean = np.where(filling, added_mean, slid_mean)
+            self.m2[rows, held, j] += np.where(
+                filling, (x - mean) * (x - added_mean), (x - old) * (x - slid_mean + old - mean)
+            )
+            self.mean[rows, held, j] = new_mean
+        self.values[rows, held, count % self.capacity] = x
+        count += 1
+        self.count[rows, held] = count
+
+        lapped = rows[count % self.capacity == 0]
+        for row in lapped:
+            self._resync(row, int(possession[row]))
+
+        flagged = np.zeros(rows.size, dtype=bool)
+        for j, w in enumerate(self.windows):
+            std = np.sqrt(np.maximum(self.m2[rows, held, j], 0.0) / w)
+            flagged |= (count >= w) & (std < self.carousel_std)
+        score[rows] = flagged
+        return score
+
+    def _resync(self, row: int, k: int):
+        count = self.count[row, k]
+        for j, w in enumerate(self.windows):
+            idx = np.arange(count - min(w, count), count) % self.capacity
+            window = self.values[row, k, idx]
+            self.mean[row, k, j] = window.mean()
+            self.m2[row, k, j] = np.square(window - window.mean()).sum()
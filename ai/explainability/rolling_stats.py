@@ -0,0 +1,84 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+
+class RollingStats:
+    """
+    Running mean/variance of the last `w` samples, for several window lengths at once.
+    Samples live in one fixed ring buffer sized for the longest window; every push
+    updates each window with a Welford add/remove step, so a tick costs O(windows).
+    The running sums are re-derived from the buffer once per lap to cancel drift.
+    """
+
+    def __init__(self, windows: Sequence[int] = (300,)):
+        self.windows = tuple(sorted({int(w) for w in windows}))
+        if not self.windows or self.windows[0] < 1:
+            raise ValueError(f"window lengths must be >= 1, got {windows}")
+        self.capacity = self.windows[-1]
+        self.values = np.zeros(self.capacity)
+        self.clear()
+
+    def clear(self):
+        self.count = 0  # samples pushed since the last clear
+        self.mean: List[float] = [0.0] * len(self.windows)
+        self.m2: List[float] = [0.0] * len(self.windows)
+
+    def push(self, x: float):
+        count, values = self.count, self.values
+        for j, w in enumerate(self.windows):
+            mean = self.mean[j]
+            if count < w:
+                # Welford add
+                delta = x - mean
+                mean += delta / (count + 1)
+                self.m2[j] += delta * (x - mean)
+            else:
+                # Welford remove of the oldest sample + add of x, fused
+                old = values[(count - w) % self.capacity]
+                new_mean = mean + (x - old) / w
+                self.m2[j] += (x - old) * (x - new_mean + old - mean)
+                mean = new_mean
+            self.mean[j] = mean
+        values[count % self.capacity] = x
+        self.count = count + 1
+        if self.count % self.capacity == 0:
+            self._resync()
+
+    def _resync(self):
+        for j, w in enumerate(self.windows):
+            window = self._window(w)
+            self.mean[j] = float(window.mean())
+            self.m2[j] = float(np.square(window - self.mean[j]).sum())
+
+    def _window(self, w: int) -> np.ndarray:
+        """The last min(w, count) samples, oldest first."""
+        n = min(w, self.count)
+        idx = np.arange(self.count - n, self.count) % self.capacity
+        return self.values[idx]
+
+    def full(self, j: int) -> bool:
+        return self.count >= self.windows[j]
+
+    def std(self, j: int) -> Optional[float]:
+        """Population std (np.std) of window j, or None until it has filled."""
+        if not self.full(j):
+            return None
+        return max(self.m2[j], 0.0) ** 0.5 / self.windows[j] ** 0.5
+
+    def get_state(self) -> Dict[str, Any]:
+        return {
+            "windows": list(self.windows),
+            "values": self.values.copy(),
+            "count": self.count,
+            "mean": list(self.mean),
+            "m2": list(self.m2),
+        }
+
+    def load_state(self, state: Dict[str, Any]):
+        if tuple(state["windows"]) != self.windows:
+            raise ValueError(f"window mismatch: {state['windows']} vs {list(self.windows)}")
+        self.values[:] = state["values"]
+        self.count = int(state["count"])
+        self.mean = list(state["mean"])
+        self.m2 = list(state["m2"])
@@ -1,20 +1,50 @@
 import numpy as np
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence
+from ai.explainability.batch_analyst import batch_compactness, batch_pressure
+from ai.explainability.rolling_stats import RollingStats
+from sim.core.spatial import SpatialContext
 from sim.core.state import MatchState, TeamID, PlayerRole
 
+# Carousel window of the env's analyst, in physics ticks (5 seconds at 60 Hz)
+POSSESSION_WINDOW_TICKS = 300
+
 class TacticalAnalyst:
     """
     Professional Match Analyst for Neon Gridiron.
     Computes compactness, pressure efficiency, and detects degenerate behaviors.
     """
-    def __init__(self):
+    def __init__(
+        self,
+        possession_windows: Sequence[int] = (POSSESSION_WINDOW_TICKS,),
+        carousel_std: float = 20.0,
+    ):
         self.pass_matrix = {TeamID.BLUE: {}, TeamID.RED: {}}
-        self.possession_buffer: List[float] = [] # Track X-progression to detect loops
+        # Ball-x history per team while it holds the ball; windows count analyze_tick()
+        # samples, which are ticks when it runs every tick (300 = 5 seconds)
+        self.possession_windows = {
+            TeamID.BLUE: RollingStats(possession_windows),
+            TeamID.RED: RollingStats(possession_windows),
+        }
+        self.carousel_std = carousel_std
+
+    def reset(self):
+        for window in self.possession_windows.values():
+            window.clear()
+
+    def get_state(self) -> Dict[str, Any]:
+        """Serializable detector state (used by env snapshots)."""
+        return {team.name: window.get_state() for team, window in self.possession_windows.items()}
+
+    def load_state(self, state: Dict[str, Any]):
+        for team, window in self.possession_windows.items():
+            window.load_state(state[team.name])
         
-    def analyze_tick(self, state: MatchState) -> Dict[str, Any]:
+    def analyze_tick(
+        self, state: MatchState, spatial: Optional[SpatialContext] = None
+    ) -> Dict[str, Any]:
         metrics = {
             "compactness": self._calc_compactness(state),
-            "pressure_index": self._calc_pressure(state),
+            "pressure_index": self._calc_pressure(state, spatial),
             "threat_map": self._generate_threat_data(state)
         }
         
@@ -25,51 +55,41 @@ class TacticalAnalyst:
 
     def _calc_compactness(self, state: MatchState) -> Dict[TeamID, float]:
         """Measure how close team players are to their centroid."""
-        results = {}
-        for team in [TeamID.BLUE, TeamID.RED]:
-            team_players = [p.pos for p in state.players if p.team == team]
-            if not team_players:
-                results[team] = 0.0
-                continue
-            
-            centroid = np.mean(team_players, axis=0)
-            avg_dist = np.mean([np.linalg.norm(p_pos - centroid) for p_pos in team_players])
-            # Lower avg_dist = higher compactness. Normalize 0-1 (1.0 = very compact)
-            results[team] = float(np.clip(1.0 - (avg_dist / 150.0), 0.0, 1.0))
-        return results
+        cols = state.columns()
+        compactness = batch_compactness(cols.pos[None], cols.team)[0]
+        return {TeamID.BLUE: float(compactness[0]), TeamID.RED: float(compactness[1])}
 
-    def _calc_pressure(self, state: MatchState) -> float:
+    def _calc_pressure(self, state: MatchState, spatial: Optional[SpatialContext] = None) -> float:
         """Measure intensity of pressure on the ball carrier."""
         if not state.possession_player_id:
             return 0.0
             
-        poss_player = next((p for p in state.players if p.id == state.possession_player_id), None)
-        if not poss_player: return 0.0
-        
-        opp_team = TeamID.RED if poss_player.team == TeamID.BLUE else TeamID.BLUE
-        opponents = [p for p in state.players if p.team == opp_team]
-        
-        dists = [np.linalg.norm(p.pos - poss_player.pos) for p in opponents]
-        nearby = [d for d in dists if d < 80.0]
-        if not nearby: return 0.0
-        
-        return float(np.mean([1.0 - (d / 80.0) for d in nearby]))
+        cols = state.columns()
+        idx = cols.index_of(state.possession_player_id)
+        if idx is None: return 0.0
+
+        carrier = np.zeros((1, len(cols.team)), dtype=bool)
+        carrier[0, idx] = True
+        dists = None if spatial is None else spatial.distances[idx + 1, 1:][None]
+        return float(batch_pressure(cols.pos[None], cols.team, carrier, dists=dists)[0])
 
     def _detect_degenerate_possession(self, state: MatchState) -> float:
         """ Detect 'Carousel' possession (passing without progression). """
-        if state.possession_team is None: return 0.0
-        
-        self.possession_buffer.append(float(state.ball.pos[0]))
-        if len(self.possession_buffer) > 300: # 5 seconds
-            self.possession_buffer.pop(0)
-            
-        if len(self.possession_buffer) < 300: return 0.0
-        
-        # Check variance in X-progression
-        x_std = np.std(self.possession_buffer)
-        # If ball stays in the same X-zone too long, it's degenerate
-        if x_std < 20.0:
-            return 1.0
+        team = state.possession_team
+        if team is None: return 0.0
+
+        # A turnover ends the other team's spell on the ball
+        other = self.possession_windows[TeamID.RED if team == TeamID.BLUE else TeamID.BLUE]
+        if other.count: other.clear()
+
+        window = self.possession_windows[team]
+        window.push(float(state.ball.pos[0]))
+
+        # If ball stays in the same X-zone for any full window, it's degenerate
+        for j in range(len(window.windows)):
+            x_std = window.std(j)
+            if x_std is not None and x_std < self.carousel_std:
+                return 1.0
         return 0.0
 
     def _generate_threat_data(self, state: MatchState) -> List[Dict[str, Any]]:
@@ -1,20 +1,24 @@
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List
 
-import torch
-import torch.optim as optim
-
-import torch.nn.functional as F
-from ai.models.policy import ActorCritic
 from ai.training.league import LeagueManager
 
 
 from ai.training.curriculum import CurriculumManager
 
+if TYPE_CHECKING:
+    import torch
+
 class PBTTrainer:
     """
     ULTRA Orchestrator: PPO + PBT + Curriculum.
+    torch and the policy are imported on construction, not with this module.
     """
     def __init__(self, num_agents: int = 4, device: str = "cuda"):
+        import torch
+        import torch.optim as optim
+
+        from ai.models.policy import ActorCritic
+
         self.device = torch.device(device if torch.cuda.is_available() else "cpu")
         # embed_dim matches Phase 3 architecture
         self.population = [ActorCritic(embed_dim=256).to(self.device) for _ in range(num_agents)]
@@ -25,8 +29,11 @@ class PBTTrainer:
         self.generation = 0
         self.total_steps = 0
 
-    def update_ppo(self, agent_idx: int, batch: Dict[str, torch.Tensor]):
+    def update_ppo(self, agent_idx: int, batch: Dict[str, "torch.Tensor"]):
         """Standard PPO update for a specific agent in the population."""
+        import torch
+        import torch.nn.functional as F
+
         agent = self.population[agent_idx]
         optimizer = self.optimizers[agent_idx]
         
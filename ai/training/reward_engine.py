@@ -1,85 +1,177 @@
-import yaml
 import numpy as np
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from sim.core.state import MatchState, TeamID, PlayerRole
 
+# Weight vector layout: (config section, key) per reward component
+REWARD_TERMS = (
+    ("sparse", "goal_scored"),
+    ("sparse", "goal_conceded"),
+    ("dense_offense", "final_third_entry"),
+    ("dense_offense", "progression"),
+    ("dense_offense", "pass_complete"),
+    ("dense_offense", "shot_taken"),
+    ("dense_defense", "pressure"),
+    ("discipline", "stamina_penalty"),
+)
+
+# Column order of the [N, 4] event_counts passed to calculate_batch
+EVENT_COLUMNS = ("PASS", "SHOT", "GOAL_FOR", "GOAL_AGAINST")
+
+# Per-decision penalty NeonFootballEnv adds while the analyst flags carousel possession
+DEGENERATE_THRESHOLD = 0.8
+DEGENERATE_PENALTY = -0.1
+
+
 class RewardEngine:
     """
     Multi-layered reward calculator for Neon Gridiron.
     Balances sparse goal-based rewards with dense tactical shaping.
+
+    The weights are compiled once into a vector (REWARD_TERMS order) and every
+    reward goes through calculate_batch(); calculate() is the single-match wrapper.
     """
-    def __init__(self, config_path: str = "configs/rewards.yaml", profile: str = "baseline"):
-        with open(config_path, 'r') as f:
-            full_cfg = yaml.safe_load(f)
-            self.cfg = full_cfg.get(profile, full_cfg['baseline'])
-            
-    def calculate(self, state: MatchState, events: List[Any], team: TeamID) -> float:
-        total_reward = 0.0
-        
+    def __init__(self, config_path: str = "configs/rewards.yaml", profile: str = "baseline",
+                 pitch_width: float = 600.0, table=None):
+        self.profile = profile
+        if table is not None:
+            # Compiled ConfigTable (configs/compiler.py): no YAML parse
+            self.load_table(table)
+        else:
+            import yaml
+
+            with open(config_path, 'r') as f:
+                full_cfg = yaml.safe_load(f)
+                cfg = full_cfg.get(profile, full_cfg['baseline'])
+            self._set_weights(np.array([cfg[section][key] for section, key in REWARD_TERMS]), cfg)
+
+        # Distances scale with the pitch: 100px pressure radius on the 600px pitch
+        self.pitch_width = float(pitch_width)
+        self.pressure_radius = self.pitch_width / 6.0
+        self.stamina_floor = 20.0
+
+    def _set_weights(self, weights: np.ndarray, cfg: Dict[str, Any]):
+        """Install the weight vector; self.cfg is the full profile with the vector overlaid."""
+        self.weights = np.array(weights, dtype=np.float64)
+        self.weights.flags.writeable = False
+        # Plain floats keep calculate_batch backend-neutral (NumPy or torch inputs)
+        self._w = tuple(float(w) for w in self.weights)
+        self.cfg = {
+            section: dict(values) if isinstance(values, dict) else values
+            for section, values in cfg.items()
+        }
+        for (section, key), w in zip(REWARD_TERMS, self._w):
+            self.cfg.setdefault(section, {})[key] = w
+
+    def load_table(self, table):
+        """Hot-swap the weights of self.profile from a compiled ConfigTable."""
+        self._set_weights(table.reward_vector(self.profile), table.reward_config(self.profile))
+
+    def calculate(self, state: MatchState, events: List[Any], team: TeamID,
+                  spatial: Optional[Any] = None) -> float:
+        """
+        spatial: the tick's SpatialContext, whose ball distances are reused when given.
+        GOAL events (GoalEvent.team_scored) count as GOAL_FOR or GOAL_AGAINST.
+        """
+        cols = state.columns()
+        counts = np.zeros((1, len(EVENT_COLUMNS)))
+        for e in events:
+            if e.event_type == "GOAL":
+                counts[0, 2 if e.team_scored == team else 3] += 1
+            elif getattr(e, 'actor_team', None) == team and e.event_type in EVENT_COLUMNS[:2]:
+                counts[0, EVENT_COLUMNS.index(e.event_type)] += 1
+        possession = -1 if state.possession_team is None else state.possession_team.value
+
+        rewards, _ = self.calculate_batch(
+            np.asarray(state.ball.pos, dtype=np.float64)[None],
+            cols.pos[None],
+            possession=np.array([possession]),
+            event_counts=counts,
+            stamina=cols.stamina[None],
+            team=team,
+            team_slots=np.flatnonzero(cols.team_mask(team)),
+            ball_dists=None if spatial is None else spatial.ball_dist[None],
+        )
+        return float(rewards[0])
+
+    def calculate_batch(
+        self,
+        ball_pos,
+        player_pos=None,
+        possession=None,
+        event_counts=None,
+        stamina=None,
+        team: TeamID = TeamID.BLUE,
+        team_slots=None,
+        ball_dists=None,
+    ):
+        """
+        Rewards for N matches at once, from `team`'s perspective.
+
+        ball_pos: [N, 2] in pitch coordinates (x in [0, pitch_width], BLUE attacks +x).
+        player_pos: [N, P, 2]; stamina: [N, P]; team_slots selects the team's columns
+        (default: the first 7 for BLUE, the last 7 for RED). ball_dists: optional
+        precomputed [N, P] player-ball distances (SpatialContext.ball_dist).
+        possession: [N] TeamID values, -1 for a loose ball.
+        event_counts: [N, 4] counts per EVENT_COLUMNS for this tick.
+
+        Only arithmetic, comparisons and slicing are used, so NumPy arrays and torch
+        tensors both work. Returns ([N] rewards, {component: [N] reward}).
+        """
+        (w_goal, w_conceded, w_final_third, w_prog,
+         w_pass, w_shot, w_pressure, w_stamina) = self._w
+        width = self.pitch_width
+        ball_x = ball_pos[:, 0]
+        if team_slots is None:
+            team_slots = slice(0, 7) if team == TeamID.BLUE else slice(7, 14)
+
         # 1. Sparse Rewards (Goals)
-        total_reward += self._sparse_reward(state, team)
-        
-        # 2. Dense Offense
-        total_reward += self._offense_reward(state, events, team)
-        
-        # 3. Dense Defense
-        total_reward += self._defense_reward(state, events, team)
-        
-        # 4. Discipline & Stamina
-        total_reward += self._discipline_reward(state, team)
-        
-        return float(total_reward)
-
-    def _sparse_reward(self, state: MatchState, team: TeamID) -> float:
-        # Check goals in this tick (this logic depends on env handling)
-        # For simplicity, we assume the caller handles the delta
-        return 0.0 
-
-    def _offense_reward(self, state: MatchState, events: List[Any], team: TeamID) -> float:
-        reward = 0.0
-        w = self.cfg['dense_offense']
-        ball_pos = state.ball.pos
-        
-        # Ball Progression (Targeting X=600 for BLUE, X=0 for RED)
+        if event_counts is None:
+            goals = conceded = passes = shots = 0.0
+        else:
+            passes, shots = event_counts[:, 0], event_counts[:, 1]
+            goals, conceded = event_counts[:, 2], event_counts[:, 3]
+        breakdown = {
+            "goal_scored": goals * w_goal,
+            "goal_conceded": conceded * w_conceded,
+        }
+
+        # 2. Dense Offense: progression towards the opponent's goal line
         if team == TeamID.BLUE:
-            prog = ball_pos[0] / 600.0
-            if ball_pos[0] > 400: reward += w['final_third_entry']
+            prog = ball_x / width
+            in_final_third = ball_x > width * 2.0 / 3.0
         else:
-            prog = (600.0 - ball_pos[0]) / 600.0
-            if ball_pos[0] < 200: reward += w['final_third_entry']
-            
-        reward += prog * w['progression']
-        
-        # Event Based
-        for e in events:
-            if getattr(e, 'actor_team', None) == team:
-                if e.event_type == "PASS": reward += w['pass_complete']
-                if e.event_type == "SHOT": reward += w['shot_taken']
-                
-        return reward
-
-    def _defense_reward(self, state: MatchState, events: List[Any], team: TeamID) -> float:
-        reward = 0.0
-        w = self.cfg['dense_defense']
-        
-        # Pressure (Are we near the ball when opponent has it?)
-        opp_team = TeamID.RED if team == TeamID.BLUE else TeamID.BLUE
-        if state.possession_team == opp_team:
-            for p in state.players:
-                if p.team == team:
-                    dist = np.linalg.norm(p.pos - state.ball.pos)
-                    if dist < 100.0:
-                        reward += (1.0 - dist/100.0) * w['pressure']
-                        
-        return reward
-
-    def _discipline_reward(self, state: MatchState, team: TeamID) -> float:
-        reward = 0.0
-        w = self.cfg['discipline']
-        
-        for p in state.players:
-            if p.team == team:
-                if p.stamina < 20.0:
-                    reward += w['stamina_penalty'] * (20.0 - p.stamina)
-                    
-        return reward
+            prog = (width - ball_x) / width
+            in_final_third = ball_x < width / 3.0
+        breakdown["final_third_entry"] = in_final_third * w_final_third
+        breakdown["progression"] = prog * w_prog
+        breakdown["pass_complete"] = passes * w_pass
+        breakdown["shot_taken"] = shots * w_shot
+
+        # 3. Dense Defense: pressure on the ball while the opponent has it
+        breakdown["pressure"] = 0.0
+        if possession is not None and (player_pos is not None or ball_dists is not None):
+            opp_team = TeamID.RED if team == TeamID.BLUE else TeamID.BLUE
+            if ball_dists is None:
+                delta = player_pos[:, team_slots] - ball_pos[:, None]
+                dists = ((delta * delta).sum(-1)) ** 0.5
+            else:
+                dists = ball_dists[:, team_slots]
+            pressure = ((1.0 - dists / self.pressure_radius) * w_pressure)
+            pressure = (pressure * (dists < self.pressure_radius)).sum(-1)
+            breakdown["pressure"] = pressure * (possession == opp_team.value)
+
+        # 4. Discipline & Stamina
+        breakdown["stamina_penalty"] = 0.0
+        if stamina is not None:
+            team_stamina = stamina[:, team_slots]
+            penalty = w_stamina * (self.stamina_floor - team_stamina)
+            breakdown["stamina_penalty"] = (penalty * (team_stamina < self.stamina_floor)).sum(-1)
+
+        # Same accumulation order as the per-component layers above
+        offense = (
+            (breakdown["final_third_entry"] + breakdown["progression"])
+            + breakdown["pass_complete"]
+        ) + breakdown["shot_taken"]
+        sparse = breakdown["goal_scored"] + breakdown["goal_conceded"]
+        rewards = ((sparse + offense) + breakdown["pressure"]) + breakdown["stamina_penalty"]
+        return rewards, breakdown
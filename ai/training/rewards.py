@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 
@@ -18,7 +18,10 @@ class RewardShaper:
         self.w_possession = self.cfg.get("w_possession", 0.1)
         self.w_spectacle = self.cfg.get("w_spectacle", 0.05)
 
-    def compute_meta_reward(self, state: Any, events: List[Any]) -> Dict[str, float]:
+    def compute_meta_reward(
+        self, state: Any, events: List[Any], spatial: Optional[Any] = None
+    ) -> Dict[str, float]:
+        """spatial: optional SpatialContext of the tick, reused for the ball distances."""
         rewards = {"total": 0.0, "goal": 0.0, "dense": 0.0, "spec": 0.0}
 
         # 1. Sparse Goal Rewards
@@ -27,7 +30,10 @@ class RewardShaper:
                 rewards["goal"] += self.w_goal
 
         # 2. Dense Ball Proximity (distance from closest player to the ball)
-        if getattr(state, "players", None):
+        if spatial is not None and len(spatial.ball_dist):
+            min_dist = float(spatial.ball_dist.min())
+            rewards["dense"] += self.w_ball_dist * (1.0 / (1.0 + min_dist / 100.0))
+        elif getattr(state, "players", None):
             ball_pos = np.asarray(state.ball.pos, dtype=np.float32)
             min_dist = min(
                 float(np.linalg.norm(np.asarray(p.pos) - ball_pos)) for p in state.players
@@ -0,0 +1,426 @@
+"""
+Config compiler: configs/**/*.yaml + an optional season override -> ConfigTable.
+
+The merged documents are validated with the pydantic models of configs/loader.py and
+flattened into read-only numpy tables (rewards, abilities, penalties, match scalars).
+Given a cache_dir, compiled tables are cached on disk under a key hashed from every
+source file (ConfigStore.shared() uses DEFAULT_CACHE_DIR, so fresh processes load
+the cached table), and ConfigStore re-checks the hashes so long-running processes can swap
+in edited configs between matches. yaml and pydantic are only imported on a cache miss.
+"""
+
+import copy
+import hashlib
+import json
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import numpy as np
+
+from ai.training.reward_engine import REWARD_TERMS
+from sim.core.abilities import Ability, build_registry
+
+COMPILER_VERSION = 3
+TICKS_PER_SECOND = 60
+
+ABILITY_COLUMNS = ("energy_cost", "stamina_penalty", "cooldown_ticks", "heat_per_use")
+CATALOGUE_COLUMNS = ("cost", "cooldown_ticks", "heat_per_use")
+PENALTY_LIMITS = ("foul_threshold", "yellow_card_limit", "red_card_limit")
+
+# Where the per-process shared stores cache compiled tables (relative, like config_dir)
+DEFAULT_CACHE_DIR = "data/config_cache"
+
+# Season override section -> the source document it patches
+OVERRIDE_TARGETS = {
+    "match": "match_rules",
+    "physics": "match_rules",
+    "penalties": "match_rules",
+    "abilities": "abilities/abilities_list",
+}
+
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    array = np.ascontiguousarray(array)
+    array.flags.writeable = False
+    return array
+
+
+@dataclass(frozen=True, eq=False)
+class ConfigTable:
+    """Immutable numeric view of the merged configuration."""
+
+    key: str
+    season: Optional[str]
+    reward_profiles: Tuple[str, ...]
+    reward_weights: np.ndarray  # (profiles, REWARD_TERMS of RewardEngine)
+    reward_profile_docs: Tuple[Mapping[str, Any], ...]  # full profiles, for the other terms
+    ability_ids: Tuple[str, ...]
+    ability_names: Tuple[str, ...]
+    abilities: np.ndarray  # (abilities, ABILITY_COLUMNS)
+    catalogue_ids: Tuple[str, ...]
+    catalogue_names: Tuple[str, ...]
+    catalogue: np.ndarray  # (catalogue abilities, CATALOGUE_COLUMNS)
+    penalty_limits: np.ndarray  # PENALTY_LIMITS
+    penalty_rule_ids: Tuple[str, ...]
+    penalty_rule_points: np.ndarray  # points per offence (or per second)
+    scalars: Mapping[str, float] = field(default_factory=dict)
+
+    def reward_vector(self, profile: str) -> np.ndarray:
+        """Weights of `profile` in REWARD_TERMS order (falls back to baseline)."""
+        if profile not in self.reward_profiles:
+            profile = "baseline"
+        return self.reward_weights[self.reward_profiles.index(profile)]
+
+    def reward_config(self, profile: str) -> Dict[str, Dict[str, Any]]:
+        """Copy of the whole validated `profile` (falls back to baseline)."""
+        if profile not in self.reward_profiles:
+            profile = "baseline"
+        doc = self.reward_profile_docs[self.reward_profiles.index(profile)]
+        return copy.deepcopy(dict(doc))
+
+    def ability_registry(self) -> Dict[str, Ability]:
+        """Core abilities, then the catalogue (energy cost only, no stamina penalty)."""
+        registry = {
+            ability_id: Ability(ability_id, name, energy, stamina, int(cooldown), heat)
+            for ability_id, name, (energy, stamina, cooldown, heat) in zip(
+                self.ability_ids, self.ability_names, self.abilities.tolist()
+            )
+        }
+        for ability_id, name, (cost, cooldown, heat) in zip(
+            self.catalogue_ids, self.catalogue_names, self.catalogue.tolist()
+        ):
+            registry[ability_id] = Ability(ability_id, name, cost, 0.0, int(cooldown), heat)
+        return registry
+
+    def penalty_limit(self, name: str) -> float:
+        return float(self.penalty_limits[PENALTY_LIMITS.index(name)])
+
+    def __reduce__(self):
+        # mappingproxy does not pickle; rebuild the read-only views on the other side
+        state = {f.name: getattr(self, f.name) for f in fields(self)}
+        state["scalars"] = dict(self.scalars)
+        return (ConfigTable._from_fields, (state,))
+
+    @classmethod
+    def _from_fields(cls, state: Dict[str, Any]) -> "ConfigTable":
+        return cls(**{
+            name: _frozen(value) if isinstance(value, np.ndarray) else value
+            for name, value in state.items()
+            if name != "scalars"
+        }, scalars=MappingProxyType(state["scalars"]))
+
+    # -- disk format --------------------------------------------------------------
+
+    def save(self, path: Path):
+        arrays = {
+            name: getattr(self, name)
+            for name in ("reward_weights", "abilities", "catalogue", "penalty_limits",
+                         "penalty_rule_points")
+        }
+        meta = {
+            "key": self.key,
+            "season": self.season,
+            "reward_profiles": self.reward_profiles,
+            "reward_profile_docs": self.reward_profile_docs,
+            "ability_ids": self.ability_ids,
+            "ability_names": self.ability_names,
+            "catalogue_ids": self.catalogue_ids,
+            "catalogue_names": self.catalogue_names,
+            "penalty_rule_ids": self.penalty_rule_ids,
+            "scalars": dict(self.scalars),
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp.npz")
+        np.savez(tmp, meta=np.array(json.dumps(meta)), **arrays)
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "ConfigTable":
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+            arrays = {name: _frozen(data[name]) for name in data.files if name != "meta"}
+        return cls(
+            key=meta["key"],
+            season=meta["season"],
+            reward_profiles=tuple(meta["reward_profiles"]),
+            reward_profile_docs=tuple(meta["reward_profile_docs"]),
+            ability_ids=tuple(meta["ability_ids"]),
+            ability_names=tuple(meta["ability_names"]),
+            catalogue_ids=tuple(meta["catalogue_ids"]),
+            catalogue_names=tuple(meta["catalogue_names"]),
+            penalty_rule_ids=tuple(meta["penalty_rule_ids"]),
+            scalars=MappingProxyType(meta["scalars"]),
+            **arrays,
+        )
+
+
+def source_files(config_dir: str = "configs") -> Dict[str, Path]:
+    """Every YAML document under config_dir, keyed by relative path without suffix."""
+    root = Path(config_dir)
+    return {
+        path.relative_to(root).with_suffix("").as_posix(): path
+        for path in sorted(root.rglob("*.yaml"))
+    }
+
+
+def season_path(season: Optional[str], patches_dir: str = "patches") -> Optional[Path]:
+    """'season_01' -> patches/season_01/overrides.yaml; paths pass through."""
+    if season is None:
+        return None
+    path = Path(season)
+    if path.suffix in (".yaml", ".yml"):
+        return path
+    return Path(patches_dir) / season / "overrides.yaml"
+
+
+def cache_key(sources: Dict[str, Path], override: Optional[Path]) -> str:
+    digest = hashlib.sha256(f"v{COMPILER_VERSION}".encode())
+    files = list(sources.items()) + ([("@override", override)] if override else [])
+    for name, path in files:
+        digest.update(name.encode())
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()[:20]
+
+
+def deep_merge(base: Any, patch: Any) -> Any:
+    """Dicts merge recursively, lists of {id: ...} entries merge by id, the rest replaces."""
+    if isinstance(base, dict) and isinstance(patch, dict):
+        merged = dict(base)
+        for key, value in patch.items():
+            merged[key] = deep_merge(base[key], value) if key in base else copy.deepcopy(value)
+        return merged
+    if isinstance(base, list) and isinstance(patch, list) and all(
+        isinstance(entry, dict) and "id" in entry for entry in base + patch
+    ):
+        merged = [dict(entry) for entry in base]
+        index = {entry["id"]: i for i, entry in enumerate(merged)}
+        for entry in patch:
+            if entry["id"] in index:
+                merged[index[entry["id"]]] = deep_merge(merged[index[entry["id"]]], entry)
+            else:
+                merged.append(copy.deepcopy(entry))
+        return merged
+    return copy.deepcopy(patch)
+
+
+def merge_documents(
+    sources: Dict[str, Path], override: Optional[Path]
+) -> Dict[str, Dict[str, Any]]:
+    import yaml
+
+    docs = {}
+    for name, path in sources.items():
+        with open(path, "r") as f:
+            docs[name] = yaml.safe_load(f) or {}
+    if override is not None:
+        with open(override, "r") as f:
+            patch = yaml.safe_load(f) or {}
+        for section, value in patch.items():
+            target = OVERRIDE_TARGETS.get(section)
+            if target not in docs:
+                raise ValueError(f"{override}: no config document to apply '{section}' to")
+            docs[target] = deep_merge(docs[target], {section: value})
+    return docs
+
+
+def compile_documents(
+    docs: Dict[str, Dict[str, Any]], key: str = "", season: Optional[str] = None
+) -> ConfigTable:
+    """Validate merged documents and flatten them into a ConfigTable."""
+    from configs.loader import (
+        CatalogueAbility,
+        CoreAbility,
+        GlobalConfig,
+        PenaltyPoints,
+        RewardProfile,
+    )
+
+    rules = GlobalConfig(**docs.get("match_rules", {}))
+    profiles = {
+        name: RewardProfile(**profile) for name, profile in docs["rewards"].items()
+    }
+    core = {
+        ability_id: CoreAbility(**cfg)
+        for ability_id, cfg in docs.get("abilities_core", {}).get("abilities", {}).items()
+    }
+    catalogue_doc = docs.get("abilities/abilities_list", {})
+    catalogue = [CatalogueAbility(**entry) for entry in catalogue_doc.get("abilities", [])]
+    catalogue_heat = float(catalogue_doc.get("heat", {}).get("ability_heat_gen", 0.0))
+    penalties = PenaltyPoints(**docs.get("penalties/penalty_points", {}))
+
+    registry = build_registry({k: v.model_dump() for k, v in core.items()})
+    weights = [
+        [getattr(getattr(profile, section), term) for section, term in REWARD_TERMS]
+        for profile in profiles.values()
+    ]
+    # Spectacle triggers (shots) pay out more in seasons that reward showmanship
+    shot = REWARD_TERMS.index(("dense_offense", "shot_taken"))
+    for row in weights:
+        row[shot] *= rules.match.spectacle_reward_mult
+    scalars = {
+        "physics.damping": rules.physics.damping,
+        "physics.air_drag": rules.physics.air_drag,
+        "match.stamina_regen_bonus": rules.match.stamina_regen_bonus,
+        "match.spectacle_reward_mult": rules.match.spectacle_reward_mult,
+    }
+    return ConfigTable(
+        key=key,
+        season=season,
+        reward_profiles=tuple(profiles),
+        reward_weights=_frozen(np.array(weights, dtype=np.float64)),
+        reward_profile_docs=tuple(profile.model_dump() for profile in profiles.values()),
+        ability_ids=tuple(registry),
+        ability_names=tuple(a.name for a in registry.values()),
+        abilities=_frozen(np.array([
+            [a.energy_cost, a.stamina_penalty, a.cooldown_ticks, a.heat_per_use]
+            for a in registry.values()
+        ], dtype=np.float64)),
+        catalogue_ids=tuple(a.id for a in catalogue),
+        catalogue_names=tuple(a.name for a in catalogue),
+        catalogue=_frozen(np.array(
+            [[a.cost, round(a.cd * TICKS_PER_SECOND), catalogue_heat] for a in catalogue],
+            dtype=np.float64,
+        ).reshape(-1, len(CATALOGUE_COLUMNS))),
+        penalty_limits=_frozen(np.array(
+            [getattr(rules.penalties, name) for name in PENALTY_LIMITS], dtype=np.float64
+        )),
+        penalty_rule_ids=tuple(rule.id for rule in penalties.rules),
+        penalty_rule_points=_frozen(np.array(
+            [rule.points or rule.points_per_sec for rule in penalties.rules], dtype=np.float64
+        )),
+        scalars=MappingProxyType(scalars),
+    )
+
+
+def compile_config(
+    season: Optional[str] = None,
+    config_dir: str = "configs",
+    patches_dir: str = "patches",
+    cache_dir: Optional[str] = None,
+) -> ConfigTable:
+    """Compile the table for `season`, through the on-disk cache when cache_dir is set."""
+    sources = source_files(config_dir)
+    override = season_path(season, patches_dir)
+    key = cache_key(sources, override)
+    cached = Path(cache_dir) / f"{key}.npz" if cache_dir else None
+    if cached is not None and cached.exists():
+        return ConfigTable.load(cached)
+
+    table = compile_documents(merge_documents(sources, override), key, season)
+    if cached is not None:
+        table.save(cached)
+    return table
+
+
+class ConfigStore:
+    """
+    The current ConfigTable of a long-running process (trainer, live server).
+    refresh() stats the source files and, when one was touched, re-hashes them and
+    swaps in the recompiled table; call it between matches so a match never sees
+    two configs. Files added after construction are picked up by set_season().
+    Worker processes adopt() the table their parent already compiled instead of
+    hashing and loading the sources again.
+    """
+
+    _shared: Dict[Tuple[Any, ...], "ConfigStore"] = {}
+
+    def __init__(
+        self,
+        season: Optional[str] = None,
+        config_dir: str = "configs",
+        patches_dir: str = "patches",
+        cache_dir: Optional[str] = None,
+        table: Optional[ConfigTable] = None,
+    ):
+        self.season = season
+        self.config_dir = config_dir
+        self.patches_dir = patches_dir
+        self.cache_dir = cache_dir
+        if table is None:
+            table = compile_config(season, config_dir, patches_dir, cache_dir)
+        self.table = table
+        self.swaps = 0
+        self._watch()
+
+    def _watch(self):
+        # The file list is scanned once (and on season changes); refresh() only stats it
+        override = season_path(self.season, self.patches_dir)
+        self._paths = list(source_files(self.config_dir).values()) + (
+            [override] if override else []
+        )
+        self._stamp = self._file_stamp()
+
+    @classmethod
+    def shared(cls, season: Optional[str] = None, **kwargs) -> "ConfigStore":
+        """
+        One store per (season, dirs) in this process, so every env reuses one table.
+        Compiled tables go through the on-disk cache (DEFAULT_CACHE_DIR unless cache_dir
+        is given), so only the first process to see a config parses the YAML.
+        """
+        kwargs.setdefault("cache_dir", DEFAULT_CACHE_DIR)
+        key = (season,) + tuple(sorted(kwargs.items()))
+        if key not in cls._shared:
+            cls._shared[key] = cls(season, **kwargs)
+        return cls._shared[key]
+
+    @classmethod
+    def adopt(cls, table: ConfigTable, **kwargs) -> "ConfigStore":
+        """Install an already compiled table as the shared store of its season."""
+        kwargs.setdefault("cache_dir", DEFAULT_CACHE_DIR)
+        key = (table.season,) + tuple(sorted(kwargs.items()))
+        cls._shared[key] = cls(table.season, table=table, **kwargs)
+        return cls._shared[key]
+
+    def set_season(self, season: Optional[str]) -> ConfigTable:
+        self.season = season
+        self._watch()
+        return self._recompile()
+
+    def _file_stamp(self) -> Tuple[Any, ...]:
+        """Cheap change detector: (mtime, size) of every watched file."""
+        stamp = []
+        for path in self._paths:
+            stat = path.stat()
+            stamp.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(stamp)
+
+    def refresh(self) -> ConfigTable:
+        stamp = self._file_stamp()
+        if stamp == self._stamp:
+            return self.table
+        table = self._recompile()
+        self._stamp = stamp
+        return table
+
+    def _recompile(self) -> ConfigTable:
+        # The content hash decides whether a touched file really changed
+        override = season_path(self.season, self.patches_dir)
+        key = cache_key(source_files(self.config_dir), override)
+        if key != self.table.key:
+            self.table = compile_config(
+                self.season, self.config_dir, self.patches_dir, self.cache_dir
+            )
+            self.swaps += 1
+        return self.table
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compile configs (+ season override)")
+    parser.add_argument("--season", default=None, help="e.g. season_02")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    args = parser.parse_args()
+    table = compile_config(args.season, cache_dir=args.cache_dir)
+    print(f"⚙️  Config table {table.key} (season: {table.season or 'none'})")
+    print(f"  reward profiles: {', '.join(table.reward_profiles)}")
+    for ids, rows, columns in (
+        (table.ability_ids, table.abilities, ABILITY_COLUMNS),
+        (table.catalogue_ids, table.catalogue, CATALOGUE_COLUMNS),
+    ):
+        for ability_id, row in zip(ids, rows.tolist()):
+            print(f"  {ability_id:<8} " + " ".join(f"{c}={v:g}" for c, v in zip(columns, row)))
+    for name, value in table.scalars.items():
+        print(f"  {name} = {value:g}")
@@ -1,23 +1,110 @@
 from pathlib import Path
+from typing import Dict, List, Optional
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PhysicsConfig(BaseModel):
     damping: float = Field(default=0.95, ge=0.8, le=1.0)
     gravity: float = 0.0
+    air_drag: float = Field(default=1.0, gt=0.0, le=1.0)
 
 
 class MatchConfig(BaseModel):
     max_ticks: int = Field(default=2000, gt=0)
     team_size: int = Field(default=7, gt=0)
     field_size: tuple = (600, 400)
+    # Season levers (patches/season_0x/overrides.yaml)
+    season_name: str = ""
+    stamina_regen_bonus: float = Field(default=1.0, gt=0.0)
+    spectacle_reward_mult: float = Field(default=1.0, ge=0.0)
+    counter_matrix_active: bool = False
+
+
+class PenaltyLimits(BaseModel):
+    foul_threshold: float = Field(default=40.0, ge=0.0)  # impact speed, px/s
+    yellow_card_limit: float = Field(default=50.0, gt=0.0)
+    red_card_limit: float = Field(default=100.0, gt=0.0)
 
 
 class GlobalConfig(BaseModel):
     physics: PhysicsConfig = Field(default_factory=PhysicsConfig)
     match: MatchConfig = Field(default_factory=MatchConfig)
+    penalties: PenaltyLimits = Field(default_factory=PenaltyLimits)
+
+
+class SparseRewards(BaseModel):
+    goal_scored: float
+    goal_conceded: float
+
+
+class OffenseRewards(BaseModel):
+    progression: float
+    final_third_entry: float
+    pass_complete: float
+    shot_taken: float
+
+
+class DefenseRewards(BaseModel):
+    pressure: float
+    interception: float = 0.0
+    possession_gain: float = 0.0
+
+
+class DisciplineRewards(BaseModel):
+    stamina_penalty: float
+    out_of_bounds: float = 0.0
+
+
+class RewardProfile(BaseModel):
+    """One profile of configs/rewards.yaml."""
+
+    model_config = ConfigDict(extra="allow")
+
+    sparse: SparseRewards
+    dense_offense: OffenseRewards
+    dense_defense: DefenseRewards
+    discipline: DisciplineRewards
+
+
+class CoreAbility(BaseModel):
+    """An entry of abilities_core.yaml `abilities` (dash/shield/surge)."""
+
+    model_config = ConfigDict(extra="allow")
+
+    stamina_cost: float = Field(ge=0.0)
+    cooldown_ticks: int = Field(ge=0)
+
+
+class CatalogueAbility(BaseModel):
+    """An entry of abilities/abilities_list.yaml, as patched by season overrides."""
+
+    model_config = ConfigDict(extra="allow")
+
+    id: str
+    name: str
+    cost: float = Field(ge=0.0)
+    cd: float = Field(ge=0.0)  # seconds
+
+
+class PenaltyRule(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    id: str
+    name: str
+    points: float = 0.0
+    points_per_sec: float = 0.0
+
+
+class PenaltyPoints(BaseModel):
+    """penalties/penalty_points.yaml"""
+
+    model_config = ConfigDict(extra="allow")
+
+    decay: Dict[str, float] = Field(default_factory=dict)
+    rules: List[PenaltyRule] = Field(default_factory=list)
+    sanctions: Optional[dict] = None
 
 
 def load_config(path: str = "configs/match_rules.yaml") -> GlobalConfig:
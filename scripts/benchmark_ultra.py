@@ -1,5 +1,9 @@
+import argparse
+import os
 import time
 
+import numpy as np
+
 from ai.env.neon_env import NeonFootballEnv
 
 
@@ -27,5 +31,77 @@ def run_benchmark(steps: int = 1000):
         print("PERFORMANCE: Simulation is running faster than real-time! ✅")
 
 
+def run_scaling_benchmark(steps: int = 500, max_workers: int = 0):
+    """SPS of NeonSubprocVecEnv (one env per worker) from 1 worker up to the core count."""
+    from ai.env.subproc_env import NeonSubprocVecEnv
+
+    cores = max_workers or os.cpu_count() or 1
+    counts = sorted({1, *[2**k for k in range(1, 8) if 2**k <= cores], cores})
+    print(f"Subprocess scaling ({steps} steps per env, {cores} cores)...")
+    rng = np.random.default_rng(0)
+    base = None
+    for workers in counts:
+        actions = rng.uniform(-1.0, 1.0, (workers, 56)).astype(np.float32)
+        with NeonSubprocVecEnv(workers, seed=0) as env:
+            env.reset()
+            np.copyto(env.actions, actions)
+            for _ in range(10):
+                env.step()
+            start = time.perf_counter()
+            for _ in range(steps):
+                env.step()
+            sps = workers * steps / (time.perf_counter() - start)
+        base = base or sps
+        print(f"{workers:>4} workers | {sps:>10,.0f} SPS | x{sps / base:.2f} (ideal x{workers})")
+
+
+def run_batch_benchmark(num_worlds: int = 16, steps: int = 300, max_workers: int = 0):
+    """
+    PhysicsBatch (K pymunk worlds on a thread pool) against NeonSubprocVecEnv with K envs.
+    The subprocess numbers include the env's reward/analyst work on top of physics.
+    """
+    from ai.env.subproc_env import NeonSubprocVecEnv
+    from sim.core.physics_batch import PhysicsBatch
+
+    cores = max_workers or os.cpu_count() or 1
+    counts = sorted({1, *[2**k for k in range(1, 8) if 2**k <= cores], cores})
+    forces = np.random.default_rng(0).uniform(-1.0, 1.0, (num_worlds, 14, 2)).astype(np.float32)
+    print(f"PhysicsBatch vs subprocess env: {num_worlds} worlds, {steps} ticks, {cores} cores")
+    formation = NeonFootballEnv._kickoff_formation()
+    for threads in counts:
+        batch = PhysicsBatch(num_worlds, (300.0, 200.0), formation, max_workers=threads)
+        start = time.perf_counter()
+        for _ in range(steps):
+            batch.step(forces)
+        tps = num_worlds * steps / (time.perf_counter() - start)
+        batch.close()
+        print(f"PhysicsBatch      {threads:>4} threads | {tps:>10,.0f} world-ticks/s")
+
+    actions = np.zeros((num_worlds, 56), dtype=np.float32)
+    actions[:, 0::4] = forces[:, :, 0]
+    actions[:, 1::4] = forces[:, :, 1]
+    for workers in counts:
+        per_worker = -(-num_worlds // workers)
+        with NeonSubprocVecEnv(num_worlds, seed=0, envs_per_worker=per_worker) as env:
+            env.reset()
+            np.copyto(env.actions, actions)
+            start = time.perf_counter()
+            for _ in range(steps):
+                env.step()
+            sps = num_worlds * steps / (time.perf_counter() - start)
+        print(f"NeonSubprocVecEnv {env.num_workers:>4} workers | {sps:>10,.0f} env-steps/s")
+
+
 if __name__ == "__main__":
-    run_benchmark()
+    parser = argparse.ArgumentParser(description="NeonFootballEnv throughput")
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--scaling", action="store_true", help="subprocess vector env scaling")
+    parser.add_argument("--batch", action="store_true", help="PhysicsBatch vs subprocess env")
+    parser.add_argument("--max-workers", type=int, default=0)
+    args = parser.parse_args()
+    if args.batch:
+        run_batch_benchmark(steps=args.steps, max_workers=args.max_workers)
+    elif args.scaling:
+        run_scaling_benchmark(steps=args.steps, max_workers=args.max_workers)
+    else:
+        run_benchmark(args.steps)
@@ -1,8 +1,110 @@
+import argparse
 import time
 
 import torch
 
 from ai.env.ultra_vec_env import UltraVectorizedEnv
+from sim.ultra.vectorized_phys import VectorizedNeonPhysics
+
+
+def legacy_step(phys, actions):
+    """The original branchy VectorizedNeonPhysics.step (ball contacts only), kept as a baseline."""
+    phys.vel[:, 1:, :] += actions * phys.dt
+    phys.pos += phys.vel * phys.dt
+
+    diff = phys.pos[:, 1:, :] - phys.pos[:, 0, :].unsqueeze(1)
+    dist = torch.norm(diff, dim=-1)
+    collision_mask = dist < 1.0
+    if collision_mask.any():
+        env_ids, player_ids = torch.where(collision_mask)
+        phys.vel[env_ids, 0] = phys.vel[env_ids, player_ids + 1] * 1.5
+
+    mask_x = phys.pos[:, :, 0].abs() > phys.field_width / 2
+    phys.vel[:, :, 0][mask_x] *= -0.5
+    phys.pos[:, :, 0] = torch.clamp(phys.pos[:, :, 0], -phys.field_width / 2, phys.field_width / 2)
+    mask_y = phys.pos[:, :, 1].abs() > phys.field_height / 2
+    phys.vel[:, :, 1][mask_y] *= -0.5
+    phys.pos[:, :, 1] = torch.clamp(
+        phys.pos[:, :, 1], -phys.field_height / 2, phys.field_height / 2
+    )
+    phys.vel *= phys.friction
+
+
+def run_backend_benchmark(env_counts=(64, 256, 1024, 4096, 16384), num_steps=200):
+    """Time VectorizedNeonPhysics.step on the numpy and torch CPU backends."""
+    import numpy as np
+
+    print(f"⚙️  Physics step: numpy vs torch backend, {num_steps} steps, device=cpu")
+    for num_envs in env_counts:
+        timings = {}
+        for backend in ("numpy", "torch"):
+            phys = VectorizedNeonPhysics(num_envs, device="cpu", backend=backend, seed=0)
+            phys.reset()
+            actions = np.random.default_rng(0).uniform(-30.0, 30.0, (num_envs, 14, 2))
+            actions = actions.astype(np.float32)
+            if backend == "torch":
+                actions = torch.from_numpy(actions)
+            for _ in range(10):
+                phys.step(actions)
+            start = time.perf_counter()
+            for _ in range(num_steps):
+                phys.step(actions)
+            timings[backend] = num_envs * num_steps / (time.perf_counter() - start)
+        print(
+            f"{num_envs:>6} envs | numpy {timings['numpy']:>12,.0f} SPS"
+            f" | torch {timings['torch']:>12,.0f} SPS"
+        )
+
+
+def run_sharded_benchmark(num_envs=4096, num_steps=200):
+    """SPS of ShardedVectorizedEnv as the worker count grows to the core count."""
+    import os
+
+    import numpy as np
+
+    from ai.env.sharded_vec_env import ShardedVectorizedEnv
+
+    cores = os.cpu_count() or 1
+    counts = sorted({1, *[2**k for k in range(1, 7) if 2**k <= cores], cores})
+    print(f"🧩 Sharded env: {num_envs} envs, {num_steps} steps, {cores} cores")
+    actions = np.random.default_rng(0).uniform(-1.0, 1.0, (num_envs, 14, 2)).astype(np.float32)
+    for workers in counts:
+        with ShardedVectorizedEnv(num_envs=num_envs, num_workers=workers) as env:
+            env.reset()
+            np.copyto(env.actions, actions)
+            for _ in range(10):
+                env.step()
+            start = time.perf_counter()
+            for _ in range(num_steps):
+                env.step()
+            sps = num_envs * num_steps / (time.perf_counter() - start)
+        print(f"{workers:>4} workers | {sps:>12,.0f} SPS")
+
+
+def run_physics_benchmark(env_counts=(256, 1024, 4096, 16384), num_steps=200, device="cpu"):
+    """Time the masked in-place step against legacy_step on the same device."""
+    print(f"⚙️  Physics step: masked vs legacy, {num_steps} steps, device={device}")
+    for num_envs in env_counts:
+        timings = {}
+        for name in ("legacy", "masked"):
+            torch.manual_seed(0)
+            phys = VectorizedNeonPhysics(num_envs, device=device)
+            phys.reset()
+            actions = (torch.rand((num_envs, 14, 2), device=phys.device) * 2 - 1) * 30.0
+            step = phys.step if name == "masked" else (lambda a, p=phys: legacy_step(p, a))
+            for _ in range(10):
+                step(actions)
+            torch.cuda.synchronize() if phys.device.type == "cuda" else None
+            start = time.perf_counter()
+            for _ in range(num_steps):
+                step(actions)
+            torch.cuda.synchronize() if phys.device.type == "cuda" else None
+            timings[name] = num_envs * num_steps / (time.perf_counter() - start)
+        print(
+            f"{num_envs:>6} envs | legacy {timings['legacy']:>12,.0f} SPS"
+            f" | masked {timings['masked']:>12,.0f} SPS"
+            f" | x{timings['masked'] / timings['legacy']:.2f}"
+        )
 
 
 def run_benchmark(num_envs=1024, num_steps=1000, device="cuda"):
@@ -41,5 +143,17 @@ def run_benchmark(num_envs=1024, num_steps=1000, device="cuda"):
 
 
 if __name__ == "__main__":
-    device = "cuda" if torch.cuda.is_available() else "cpu"
-    run_benchmark(num_envs=1024, num_steps=1000, device=device)
+    parser = argparse.ArgumentParser(description="UltraVectorizedEnv throughput")
+    parser.add_argument("--device", default="cuda" if torch.cuda.is_available() else "cpu")
+    parser.add_argument("--physics", action="store_true", help="compare physics step versions")
+    parser.add_argument("--backends", action="store_true", help="compare numpy and torch physics")
+    parser.add_argument("--sharded", action="store_true", help="scale shared-memory workers")
+    args = parser.parse_args()
+    if args.sharded:
+        run_sharded_benchmark()
+    elif args.backends:
+        run_backend_benchmark()
+    elif args.physics:
+        run_physics_benchmark(device=args.device)
+    else:
+        run_benchmark(num_envs=1024, num_steps=1000, device=args.device)
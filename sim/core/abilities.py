@@ -2,7 +2,7 @@ import os
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
-import yaml
+import numpy as np
 
 from sim.core.state import PlayerState
 
@@ -17,47 +17,70 @@ class Ability:
     heat_per_use: float
 
 
+# Energy cost and heat per use of the core abilities; stamina and cooldown come from config
+CORE_ABILITIES = {
+    "dash": ("Neon Dash", 10.0, 25.0, 60, 10.0),
+    "shield": ("Plasma Shield", 30.0, 40.0, 120, 20.0),
+    "surge": ("Overdrive", 50.0, 50.0, 300, 40.0),
+}
+
+
+def build_registry(abilities_cfg: Dict[str, dict]) -> Dict[str, "Ability"]:
+    """Core abilities from the `abilities` section of abilities_core.yaml."""
+    registry = {}
+    for ability_id, (name, energy, stamina, cooldown, heat) in CORE_ABILITIES.items():
+        cfg = abilities_cfg.get(ability_id, {})
+        registry[ability_id] = Ability(
+            ability_id,
+            name,
+            energy,
+            cfg.get("stamina_cost", stamina),
+            cfg.get("cooldown_ticks", cooldown),
+            heat,
+        )
+    return registry
+
+
 class AbilityManager:
     """
     Manages casting, cooldowns, and resource pools for player bots.
     Implements futuristic energy-based skill system.
+
+    The registry is compiled into per-ability cost columns and cooldowns live in an
+    expiry-tick table of shape (players, abilities), or (envs, players, abilities)
+    with num_envs. The *_batch methods cast for a whole match (or N matches) against
+    energy/stamina/heat columns such as MatchArrays.energy; the per-player methods
+    are single-row wrappers over them.
     """
 
-    def __init__(self, config_path: str = "configs/abilities_core.yaml"):
-        self.cooldowns: Dict[str, Dict[str, int]] = {}
-        self.registry: Dict[str, Ability] = self._init_registry(config_path)
+    HEAT_LIMIT = 90.0
+    HEAT_DECAY = 0.99  # heat kept per tick
+    ENERGY_REGEN = 0.2  # energy per tick, before the season's regen bonus
+
+    def __init__(
+        self,
+        config_path: str = "configs/abilities_core.yaml",
+        num_players: int = 14,
+        num_envs: Optional[int] = None,
+        table=None,
+    ):
+        # A compiled ConfigTable (configs/compiler.py) skips the YAML parse
+        registry = table.ability_registry() if table is not None else None
+        self._compile(registry or self._init_registry(config_path))
+        self.energy_regen = self.ENERGY_REGEN * self._regen_bonus(table)
+
+        rows = (num_players,) if num_envs is None else (num_envs, num_players)
+        self.expiry = np.zeros(rows + (len(self.registry),), dtype=np.int64)
+        # Player id -> row of the expiry table, for the per-player API
+        self.slots: Dict[str, int] = {}
 
     def _init_registry(self, config_path: str) -> Dict[str, Ability]:
         if os.path.exists(config_path):
+            import yaml
+
             with open(config_path, "r") as f:
                 cfg = yaml.safe_load(f)
-                abs_cfg = cfg.get("abilities", {})
-                return {
-                    "dash": Ability(
-                        "dash",
-                        "Neon Dash",
-                        10.0,
-                        abs_cfg.get("dash", {}).get("stamina_cost", 25.0),
-                        abs_cfg.get("dash", {}).get("cooldown_ticks", 60),
-                        10.0,
-                    ),
-                    "shield": Ability(
-                        "shield",
-                        "Plasma Shield",
-                        30.0,
-                        abs_cfg.get("shield", {}).get("stamina_cost", 40.0),
-                        abs_cfg.get("shield", {}).get("cooldown_ticks", 120),
-                        20.0,
-                    ),
-                    "surge": Ability(
-                        "surge",
-                        "Overdrive",
-                        50.0,
-                        abs_cfg.get("surge", {}).get("stamina_cost", 50.0),
-                        abs_cfg.get("surge", {}).get("cooldown_ticks", 300),
-                        40.0,
-                    ),
-                }
+                return build_registry(cfg.get("abilities", {}))
 
         return {
             "dash": Ability("dash", "Neon Dash", 10.0, 5.0, 120, 20.0),
@@ -65,34 +88,147 @@ class AbilityManager:
             "teleport": Ability("teleport", "Phase Shift", 80.0, 20.0, 600, 80.0),
         }
 
-    def can_cast(self, player: PlayerState, ability_id: str, tick: int) -> bool:
-        ability = self.registry.get(ability_id)
-        if not ability:
-            return False
-
-        if player.energy < ability.energy_cost or player.heat > 90.0:
-            return False
+    def _compile(self, registry: Dict[str, Ability]):
+        """Registry -> per-ability cost columns (registry order)."""
+        self.registry = registry
+        self.ability_ids: List[str] = list(registry)
+        self.ability_index = {ability_id: i for i, ability_id in enumerate(self.ability_ids)}
+        abilities = list(registry.values())
+        self.energy_cost = np.array([a.energy_cost for a in abilities])
+        self.stamina_penalty = np.array([a.stamina_penalty for a in abilities])
+        self.cooldown_ticks = np.array([a.cooldown_ticks for a in abilities], dtype=np.int64)
+        self.heat_per_use = np.array([a.heat_per_use for a in abilities])
+
+    @staticmethod
+    def _regen_bonus(table) -> float:
+        if table is None:
+            return 1.0
+        return float(table.scalars.get("match.stamina_regen_bonus", 1.0))
+
+    def load_table(self, table):
+        """Hot-swap costs from a compiled ConfigTable; cooldowns survive if the ids match."""
+        registry = table.ability_registry()
+        same = list(registry) == self.ability_ids
+        self._compile(registry)
+        self.energy_regen = self.ENERGY_REGEN * self._regen_bonus(table)
+        if not same:
+            self.expiry = np.zeros(self.expiry.shape[:-1] + (len(registry),), dtype=np.int64)
+
+    def can_cast_batch(self, abilities, energy, heat, tick, expiry=None) -> np.ndarray:
+        """
+        abilities: [..., players] ability index per player (-1 = no cast).
+        energy/heat: matching resource columns; tick: scalar or broadcastable per-env ticks.
+        Returns the mask of players allowed to cast their requested ability.
+        """
+        expiry = self.expiry if expiry is None else expiry
+        abilities = np.asarray(abilities)
+        requested = abilities >= 0
+        col = np.where(requested, abilities, 0)
+        ready = np.take_along_axis(expiry, col[..., None], axis=-1)[..., 0] <= tick
+        return (
+            requested
+            & (energy >= self.energy_cost[col])
+            & (heat <= self.HEAT_LIMIT)
+            & ready
+        )
+
+    def cast_batch(self, abilities, energy, stamina, heat, tick, expiry=None) -> np.ndarray:
+        """
+        Cast wherever can_cast_batch() allows: resource columns are updated in place and
+        cooldown expiries set. Returns the mask of players that cast.
+        """
+        expiry = self.expiry if expiry is None else expiry
+        abilities = np.asarray(abilities)
+        ok = self.can_cast_batch(abilities, energy, heat, tick, expiry)
+        col = np.where(ok, abilities, 0)
+        np.subtract(energy, np.where(ok, self.energy_cost[col], 0.0), out=energy)
+        np.subtract(stamina, np.where(ok, self.stamina_penalty[col], 0.0), out=stamina)
+        np.add(heat, np.where(ok, self.heat_per_use[col], 0.0), out=heat)
+
+        current = np.take_along_axis(expiry, col[..., None], axis=-1)[..., 0]
+        expires = np.where(ok, tick + self.cooldown_ticks[col], current)
+        np.put_along_axis(expiry, col[..., None], expires[..., None], axis=-1)
+        return ok
+
+    def update_columns(self, energy: np.ndarray, heat: np.ndarray):
+        """Decay heat and regen energy for every player at once (in place)."""
+        np.multiply(heat, self.HEAT_DECAY, out=heat)
+        np.maximum(heat, 0.0, out=heat)
+        np.add(energy, self.energy_regen, out=energy)
+        np.minimum(energy, 100.0, out=energy)
+
+    def _slot(self, player_id: str) -> int:
+        if self.expiry.ndim != 2:
+            raise ValueError("per-player casting needs a single-match table (num_envs=None)")
+        slot = self.slots.get(player_id)
+        if slot is None:
+            slot = self.slots[player_id] = len(self.slots)
+            if slot >= self.expiry.shape[-2]:
+                grown = np.zeros((slot + 1, self.expiry.shape[-1]), dtype=np.int64)
+                grown[:slot] = self.expiry
+                self.expiry = grown
+        return slot
 
-        p_cd = self.cooldowns.get(player.id, {})
-        if tick < p_cd.get(ability_id, 0):
+    def can_cast(self, player: PlayerState, ability_id: str, tick: int) -> bool:
+        col = self.ability_index.get(ability_id)
+        if col is None:
             return False
-
-        return True
+        slot = self._slot(player.id)
+        return bool(self.can_cast_batch(
+            np.array([col]), np.array([player.energy]), np.array([player.heat]), tick,
+            self.expiry[slot:slot + 1],
+        )[0])
 
     def cast(self, player: PlayerState, ability_id: str, tick: int) -> Optional[Ability]:
-        if not self.can_cast(player, ability_id, tick):
+        col = self.ability_index.get(ability_id)
+        if col is None:
+            return None
+        slot = self._slot(player.id)
+        energy = np.array([player.energy])
+        stamina = np.array([player.stamina])
+        heat = np.array([player.heat])
+        if not self.cast_batch(
+            np.array([col]), energy, stamina, heat, tick, self.expiry[slot:slot + 1]
+        )[0]:
             return None
 
-        ability = self.registry[ability_id]
-        player.energy -= ability.energy_cost
-        player.stamina -= ability.stamina_penalty
-        player.heat += ability.heat_per_use
-
-        self.cooldowns.setdefault(player.id, {})[ability_id] = tick + ability.cooldown_ticks
-        return ability
+        player.energy = float(energy[0])
+        player.stamina = float(stamina[0])
+        player.heat = float(heat[0])
+        return self.registry[ability_id]
+
+    def bind(self, player_ids: List[str]):
+        """Map player ids to table rows in slot order (MatchArrays.ids)."""
+        self.slots = {player_id: i for i, player_id in enumerate(player_ids)}
+        if self.expiry.shape[-2] < len(player_ids):
+            self.expiry = np.zeros((len(player_ids), len(self.ability_ids)), dtype=np.int64)
+
+    def reset(self, env_ids: Optional[np.ndarray] = None):
+        if env_ids is None:
+            self.expiry[...] = 0
+        else:
+            self.expiry[env_ids] = 0
+
+    def cooldown_table(self, player_ids: List[str]) -> np.ndarray:
+        """Cooldown expiry ticks as a (players, abilities) array, columns in registry order."""
+        table = np.zeros((len(player_ids), len(self.registry)), dtype=np.int64)
+        for row, player_id in enumerate(player_ids):
+            slot = self.slots.get(player_id)
+            if slot is not None:
+                table[row] = self.expiry[slot]
+        return table
+
+    def load_cooldown_table(self, player_ids: List[str], table: np.ndarray):
+        """Inverse of cooldown_table()."""
+        self.bind(player_ids)
+        self.expiry[...] = 0
+        self.expiry[:len(player_ids)] = table
 
     def update(self, players: List[PlayerState]):
-        """Decay heat and regen energy over time."""
-        for player in players:
-            player.heat = max(0.0, player.heat * 0.99)
-            player.energy = min(100.0, player.energy + 0.2)
+        """Decay heat and regen energy over time (update_columns() on the players' columns)."""
+        energy = np.array([player.energy for player in players], dtype=float)
+        heat = np.array([player.heat for player in players], dtype=float)
+        self.update_columns(energy, heat)
+        for player, e, h in zip(players, energy.tolist(), heat.tolist()):
+            player.energy = e
+            player.heat = h
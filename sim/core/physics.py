@@ -1,32 +1,120 @@
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pymunk
 
+try:
+    # pymunk's raw chipmunk bindings: private, so every use has a public-API fallback
+    from pymunk._chipmunk_cffi import lib as cp
+except ImportError:  # pragma: no cover - depends on the installed pymunk
+    cp = None
+
 from sim.core.rng import DeterministicRNG
 
+PLAYER_MASS = 70.0
+PLAYER_COLLISION = 1  # Shape.collision_type of player circles
+
+# Space counters restore() rewinds in place. The chipmunk build bundled with pymunk 7
+# exports them, but they are not part of pymunk's API; without them restore() falls
+# back to a new Space with freshly built bodies (slower, same trajectories).
+SPACE_REWIND = (
+    "cpSpaceGetShapeIDCounter",
+    "cpSpaceSetShapeIDCounter",
+    "cpSpaceGetTimestamp",
+    "cpSpaceSetTimestamp",
+    "cpSpaceSetCurrentTimeStep",
+)
+REWIND_IN_PLACE = cp is not None and all(hasattr(cp, name) for name in SPACE_REWIND)
+
+# Body accessors read_state()/apply_actions() call on the raw handles when available,
+# skipping pymunk's Vec2d wrapping; otherwise they go through the public Body API.
+BODY_ACCESSORS = ("cpBodyGetPosition", "cpBodyGetVelocity", "cpBodyApplyForceAtLocalPoint")
+RAW_BODY_ACCESS = cp is not None and all(hasattr(cp, name) for name in BODY_ACCESSORS)
+
+
+class ContactBuffer:
+    """
+    Player-player contacts of one physics step, filled by the post-solve handler.
+    Columns live in preallocated arrays (grown by doubling) so a busy tick costs
+    three scalar stores per contact and the referee reads [count] slices.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.slot_a = np.zeros(capacity, dtype=np.int64)
+        self.slot_b = np.zeros(capacity, dtype=np.int64)
+        self.impulse = np.zeros(capacity, dtype=np.float64)
+        self.count = 0
+
+    def clear(self):
+        self.count = 0
+
+    def append(self, a: int, b: int, impulse: float):
+        n = self.count
+        if n == len(self.impulse):
+            for name in ("slot_a", "slot_b", "impulse"):
+                column = getattr(self, name)
+                setattr(self, name, np.concatenate([column, np.zeros_like(column)]))
+        self.slot_a[n] = a
+        self.slot_b[n] = b
+        self.impulse[n] = impulse
+        self.count = n + 1
+
+    def view(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        n = self.count
+        return self.slot_a[:n], self.slot_b[:n], self.impulse[:n]
+
 
 class PhysicsEngine:
     """
     High-fidelity physics simulation for Neon Gridiron using Pymunk.
     Optimized for determinism with fixed DT and bit-identical updates.
+
+    Resets and restores reuse the Space by rewinding chipmunk's internal counters
+    (SPACE_REWIND, reached through pymunk._chipmunk_cffi) when the installed pymunk
+    exports them, and rebuild the Space otherwise (REWIND_IN_PLACE). Bulk reads and
+    forces likewise fall back to the public Body API (RAW_BODY_ACCESS).
     """
 
     def __init__(self, pitch_dim: Tuple[float, float], rng: DeterministicRNG):
         self.width, self.height = pitch_dim
         self.rng = rng
-        self.space = pymunk.Space()
-        self.space.gravity = (0, 0)
-        self.space.damping = 0.95  # Base damping for the entire world
+        self.air_drag = 1.0  # Exponent on the world damping for the ball (set_damping)
 
         self.player_map: Dict[str, Tuple[pymunk.Body, pymunk.Circle]] = {}
         self.ball_elements: Optional[Tuple[pymunk.Body, pymunk.Circle]] = None
+        # Dynamic bodies in spawn order; the solver's pair ordering depends on it.
+        self._spawn_order: List[Tuple[pymunk.Body, pymunk.Circle]] = []
+        # Bodies (and their raw chipmunk handles) in read_state() row order, built lazily.
+        self._rows: Optional[List[pymunk.Body]] = None
+        self._player_bodies: List[pymunk.Body] = []
+        self._readout: List = []
+        self._player_handles: List = []
 
-        self._init_field()
+        # Player slot of each player shape, and the contacts of the last step()
+        self._shape_slots: Dict[pymunk.Shape, int] = {}
+        self.contacts = ContactBuffer()
+        self.space = self._new_space(damping=0.95)  # Base damping for the entire world
 
-    def _init_field(self):
+        if REWIND_IN_PLACE:
+            # Space counters right after the static field is built. Rewinding to these
+            # lets reset_formation() reproduce a freshly constructed engine bit-for-bit.
+            self._shape_id_origin = cp.cpSpaceGetShapeIDCounter(self.space._space)
+            self._stamp_origin = cp.cpSpaceGetTimestamp(self.space._space)
+
+    def _new_space(self, damping: float) -> pymunk.Space:
+        """Empty arena: walls and the player contact handler, no bodies."""
+        space = pymunk.Space()
+        space.gravity = (0, 0)
+        space.damping = damping
+        space.on_collision(
+            PLAYER_COLLISION, PLAYER_COLLISION, post_solve=self._on_player_contact
+        )
+        self._init_field(space)
+        return space
+
+    def _init_field(self, space: pymunk.Space):
         """Create static boundaries of the futuristic neon arena."""
-        static_body = self.space.static_body
+        static_body = space.static_body
 
         # Walls with moderate elasticity
         segments = [
@@ -39,11 +127,24 @@ class PhysicsEngine:
             seg.elasticity = 0.8
             seg.friction = 0.2
             seg.filter = pymunk.ShapeFilter(categories=0b01)
-            self.space.add(seg)
+            space.add(seg)
 
     def spawn_player(self, player_id: str, pos: Tuple[float, float]) -> pymunk.Body:
         """Add a player bot to the physical world."""
-        mass = 70.0
+        body, shape = self._build_player(pos)
+        self._register(player_id, body, shape)
+        self.space.add(body, shape)
+        return body
+
+    def spawn_ball(self, pos: Tuple[float, float]) -> pymunk.Body:
+        """Add the official Neon Ball to the arena."""
+        body, shape = self._build_ball(pos)
+        self._register(None, body, shape)
+        self.space.add(body, shape)
+        return body
+
+    def _build_player(self, pos: Tuple[float, float]) -> Tuple[pymunk.Body, pymunk.Circle]:
+        mass = PLAYER_MASS
         radius = 12.0
         moment = pymunk.moment_for_circle(mass, 0, radius)
 
@@ -54,13 +155,10 @@ class PhysicsEngine:
         shape.elasticity = 0.1
         shape.friction = 0.5
         shape.filter = pymunk.ShapeFilter(categories=0b10)
+        shape.collision_type = PLAYER_COLLISION
+        return body, shape
 
-        self.space.add(body, shape)
-        self.player_map[player_id] = (body, shape)
-        return body
-
-    def spawn_ball(self, pos: Tuple[float, float]) -> pymunk.Body:
-        """Add the official Neon Ball to the arena."""
+    def _build_ball(self, pos: Tuple[float, float]) -> Tuple[pymunk.Body, pymunk.Circle]:
         mass = 0.45
         radius = 8.0
         moment = pymunk.moment_for_circle(mass, 0, radius)
@@ -73,21 +171,177 @@ class PhysicsEngine:
         shape.friction = 0.1
         shape.filter = pymunk.ShapeFilter(categories=0b100)
 
-        self.space.add(body, shape)
-        self.ball_elements = (body, shape)
-        return body
+        if self.air_drag != 1.0:
+            body.velocity_func = self._ball_velocity
+        return body, shape
+
+    def _register(self, player_id: Optional[str], body: pymunk.Body, shape: pymunk.Circle):
+        """Track a built body (player_id None = the ball); adding it to the Space is separate."""
+        if player_id is None:
+            self.ball_elements = (body, shape)
+        else:
+            self._shape_slots[shape] = len(self.player_map)
+            self.player_map[player_id] = (body, shape)
+        self._spawn_order.append((body, shape))
+        self._rows = None
+
+    def set_damping(self, damping: float, air_drag: float = 1.0):
+        """
+        World damping (fraction of velocity kept per second) and the ball's air drag.
+        The ball keeps damping ** air_drag instead, so air_drag < 1 makes it roll further.
+        """
+        self.space.damping = damping
+        self.air_drag = air_drag
+        if air_drag != 1.0 and self.ball_elements is not None:
+            self.ball_elements[0].velocity_func = self._ball_velocity
+
+    def _ball_velocity(self, body: pymunk.Body, gravity, damping: float, dt: float):
+        pymunk.Body.update_velocity(body, gravity, damping ** self.air_drag, dt)
+
+    def reset_formation(
+        self,
+        ball_pos: Tuple[float, float],
+        player_positions: Dict[str, Tuple[float, float]],
+    ):
+        """
+        Put every spawned body back into a kickoff formation, reusing the same Space.
+        Positions are restored, velocities, spin and forces are cleared.
+        """
+        bodies = self._row_bodies()
+        record = np.zeros((len(bodies), 6), dtype=np.float64)
+        for row, body in enumerate(bodies):
+            record[row, 0:2] = body.position
+        if self.ball_elements is not None:
+            record[0, 0:2] = ball_pos
+        for player_id, pos in player_positions.items():
+            record[bodies.index(self.player_map[player_id][0]), 0:2] = pos
+        self.restore(record)
+
+    def snapshot(self) -> np.ndarray:
+        """
+        Compact (rows, 6) record of every body in read_state() order:
+        x, y, vx, vy, angle, angular velocity.
+        Read-only: the Space is untouched, so this engine steps on exactly as it would
+        have without the snapshot (warm solver caches included).
+        """
+        return np.array(
+            [
+                (*body.position, *body.velocity, body.angle, body.angular_velocity)
+                for body in self._row_bodies()
+            ],
+            dtype=np.float64,
+        )
+
+    def canonicalize(self) -> np.ndarray:
+        """
+        snapshot() and rebuild the live Space from it, dropping the solver's warm-start
+        caches, so this engine continues exactly like any engine restore()d from the
+        returned record.
+        """
+        record = self.snapshot()
+        self.restore(record)
+        return record
+
+    def restore(self, record: np.ndarray):
+        """
+        Rebuild the Space around a snapshot() record, as if freshly spawned there.
+        Every engine restored from the same record steps identically afterwards.
+        """
+        bodies = self._row_bodies()
+        if record.shape != (len(bodies), 6):
+            raise ValueError(f"Snapshot shape {record.shape} does not match {len(bodies)} bodies")
+
+        if REWIND_IN_PLACE:
+            space = self.space
+            shapes = [shape for _, shape in self._spawn_order]
+
+            # Dropping the shapes discards cached arbiters and empties the dynamic tree.
+            # A shape-less micro step then zeroes the solver's position-bias velocities,
+            # which pymunk does not expose directly.
+            space.remove(*shapes)
+            space.step(1e-300)
+            space.remove(*bodies)
+
+            cp.cpSpaceSetShapeIDCounter(space._space, self._shape_id_origin)
+            cp.cpSpaceSetTimestamp(space._space, self._stamp_origin)
+            cp.cpSpaceSetCurrentTimeStep(space._space, 0.0)
+        else:
+            bodies = self._rebuild_space()
+
+        for body, (x, y, vx, vy, angle, spin) in zip(bodies, record.tolist()):
+            body.position = (x, y)
+            body.velocity = (vx, vy)
+            body.angle = angle
+            body.angular_velocity = spin
+            body.force = (0.0, 0.0)
+            body.torque = 0.0
+
+        # Re-adding in spawn order rebuilds the spatial index exactly as spawning did.
+        for body, shape in self._spawn_order:
+            self.space.add(body, shape)
+        self.contacts.clear()
+
+    def _rebuild_space(self) -> List[pymunk.Body]:
+        """
+        restore() without SPACE_REWIND: a new Space and newly built bodies, registered
+        in the old spawn order but not added yet. Returns them in read_state() order.
+        """
+        player_ids = {id(body): player_id for player_id, (body, _) in self.player_map.items()}
+        spawned = [player_ids.get(id(body)) for body, _ in self._spawn_order]
+
+        self.space = self._new_space(self.space.damping)
+        self.player_map = {}
+        self.ball_elements = None
+        self._spawn_order = []
+        self._shape_slots = {}
+        for player_id in spawned:
+            build = self._build_ball if player_id is None else self._build_player
+            self._register(player_id, *build((0.0, 0.0)))
+        return self._row_bodies()
 
     def step(self, dt: float):
-        """Advance simulation by a fixed time step."""
+        """Advance simulation by a fixed time step; self.contacts holds its player contacts."""
         # Custom logic for Magnus effect and drag can go here
+        self.contacts.clear()
         self.space.step(dt)
 
+    def _on_player_contact(self, arbiter: pymunk.Arbiter, space: pymunk.Space, data):
+        # Only the impact counts, not the resting contact of players leaning on each other.
+        # Severity is the impact speed (px/s) the two players came together at: an impulse J
+        # changes the closing speed of two PLAYER_MASS bodies by 2J/m, and (1 + e) of the
+        # incoming speed is taken out.
+        if arbiter.is_first_contact:
+            a, b = arbiter.shapes
+            self.contacts.append(
+                self._shape_slots[a], self._shape_slots[b],
+                arbiter.total_impulse.length * 2.0
+                / (PLAYER_MASS * (1.0 + arbiter.restitution)),
+            )
+
     def apply_action(self, player_id: str, force: Tuple[float, float], dash: bool = False):
         """Apply normalized bot actions into physics forces."""
         body, _ = self.player_map[player_id]
         multiplier = 2000.0 if not dash else 5000.0
         body.apply_force_at_local_point((force[0] * multiplier, force[1] * multiplier))
 
+    def apply_actions(self, forces: np.ndarray, dash: np.ndarray, active: np.ndarray):
+        """
+        Bulk apply_action() over all players in spawn order.
+        forces is (players, 2) normalized float32; dash and active are boolean masks.
+        """
+        self._row_bodies()
+        mult = np.where(dash, np.float32(5000.0), np.float32(2000.0))
+        scaled = (forces * mult[:, None]).tolist()
+        if not RAW_BODY_ACCESS:
+            bodies = self._player_bodies
+            for i in np.flatnonzero(active).tolist():
+                bodies[i].apply_force_at_local_point(scaled[i])
+            return
+        apply = cp.cpBodyApplyForceAtLocalPoint
+        handles = self._player_handles
+        for i in np.flatnonzero(active).tolist():
+            apply(handles[i], scaled[i], (0.0, 0.0))
+
     def apply_ball_impulse(self, force: Tuple[float, float]):
         """Apply a directed impulse to the ball."""
         if self.ball_elements:
@@ -103,3 +357,40 @@ class PhysicsEngine:
             return np.zeros(2), np.zeros(2)
         body, _ = self.ball_elements
         return np.array(body.position), np.array(body.velocity)
+
+    def _row_bodies(self) -> List[pymunk.Body]:
+        """Bodies in read_state() row order: ball first, then players in spawn order."""
+        if self._rows is None:
+            bodies = [body for body, _ in self.player_map.values()]
+            if self.ball_elements is not None:
+                bodies.insert(0, self.ball_elements[0])
+            self._rows = bodies
+            self._player_bodies = [body for body, _ in self.player_map.values()]
+            if RAW_BODY_ACCESS:
+                self._readout = [body._body for body in bodies]
+                self._player_handles = [body._body for body in self._player_bodies]
+        return self._rows
+
+    def read_state(self, out: np.ndarray) -> np.ndarray:
+        """
+        Bulk readout of every body into a preallocated (1 + num_players, 4) array.
+        Row 0 is the ball, rows 1.. follow player spawn order; columns are x, y, vx, vy.
+        """
+        if self._rows is None:
+            self._row_bodies()
+
+        flat = []
+        if not RAW_BODY_ACCESS:
+            for body in self._rows:
+                flat += (*body.position, *body.velocity)
+            out.flat[:] = flat
+            return out
+
+        # Reading through the chipmunk handles skips a Vec2d per property access
+        get_pos, get_vel = cp.cpBodyGetPosition, cp.cpBodyGetVelocity
+        for handle in self._readout:
+            p = get_pos(handle)
+            v = get_vel(handle)
+            flat += (p.x, p.y, v.x, v.y)
+        out.flat[:] = flat
+        return out
@@ -0,0 +1,90 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from sim.core.physics import PhysicsEngine
+from sim.core.rng import DeterministicRNG
+
+
+class PhysicsBatch:
+    """
+    K independent PhysicsEngine worlds stepped together on a thread pool.
+    Chipmunk runs through cffi, which releases the GIL for the C step, so worlds
+    advance in parallel inside one process. Actions go in and states come out as
+    bulk [K, ...] arrays; each world keeps its own Space and stays deterministic.
+    """
+
+    def __init__(
+        self,
+        num_worlds: int,
+        ball_pos: Tuple[float, float],
+        player_positions: Dict[str, Tuple[float, float]],
+        pitch_dim: Tuple[float, float] = (600.0, 400.0),
+        seed: int = 0,
+        max_workers: Optional[int] = None,
+    ):
+        self.num_worlds = num_worlds
+        self.ball_pos = ball_pos
+        self.player_positions = dict(player_positions)
+        self.engines: List[PhysicsEngine] = []
+        for k in range(num_worlds):
+            engine = PhysicsEngine(pitch_dim, DeterministicRNG(seed + k))
+            engine.spawn_ball(ball_pos)
+            for player_id, pos in self.player_positions.items():
+                engine.spawn_player(player_id, pos)
+            self.engines.append(engine)
+
+        num_players = len(self.player_positions)
+        # [K, 1 + players, 4] in read_state() row order: ball, then players
+        self.state = np.zeros((num_worlds, 1 + num_players, 4))
+        workers = max(1, min(max_workers or os.cpu_count() or 1, num_worlds))
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+        # One task per worker keeps the pool overhead per tick constant
+        bounds = np.linspace(0, num_worlds, workers + 1).astype(int).tolist()
+        self._chunks = [range(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:])]
+        self.read_state()
+
+    def reset(self) -> np.ndarray:
+        """Put every world back into the kickoff formation."""
+        for engine in self.engines:
+            engine.reset_formation(self.ball_pos, self.player_positions)
+        return self.read_state()
+
+    def step(
+        self,
+        forces: np.ndarray,
+        dash: Optional[np.ndarray] = None,
+        active: Optional[np.ndarray] = None,
+        dt: float = 1.0 / 60.0,
+    ) -> np.ndarray:
+        """
+        Apply [K, players, 2] normalized forces (PhysicsEngine.apply_actions semantics,
+        optional [K, players] dash/active masks), advance every world by dt and return
+        the refreshed [K, 1 + players, 4] state.
+        """
+        shape = forces.shape[:2]
+        dash = np.zeros(shape, dtype=bool) if dash is None else dash
+        active = np.ones(shape, dtype=bool) if active is None else active
+
+        def run(chunk: range):
+            for k in chunk:
+                engine = self.engines[k]
+                engine.apply_actions(forces[k], dash[k], active[k])
+                engine.step(dt)
+                engine.read_state(self.state[k])
+
+        for future in [self._pool.submit(run, chunk) for chunk in self._chunks]:
+            future.result()
+        return self.state
+
+    def read_state(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Bulk readout of every world into a [K, 1 + players, 4] array."""
+        out = self.state if out is None else out
+        for engine, rows in zip(self.engines, out):
+            engine.read_state(rows)
+        return out
+
+    def close(self):
+        self._pool.shutdown(wait=True)
@@ -1,47 +1,161 @@
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 from sim.core.events import MatchEvent
 
+# Cards are only ever issued in this order, so a count encodes a player's list
+CARD_ORDER = ("YELLOW", "RED")
+
+
+def _first_in_run(flags: np.ndarray, same_as_prev: np.ndarray) -> np.ndarray:
+    """First True of each actor's run; flags are actor-sorted and monotone within a run."""
+    prev = np.zeros_like(flags)
+    prev[1:] = flags[:-1] & same_as_prev
+    return flags & ~prev
+
 
 class Referee:
     """
     Manages fair play, fouls, and penalty cards.
     Tracks player aggression and enforces discipline.
+    Penalty points and card counts are per-slot arrays (bind() maps player ids to
+    slots), and a tick's contacts are judged together by process_contacts().
+    Contact severity is the impact speed in px/s (PhysicsEngine.contacts); the default
+    foul_threshold books roughly the harder half of the contacts of players chasing
+    the ball, and none of the light bumps of aimless play.
     """
 
-    def __init__(self, foul_threshold: float = 15.0):
+    def __init__(
+        self,
+        foul_threshold: float = 40.0,
+        yellow_limit: float = 40.0,
+        red_limit: float = 100.0,
+        num_players: int = 14,
+    ):
         self.foul_threshold = foul_threshold
-        self.penalty_points: Dict[str, float] = {}  # player_id -> cumulative_points
-        self.cards: Dict[str, List[str]] = {}  # player_id -> ["YELLOW", "RED"]
+        self.yellow_limit = yellow_limit
+        self.red_limit = red_limit
+        self.points = np.zeros(num_players)  # cumulative penalty points per slot
+        self.cards = np.zeros(num_players, dtype=np.int8)  # cards issued, in CARD_ORDER
+        self.player_ids: List[str] = []
+        self.slots: Dict[str, int] = {}
+
+    def bind(self, player_ids: List[str]):
+        """Map player ids to slots (MatchArrays.ids order)."""
+        self.player_ids = list(player_ids)
+        self.slots = {player_id: i for i, player_id in enumerate(self.player_ids)}
+        if len(self.points) < len(self.player_ids):
+            self.points = np.zeros(len(self.player_ids))
+            self.cards = np.zeros(len(self.player_ids), dtype=np.int8)
+
+    def _slot(self, player_id: str) -> int:
+        slot = self.slots.get(player_id)
+        if slot is None:
+            slot = self.slots[player_id] = len(self.player_ids)
+            self.player_ids.append(player_id)
+            if slot >= len(self.points):
+                self.points = np.append(self.points, 0.0)
+                self.cards = np.append(self.cards, np.int8(0))
+        return slot
 
     def process_collision(
         self, actor_id: str, target_id: str, impulse: float, tick: int
     ) -> List[MatchEvent]:
         """Analyze a physical collision for foul potential."""
-        events = []
-        if impulse > self.foul_threshold:
-            # Calculate penalty logic (e.g., from collision severity)
-            points = (impulse - self.foul_threshold) / 2.0
-            self.penalty_points[actor_id] = self.penalty_points.get(actor_id, 0.0) + points
+        slots = np.array([self._slot(actor_id), self._slot(target_id)])
+        return self.process_contacts(slots[:1], slots[1:], np.array([impulse]), tick)
+
+    def process_contacts(
+        self,
+        slot_a: np.ndarray,
+        slot_b: np.ndarray,
+        impulse: np.ndarray,
+        tick: int,
+        velocities: Optional[np.ndarray] = None,
+        positions: Optional[np.ndarray] = None,
+    ) -> List[MatchEvent]:
+        """
+        Judge a tick's contacts (e.g. PhysicsEngine.contacts) in one pass.
+        With [P, 2] velocities and positions from before the contact, the player
+        moving harder into the other is the offender; otherwise slot_a is. Contacts
+        count in buffer order, exactly as repeated process_collision() calls would.
+        """
+        foul = impulse > self.foul_threshold
+        if not foul.any():
+            return []
+        actor, target, severity = slot_a[foul], slot_b[foul], impulse[foul]
+        if velocities is not None:
+            normal = positions[target] - positions[actor]
+            push_actor = (velocities[actor] * normal).sum(1)
+            push_target = -(velocities[target] * normal).sum(1)
+            swap = push_target > push_actor
+            actor, target = np.where(swap, target, actor), np.where(swap, actor, target)
+        if max(actor.max(), target.max()) >= len(self.player_ids):
+            raise IndexError("contact slot is not bound to a player; call bind() first")
 
+        # Running total of each offender through the tick's fouls, in actor-sorted order
+        points = (severity - self.foul_threshold) / 2.0
+        order = np.argsort(actor, kind="stable")
+        sorted_actor, sorted_points = actor[order], points[order]
+        same_as_prev = sorted_actor[1:] == sorted_actor[:-1]
+        running = np.cumsum(sorted_points)
+        starts = np.flatnonzero(np.r_[True, ~same_as_prev])
+        run_base = np.repeat(
+            running[starts] - sorted_points[starts], np.diff(np.r_[starts, len(order)])
+        )
+        cumulative = self.points[sorted_actor] + running - run_base
+        np.add.at(self.points, actor, points)
+
+        # A yellow needs a clean record; a red needs a yellow from an earlier foul
+        held = self.cards[sorted_actor]
+        yellow_zone = (held == 0) & (cumulative > self.yellow_limit)
+        after_yellow = np.zeros_like(yellow_zone)
+        after_yellow[1:] = yellow_zone[:-1] & same_as_prev
+        red_zone = (cumulative > self.red_limit) & ((held == 1) | after_yellow)
+        yellow = np.zeros(len(actor), dtype=bool)
+        red = np.zeros(len(actor), dtype=bool)
+        yellow[order] = _first_in_run(yellow_zone, same_as_prev)
+        red[order] = _first_in_run(red_zone, same_as_prev)
+        np.add.at(self.cards, actor, yellow.astype(np.int8) + red.astype(np.int8))
+
+        events = []
+        ids = self.player_ids
+        for a, t, s, y, r in zip(
+            actor.tolist(), target.tolist(), severity.tolist(), yellow.tolist(), red.tolist()
+        ):
+            actor_id = ids[a]
             events.append(
                 MatchEvent(
                     event_id=f"foul_{tick}_{actor_id}",
                     tick=tick,
                     event_type="FOUL",
                     actor_id=actor_id,
-                    target_id=target_id,
-                    params={"severity": impulse},
+                    target_id=ids[t],
+                    params={"severity": s},
                 )
             )
-
-            # Disciplinary checks
-            cumulative = self.penalty_points[actor_id]
-            if cumulative > 40.0 and actor_id not in self.cards:
-                self.cards[actor_id] = ["YELLOW"]
+            if y:
                 events.append(MatchEvent(f"y_{tick}", tick, "YELLOW", actor_id))
-            elif cumulative > 100.0 and "RED" not in self.cards.get(actor_id, []):
-                self.cards.setdefault(actor_id, []).append("RED")
+            elif r:
                 events.append(MatchEvent(f"r_{tick}", tick, "RED", actor_id))
-
         return events
+
+    def reset(self):
+        self.points[:] = 0.0
+        self.cards[:] = 0
+
+    def discipline_table(self, player_ids: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-player penalty points and number of cards issued, in player_ids order."""
+        slots = [self.slots.get(pid) for pid in player_ids]
+        points = np.array([0.0 if s is None else self.points[s] for s in slots])
+        cards = np.array([0 if s is None else self.cards[s] for s in slots], dtype=np.int8)
+        return points, cards
+
+    def load_discipline_table(self, player_ids: List[str], points: np.ndarray, cards: np.ndarray):
+        """Inverse of discipline_table()."""
+        self.reset()
+        for pid, p, n in zip(player_ids, points.tolist(), cards.tolist()):
+            slot = self._slot(pid)
+            self.points[slot] = p
+            self.cards[slot] = n
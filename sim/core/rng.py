@@ -19,6 +19,14 @@ class DeterministicRNG:
             self.seed = seed
         self.gen = np.random.default_rng(self.seed)
 
+    def get_state(self) -> dict:
+        """Capture the generator state, e.g. for match snapshots."""
+        return self.gen.bit_generator.state
+
+    def set_state(self, state: dict):
+        """Resume from a state captured with get_state()."""
+        self.gen.bit_generator.state = state
+
     def float(self, low: float = 0.0, high: float = 1.0) -> float:
         return self.gen.uniform(low, high)
 
@@ -2,6 +2,7 @@ from typing import Optional, Tuple
 
 import numpy as np
 
+from sim.core.spatial import SpatialContext
 from sim.core.state import TeamID
 
 
@@ -14,13 +15,18 @@ class RulesEngine:
     def __init__(self, pitch_dim: Tuple[float, float]):
         self.width, self.height = pitch_dim
         self.goal_width = 80.0  # From Y=160 to Y=240
+        self.interaction_radius = 20.0
         self.goal_y_range = (
             self.height / 2 - self.goal_width / 2,
             self.height / 2 + self.goal_width / 2,
         )
 
-    def check_goal(self, ball_pos: np.ndarray) -> Optional[TeamID]:
-        """Verify if a goal event occurred."""
+    def check_goal(
+        self, ball_pos: np.ndarray, *, prev_pos: Optional[np.ndarray] = None
+    ) -> Optional[TeamID]:
+        """Verify if a goal event occurred (swept from prev_pos when given)."""
+        if prev_pos is not None:
+            return self.goal_crossing(prev_pos=prev_pos, ball_pos=ball_pos)[0]
         x, y = ball_pos
         if self.goal_y_range[0] < y < self.goal_y_range[1]:
             if x <= 0:
@@ -29,10 +35,39 @@ class RulesEngine:
                 return TeamID.BLUE  # Red team conceded
         return None
 
+    def goal_crossing(
+        self, *, prev_pos: np.ndarray, ball_pos: np.ndarray
+    ) -> Tuple[Optional[TeamID], float]:
+        """
+        Swept goal check over the ball's path this tick, prev_pos -> ball_pos.
+        A ball that tunnels through the end wall still scores if the point where it
+        crossed the line is inside the mouth. Returns the scoring team (or None) and
+        the fraction of the tick at which the ball reached the line (1.0 if it did not).
+        """
+        x0, y0 = float(prev_pos[0]), float(prev_pos[1])
+        x1, y1 = float(ball_pos[0]), float(ball_pos[1])
+        if x0 > 0.0 >= x1:
+            team, t = TeamID.RED, x0 / (x0 - x1)  # Blue team conceded
+        elif x0 < self.width <= x1:
+            team, t = TeamID.BLUE, (self.width - x0) / (x1 - x0)  # Red team conceded
+        else:
+            # No crossing this tick: a ball already on the line is judged where it ends
+            return self.check_goal(ball_pos), 1.0
+        y = y0 + t * (y1 - y0)
+        return (team if self.goal_y_range[0] < y < self.goal_y_range[1] else None), t
+
     def check_tackle(self, p1_pos: np.ndarray, p2_pos: np.ndarray) -> bool:
         """Detect if a tackle attempt is physically possible."""
         return np.linalg.norm(p1_pos - p2_pos) < 25.0
 
-    def check_interaction(self, player_pos: np.ndarray, ball_pos: np.ndarray) -> bool:
+    def check_interaction(
+        self,
+        player_pos: np.ndarray,
+        ball_pos: np.ndarray,
+        spatial: Optional[SpatialContext] = None,
+        slot: Optional[int] = None,
+    ) -> bool:
         """Verify if player is close enough to interact with the ball."""
-        return np.linalg.norm(player_pos - ball_pos) < 20.0
+        if spatial is not None and slot is not None:
+            return spatial.in_reach(slot, self.interaction_radius)
+        return np.linalg.norm(player_pos - ball_pos) < self.interaction_radius
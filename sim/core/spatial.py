@@ -0,0 +1,68 @@
+from functools import cached_property
+from typing import Optional
+
+import numpy as np
+
+from sim.core.state import MatchArrays, MatchState
+
+
+class SpatialContext:
+    """
+    Distances of one tick, computed once and shared by rules, rewards and analysis.
+    Row/column 0 of `distances` is the ball, 1.. are player slots, so
+    `distances[0, 1:]` (also `ball_dist`) is every player's distance to the ball.
+    Positions are copied at construction and every query is derived lazily on first
+    use, so ticks that never ask about distances pay only for the copy.
+    """
+
+    def __init__(self, arrays: MatchArrays, tick: int = 0, interaction_radius: float = 20.0):
+        self.tick = tick
+        self.interaction_radius = interaction_radius
+        self.team = arrays.team.copy()
+        self.pos = arrays.kinematics[:, 0:2].copy()
+
+    @classmethod
+    def from_state(cls, state: MatchState, interaction_radius: float = 20.0) -> "SpatialContext":
+        return cls(state.columns(), state.tick, interaction_radius)
+
+    @staticmethod
+    def _nearest(dists: np.ndarray, mask: np.ndarray) -> np.ndarray:
+        masked = np.where(mask, dists, np.inf)
+        nearest = masked.argmin(axis=1)
+        return np.where(mask.any(axis=1), nearest, -1)
+
+    @cached_property
+    def distances(self) -> np.ndarray:
+        delta = self.pos[:, None, :] - self.pos[None, :, :]
+        return np.sqrt((delta * delta).sum(axis=2))
+
+    @cached_property
+    def ball_dist(self) -> np.ndarray:
+        return self.distances[0, 1:]
+
+    @cached_property
+    def nearest_teammate(self) -> np.ndarray:
+        """Slot of each player's nearest teammate (-1 for a one-player team)."""
+        same_team = self.team[:, None] == self.team[None, :]
+        np.fill_diagonal(same_team, False)
+        return self._nearest(self.distances[1:, 1:], same_team)
+
+    @cached_property
+    def nearest_opponent(self) -> np.ndarray:
+        """Slot of each player's nearest opponent (-1 when the other side is empty)."""
+        return self._nearest(self.distances[1:, 1:], self.team[:, None] != self.team[None, :])
+
+    @cached_property
+    def owner_candidates(self) -> np.ndarray:
+        """Slots within interaction range of the ball, nearest first."""
+        in_range = np.flatnonzero(self.ball_dist < self.interaction_radius)
+        return in_range[np.argsort(self.ball_dist[in_range], kind="stable")]
+
+    @property
+    def owner(self) -> int:
+        """Slot of the player nearest the ball within interaction range, or -1."""
+        return int(self.owner_candidates[0]) if len(self.owner_candidates) else -1
+
+    def in_reach(self, slot: int, radius: Optional[float] = None) -> bool:
+        radius = self.interaction_radius if radius is None else radius
+        return bool(self.ball_dist[slot] < radius)
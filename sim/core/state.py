@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -58,27 +58,271 @@ class PlayerRole(Enum):
     FWD = "FORWARD"
 
 
-@dataclass
+# Integer codes used by the columnar MatchArrays (team code == TeamID.value)
+TEAM_BY_CODE = tuple(TeamID)
+ROLE_BY_CODE = tuple(PlayerRole)
+ROLE_CODES = {role: code for code, role in enumerate(ROLE_BY_CODE)}
+
+
+class MatchArrays:
+    """
+    Struct-of-arrays storage for the ball and every player of a match.
+    Row 0 of `kinematics` is the ball, rows 1.. are players as [x, y, vx, vy];
+    `pos`/`vel` and the per-player columns are indexed by player slot.
+    """
+
+    def __init__(self, num_players: int = 14):
+        self.num_players = num_players
+        self.kinematics = np.zeros((num_players + 1, 4), dtype=np.float64)
+        self._bind_views()
+
+        self.stamina = np.full(num_players, 100.0)
+        self.energy = np.full(num_players, 100.0)
+        self.heat = np.zeros(num_players)
+        self.team = np.zeros(num_players, dtype=np.int8)
+        self.role = np.full(num_players, ROLE_CODES[PlayerRole.MID], dtype=np.int8)
+        self.ids: List[str] = [""] * num_players
+
+    def _bind_views(self):
+        self.ball_pos = self.kinematics[0, 0:2]
+        self.ball_vel = self.kinematics[0, 2:4]
+        self.pos = self.kinematics[1:, 0:2]
+        self.vel = self.kinematics[1:, 2:4]
+
+    # Copies and pickles carry the owning arrays only; the views are rebuilt over them
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        for name in ("ball_pos", "ball_vel", "pos", "vel"):
+            del state[name]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._bind_views()
+
+    def team_mask(self, team: TeamID) -> np.ndarray:
+        return self.team == team.value
+
+    def index_of(self, player_id: str) -> Optional[int]:
+        try:
+            return self.ids.index(player_id)
+        except ValueError:
+            return None
+
+    @classmethod
+    def from_players(cls, players: List[PlayerState], ball: BallState) -> MatchArrays:
+        """Gather standalone player/ball objects into a fresh table (copies, not views)."""
+        arrays = cls(len(players))
+        arrays.kinematics[0, 0:2] = ball.pos
+        arrays.kinematics[0, 2:4] = ball.vel
+        for i, p in enumerate(players):
+            arrays.pos[i] = p.pos
+            arrays.vel[i] = p.vel
+            arrays.stamina[i] = p.stamina
+            arrays.energy[i] = p.energy
+            arrays.heat[i] = p.heat
+            arrays.team[i] = p.team.value
+            arrays.role[i] = ROLE_CODES[p.role]
+            arrays.ids[i] = p.id
+        return arrays
+
+
 class PlayerState:
-    id: str
-    team: TeamID
-    role: PlayerRole = PlayerRole.MID
-    pos: np.ndarray = field(default_factory=lambda: np.zeros(2))
-    vel: np.ndarray = field(default_factory=lambda: np.zeros(2))
-    stamina: float = 100.0  # Current stamina (short-term)
-    energy: float = 100.0   # Total energy (long-term fatigue)
-    heat: float = 0.0
-    active_tags: List[str] = field(default_factory=list)
-    dash_cooldown: int = 0
+    """
+    One player's view over a MatchArrays row.
+    Built directly it owns a private single-row table, so it still behaves like a record.
+    """
+
+    __slots__ = ("id", "active_tags", "dash_cooldown", "_arrays", "_row", "_pos", "_vel")
+
+    def __init__(
+        self,
+        id: str,
+        team: TeamID,
+        role: PlayerRole = PlayerRole.MID,
+        pos: Optional[np.ndarray] = None,
+        vel: Optional[np.ndarray] = None,
+        stamina: float = 100.0,
+        energy: float = 100.0,
+        heat: float = 0.0,
+        active_tags: Optional[List[str]] = None,
+        dash_cooldown: int = 0,
+    ):
+        self._bind(MatchArrays(1), 0, id)
+        self.team = team
+        self.role = role
+        if pos is not None:
+            self.pos = pos
+        if vel is not None:
+            self.vel = vel
+        self.stamina = stamina
+        self.energy = energy
+        self.heat = heat
+        self.active_tags = active_tags if active_tags is not None else []
+        self.dash_cooldown = dash_cooldown
+
+    @classmethod
+    def view(cls, arrays: MatchArrays, row: int, player_id: str) -> PlayerState:
+        """Attach to an existing table row without touching its values."""
+        player = cls.__new__(cls)
+        player._bind(arrays, row, player_id)
+        player.active_tags = []
+        player.dash_cooldown = 0
+        return player
+
+    def _bind(self, arrays: MatchArrays, row: int, player_id: str):
+        self.id = player_id
+        self._arrays = arrays
+        self._row = row
+        self._pos = arrays.pos[row]
+        self._vel = arrays.vel[row]
+        arrays.ids[row] = player_id
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "active_tags": self.active_tags,
+            "dash_cooldown": self.dash_cooldown,
+            "arrays": self._arrays,
+            "row": self._row,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self._bind(state["arrays"], state["row"], state["id"])
+        self.active_tags = state["active_tags"]
+        self.dash_cooldown = state["dash_cooldown"]
+
+    @property
+    def pos(self) -> np.ndarray:
+        return self._pos
+
+    @pos.setter
+    def pos(self, value: np.ndarray):
+        self._pos[...] = value
+
+    @property
+    def vel(self) -> np.ndarray:
+        return self._vel
+
+    @vel.setter
+    def vel(self, value: np.ndarray):
+        self._vel[...] = value
+
+    @property
+    def stamina(self) -> float:
+        return float(self._arrays.stamina[self._row])
+
+    @stamina.setter
+    def stamina(self, value: float):
+        self._arrays.stamina[self._row] = value
+
+    @property
+    def energy(self) -> float:
+        return float(self._arrays.energy[self._row])
+
+    @energy.setter
+    def energy(self, value: float):
+        self._arrays.energy[self._row] = value
+
+    @property
+    def heat(self) -> float:
+        return float(self._arrays.heat[self._row])
+
+    @heat.setter
+    def heat(self, value: float):
+        self._arrays.heat[self._row] = value
+
+    @property
+    def team(self) -> TeamID:
+        return TEAM_BY_CODE[self._arrays.team[self._row]]
+
+    @team.setter
+    def team(self, value: TeamID):
+        self._arrays.team[self._row] = value.value
+
+    @property
+    def role(self) -> PlayerRole:
+        return ROLE_BY_CODE[self._arrays.role[self._row]]
+
+    @role.setter
+    def role(self, value: PlayerRole):
+        self._arrays.role[self._row] = ROLE_CODES[value]
+
+    def __repr__(self) -> str:
+        return (
+            f"PlayerState(id={self.id!r}, team={self.team}, role={self.role}, "
+            f"pos={self.pos.tolist()}, stamina={self.stamina:.2f})"
+        )
 
 
-@dataclass
 class BallState:
-    pos: np.ndarray = field(default_factory=lambda: np.zeros(2))
-    vel: np.ndarray = field(default_factory=lambda: np.zeros(2))
-    spin: float = 0.0
-    last_touch_id: Optional[str] = None
-    last_touch_team: Optional[TeamID] = None
+    """Ball view over row 0 of a MatchArrays table (private table when built directly)."""
+
+    __slots__ = ("spin", "last_touch_id", "last_touch_team", "_arrays", "_pos", "_vel")
+
+    def __init__(
+        self,
+        pos: Optional[np.ndarray] = None,
+        vel: Optional[np.ndarray] = None,
+        spin: float = 0.0,
+        last_touch_id: Optional[str] = None,
+        last_touch_team: Optional[TeamID] = None,
+    ):
+        self._bind(MatchArrays(0))
+        if pos is not None:
+            self.pos = pos
+        if vel is not None:
+            self.vel = vel
+        self.spin = spin
+        self.last_touch_id = last_touch_id
+        self.last_touch_team = last_touch_team
+
+    @classmethod
+    def view(cls, arrays: MatchArrays) -> BallState:
+        ball = cls.__new__(cls)
+        ball._bind(arrays)
+        ball.spin = 0.0
+        ball.last_touch_id = None
+        ball.last_touch_team = None
+        return ball
+
+    def _bind(self, arrays: MatchArrays):
+        self._arrays = arrays
+        self._pos = arrays.ball_pos
+        self._vel = arrays.ball_vel
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {
+            "spin": self.spin,
+            "last_touch_id": self.last_touch_id,
+            "last_touch_team": self.last_touch_team,
+            "arrays": self._arrays,
+        }
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self._bind(state["arrays"])
+        self.spin = state["spin"]
+        self.last_touch_id = state["last_touch_id"]
+        self.last_touch_team = state["last_touch_team"]
+
+    @property
+    def pos(self) -> np.ndarray:
+        return self._pos
+
+    @pos.setter
+    def pos(self, value: np.ndarray):
+        self._pos[...] = value
+
+    @property
+    def vel(self) -> np.ndarray:
+        return self._vel
+
+    @vel.setter
+    def vel(self, value: np.ndarray):
+        self._vel[...] = value
+
+    def __repr__(self) -> str:
+        return f"BallState(pos={self.pos.tolist()}, vel={self.vel.tolist()})"
 
 
 @dataclass
@@ -119,3 +363,33 @@ class MatchState:
     spectacle_score: float = 0.0
     physics_dt: float = 1.0 / 60.0
     config: Optional[MatchConfig] = None
+
+    # Columnar backing store; `players`/`ball` are views into it when set
+    arrays: Optional[MatchArrays] = None
+
+    def columns(self) -> MatchArrays:
+        """Columnar view of the match, gathered on the fly for hand-built states."""
+        if self.arrays is not None:
+            return self.arrays
+        return MatchArrays.from_players(self.players, self.ball)
+
+
+@dataclass(frozen=True)
+class MatchSnapshot:
+    """
+    Compact array record of a running match, for lookahead and what-if forks.
+    Rows follow MatchArrays slots (bodies: ball first, then players).
+    """
+
+    tick: int
+    step_count: int
+    score: Tuple[int, int]
+    bodies: np.ndarray  # (15, 6) x, y, vx, vy, angle, angular velocity
+    resources: np.ndarray  # (14, 3) stamina, energy, heat
+    cooldowns: np.ndarray  # (14, abilities) cooldown expiry ticks
+    penalty_points: np.ndarray  # (14,)
+    cards: np.ndarray  # (14,) cards issued so far
+    rng_state: Dict[str, Any]
+    analyst_state: Dict[str, Any]  # TacticalAnalyst possession windows
+    possession_team: Optional[TeamID] = None
+    possession_player_id: Optional[str] = None
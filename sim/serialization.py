@@ -15,6 +15,7 @@ class SimulationEncoder:
     @staticmethod
     def to_dict(state: MatchState) -> Dict[str, Any]:
         """Convert MatchState to a versioned flat structure."""
+        cols = state.columns()
         return {
             "v": "2.1.0",
             "t": state.tick,
@@ -26,15 +27,23 @@ class SimulationEncoder:
             },
             "p": [
                 {
-                    "id": p.id,
-                    "team": p.team.value,
-                    "pos": p.pos.tolist(),
-                    "vel": p.vel.tolist(),
-                    "stm": round(p.stamina, 2),
-                    "en": round(p.energy, 1),
-                    "ht": round(p.heat, 1),
+                    "id": pid,
+                    "team": team,
+                    "pos": pos,
+                    "vel": vel,
+                    "stm": round(stm, 2),
+                    "en": round(en, 1),
+                    "ht": round(ht, 1),
                 }
-                for p in state.players
+                for pid, team, pos, vel, stm, en, ht in zip(
+                    cols.ids,
+                    cols.team.tolist(),
+                    cols.pos.tolist(),
+                    cols.vel.tolist(),
+                    cols.stamina.tolist(),
+                    cols.energy.tolist(),
+                    cols.heat.tolist(),
+                )
             ],
             # Events truncated to type names for telemetry brevity
             "e": [e.event_type for e in state.events],
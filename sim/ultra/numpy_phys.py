@@ -0,0 +1,163 @@
+from typing import Dict, Optional
+
+import numpy as np
+
+from sim.ultra.vectorized_phys import VectorizedNeonPhysics
+
+
+class NumpyNeonPhysics(VectorizedNeonPhysics):
+    """
+    NumPy backend of VectorizedNeonPhysics for CPU rollout workers.
+    Same tick as the torch backend, written with in-place ufuncs (out=) over
+    preallocated buffers, so step() allocates nothing and torch is never imported.
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        device: str = "cpu",
+        friction: float = 0.98,
+        backend: str = "numpy",
+        seed: Optional[int] = None,
+    ):
+        self.backend = "numpy"
+        self.device = "cpu"
+        tables = self._init_bodies(num_envs, friction)
+        self.rng = np.random.default_rng(seed)
+
+        # State arrays: [N, num_entities, 2] (pos) and [N, num_entities, 2] (vel)
+        self.pos = np.zeros((num_envs, 15, 2), dtype=np.float32)
+        self.vel = np.zeros((num_envs, 15, 2), dtype=np.float32)
+        self.mass = tables["mass"]
+        self.radius = tables["radius"]
+        self.elasticity = tables["elasticity"]
+        self.bounds = tables["bounds"]
+        # Ball centre at the start of the last step and before its boundary clamp: [N, 2, 2]
+        self.ball_path = np.zeros((num_envs, 2, 2), dtype=np.float32)
+
+        # Constants and scratch buffers for step()
+        self._neg_bounds = tables["neg_bounds"]
+        self._contact_dist = tables["contact_dist"]
+        self._impulse = tables["impulse"]
+        self._inv_mass = tables["inv_mass"]
+        self._push_share = tables["push_share"]
+        self._bounce_gain = tables["bounce_gain"]
+        self._ones = np.ones((15, 1), dtype=np.float32)  # row sums as a batched matmul
+        n = num_envs
+        f32 = np.float32
+        self._scratch = {
+            "accel": np.empty((n, 14, 2), dtype=f32),
+            "step": np.empty((n, 15, 2), dtype=f32),
+            "cols": np.empty((n, 4, 15), dtype=f32),
+            "nx": np.empty((n, 15, 15), dtype=f32),
+            "ny": np.empty((n, 15, 15), dtype=f32),
+            "pair_dist": np.empty((n, 15, 15), dtype=f32),
+            "pair_tmp": np.empty((n, 15, 15), dtype=f32),
+            "touch": np.empty((n, 15, 15), dtype=bool),
+            "vn": np.empty((n, 15, 15), dtype=f32),
+            "delta": np.empty((n, 15, 2), dtype=f32),
+            "abs_pos": np.empty((n, 15, 2), dtype=f32),
+            "outside": np.empty((n, 15, 2), dtype=bool),
+            "bounce": np.empty((n, 15, 2), dtype=f32),
+        }
+
+    def reset(self, indices: Optional[np.ndarray] = None):
+        if indices is None:
+            indices = np.arange(self.num_envs)
+        count = len(indices)
+
+        # Randomize ball
+        self.pos[indices, 0] = self.rng.random((count, 2), dtype=np.float32) * 10 - 5
+        self.vel[indices, 0] = 0
+
+        # Reset players to formation
+        # (Simplified for now: random scatter)
+        self.pos[indices, 1:] = self.rng.standard_normal((count, 14, 2), dtype=np.float32) * 5
+        self.vel[indices, 1:] = 0
+
+    def step(self, actions: np.ndarray):
+        """
+        actions: [N, 14, 2] (force for 14 players)
+        Same tick as TorchNeonPhysics.step(); results agree to float32 rounding.
+        """
+        pos, vel = self.pos, self.vel
+        s = self._scratch
+        np.copyto(self.ball_path[:, 0], pos[:, 0])
+
+        # 1. Apply actions to players (entities 1-14)
+        np.multiply(actions, self.dt, out=s["accel"], casting="same_kind")
+        np.add(vel[:, 1:, :], s["accel"], out=vel[:, 1:, :])
+
+        # 2. Integrate position
+        np.multiply(vel, self.dt, out=s["step"])
+        np.add(pos, s["step"], out=pos)
+
+        # 3. Circle-circle contacts between all 15 bodies, as [N, 15, 15] pair planes.
+        # Pair [i, j] looks from body i towards body j.
+        cols = s["cols"]
+        np.copyto(cols[:, 0:2], pos.transpose(0, 2, 1))
+        np.copyto(cols[:, 2:4], vel.transpose(0, 2, 1))
+        px, py, vx, vy = cols[:, 0], cols[:, 1], cols[:, 2], cols[:, 3]
+        nx, ny, dist, t = s["nx"], s["ny"], s["pair_dist"], s["pair_tmp"]
+        np.subtract(px[:, None, :], px[:, :, None], out=nx)
+        np.subtract(py[:, None, :], py[:, :, None], out=ny)
+        np.multiply(nx, nx, out=dist)
+        np.multiply(ny, ny, out=t)
+        np.add(dist, t, out=dist)
+        np.sqrt(dist, out=dist)
+        np.less(dist, self._contact_dist, out=s["touch"])
+        np.maximum(dist, 1e-6, out=t)
+        np.divide(nx, t, out=nx)
+        np.divide(ny, t, out=ny)
+
+        # Normal impulse on approaching pairs: j = -(1 + e) * vn / (1/m_i + 1/m_j)
+        vn = s["vn"]
+        np.subtract(vx[:, None, :], vx[:, :, None], out=vn)
+        np.multiply(vn, nx, out=vn)
+        np.subtract(vy[:, None, :], vy[:, :, None], out=t)
+        np.multiply(t, ny, out=t)
+        np.add(vn, t, out=vn)
+        np.minimum(vn, 0.0, out=vn)
+        np.multiply(vn, s["touch"], out=vn)
+        np.multiply(vn, self._impulse, out=vn)
+        self._apply_pair_sums(vn, vel, s["delta"])
+
+        # Separate overlapping bodies, each moving by its inverse-mass share
+        np.subtract(self._contact_dist, dist, out=vn)
+        np.maximum(vn, 0.0, out=vn)
+        np.multiply(vn, self._push_share, out=vn)
+        self._apply_pair_sums(vn, pos, s["delta"], sign=-1.0, inv_mass=False)
+
+        # 4. Field boundaries (Bounce): reflect the crossing component with wall restitution
+        np.copyto(self.ball_path[:, 1], pos[:, 0])
+        np.abs(pos, out=s["abs_pos"])
+        np.greater(s["abs_pos"], self.bounds, out=s["outside"])
+        np.multiply(s["outside"], self._bounce_gain, out=s["bounce"])
+        np.add(s["bounce"], 1.0, out=s["bounce"])
+        np.multiply(vel, s["bounce"], out=vel)
+        np.clip(pos, self._neg_bounds, self.bounds, out=pos)
+
+        # 5. Apply friction
+        np.multiply(vel, self.friction, out=vel)
+
+    def _apply_pair_sums(self, weight, target, delta, sign=1.0, inv_mass=True):
+        """target[:, i] += sign * sum_j weight[:, i, j] * normal[:, i, j] (optionally / m_i)."""
+        s = self._scratch
+        np.multiply(weight, s["nx"], out=s["pair_tmp"])
+        np.matmul(s["pair_tmp"], self._ones, out=delta[:, :, 0:1])
+        np.multiply(weight, s["ny"], out=s["pair_tmp"])
+        np.matmul(s["pair_tmp"], self._ones, out=delta[:, :, 1:2])
+        if inv_mass:
+            np.multiply(delta, self._inv_mass, out=delta)
+        if sign < 0:
+            np.subtract(target, delta, out=target)
+        else:
+            np.add(target, delta, out=target)
+
+    def get_state(self) -> Dict[str, np.ndarray]:
+        return {
+            "ball_pos": self.pos[:, 0, :],
+            "player_pos": self.pos[:, 1:, :],
+            "ball_vel": self.vel[:, 0, :],
+            "player_vel": self.vel[:, 1:, :],
+        }
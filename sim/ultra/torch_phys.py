@@ -0,0 +1,164 @@
+from typing import Dict, Optional
+
+import torch
+
+from sim.ultra.vectorized_phys import VectorizedNeonPhysics
+
+
+class TorchNeonPhysics(VectorizedNeonPhysics):
+    """
+    PyTorch backend of VectorizedNeonPhysics.
+    Simulates N parallel environments using PyTorch tensors.
+    Optimized for CUDA performance.
+    """
+
+    def __init__(
+        self,
+        num_envs: int,
+        device: str = "cuda",
+        friction: float = 0.98,
+        backend: str = "torch",
+        seed: Optional[int] = None,
+    ):
+        self.backend = "torch"
+        self.device = torch.device(device if torch.cuda.is_available() else "cpu")
+        tables = {
+            name: torch.as_tensor(value, device=self.device)
+            for name, value in self._init_bodies(num_envs, friction).items()
+        }
+        self._generator = None
+        if seed is not None:
+            self._generator = torch.Generator(device=self.device).manual_seed(seed)
+
+        # State tensors: [N, num_entities, 2] (pos) and [N, num_entities, 2] (vel)
+        self.pos = torch.zeros((num_envs, 15, 2), device=self.device)
+        self.vel = torch.zeros((num_envs, 15, 2), device=self.device)
+        self.mass = tables["mass"]
+        self.radius = tables["radius"]
+        self.elasticity = tables["elasticity"]
+        self.bounds = tables["bounds"]
+        # Ball centre at the start of the last step and before its boundary clamp: [N, 2, 2]
+        self.ball_path = torch.zeros((num_envs, 2, 2), device=self.device)
+
+        # Constants and scratch buffers for the branch-free step()
+        self._contact_dist = tables["contact_dist"]
+        self._impulse = tables["impulse"]
+        self._inv_mass = tables["inv_mass"]
+        self._push_share = tables["push_share"]
+        self._neg_bounds = tables["neg_bounds"]
+        self._bounce_gain = tables["bounce_gain"]
+        n = num_envs
+        self._scratch = {
+            "accel": torch.empty((n, 14, 2), device=self.device),
+            "step": torch.empty((n, 15, 2), device=self.device),
+            "nx": torch.empty((n, 15, 15), device=self.device),
+            "ny": torch.empty((n, 15, 15), device=self.device),
+            "pair_dist": torch.empty((n, 15, 15), device=self.device),
+            "pair_tmp": torch.empty((n, 15, 15), device=self.device),
+            "cols": torch.empty((n, 4, 15), device=self.device),
+            "apart": torch.empty((n, 15, 15), dtype=torch.bool, device=self.device),
+            "vn": torch.empty((n, 15, 15), device=self.device),
+            "delta": torch.empty((n, 15, 2), device=self.device),
+            "abs_pos": torch.empty((n, 15, 2), device=self.device),
+            "outside": torch.empty((n, 15, 2), dtype=torch.bool, device=self.device),
+            "bounce": torch.empty((n, 15, 2), device=self.device),
+        }
+
+    def reset(self, indices: torch.Tensor = None):
+        if indices is None:
+            indices = torch.arange(self.num_envs, device=self.device)
+
+        # Randomize ball
+        gen = self._generator
+        self.pos[indices, 0] = (
+            torch.rand((len(indices), 2), device=self.device, generator=gen) * 10 - 5
+        )
+        self.vel[indices, 0] = 0
+
+        # Reset players to formation
+        # (Simplified for now: random scatter)
+        self.pos[indices, 1:] = (
+            torch.randn((len(indices), 14, 2), device=self.device, generator=gen) * 5
+        )
+        self.vel[indices, 1:] = 0
+
+    def step(self, actions: torch.Tensor):
+        """
+        actions: [N, 14, 2] (force for 14 players)
+
+        Fully masked and in place: no data-dependent branches, no host syncs and
+        no scatter/gather with dynamic shapes, so the whole tick can be queued
+        on the device. Intermediates live in preallocated scratch buffers.
+        """
+        pos, vel = self.pos, self.vel
+        s = self._scratch
+        self.ball_path[:, 0].copy_(pos[:, 0])
+
+        # 1. Apply actions to players (entities 1-14)
+        torch.mul(actions, self.dt, out=s["accel"])
+        vel[:, 1:, :].add_(s["accel"])
+
+        # 2. Integrate position
+        torch.mul(vel, self.dt, out=s["step"])
+        pos.add_(s["step"])
+
+        # 3. Circle-circle contacts between all 15 bodies, as [N, 15, 15] pair planes
+        # (x and y kept apart so no reduction runs over a size-2 axis).
+        # Pair [i, j] looks from body i towards body j.
+        cols = s["cols"]
+        cols[:, 0:2].copy_(pos.transpose(1, 2))
+        cols[:, 2:4].copy_(vel.transpose(1, 2))
+        px, py, vx, vy = cols.unbind(1)
+        nx, ny, dist, t = s["nx"], s["ny"], s["pair_dist"], s["pair_tmp"]
+        torch.sub(px.unsqueeze(1), px.unsqueeze(2), out=nx)
+        torch.sub(py.unsqueeze(1), py.unsqueeze(2), out=ny)
+        torch.hypot(nx, ny, out=dist)
+        torch.ge(dist, self._contact_dist, out=s["apart"])
+        torch.clamp(dist, min=1e-6, out=t)
+        nx.div_(t)
+        ny.div_(t)
+
+        # Normal impulse on approaching pairs: j = -(1 + e) * vn / (1/m_i + 1/m_j)
+        vn = s["vn"]
+        torch.sub(vx.unsqueeze(1), vx.unsqueeze(2), out=vn)
+        vn.mul_(nx)
+        torch.sub(vy.unsqueeze(1), vy.unsqueeze(2), out=t)
+        vn.addcmul_(t, ny)
+        vn.clamp_(max=0.0).masked_fill_(s["apart"], 0.0).mul_(self._impulse)
+        self._apply_pair_sums(vn, vel, s["delta"])
+
+        # Separate overlapping bodies, each moving by its inverse-mass share
+        torch.sub(self._contact_dist, dist, out=vn)
+        vn.clamp_(min=0.0).mul_(self._push_share)
+        self._apply_pair_sums(vn, pos, s["delta"], sign=-1.0, inv_mass=False)
+
+        # 4. Field boundaries (Bounce): reflect the crossing component with wall restitution
+        self.ball_path[:, 1].copy_(pos[:, 0])
+        torch.abs(pos, out=s["abs_pos"])
+        torch.gt(s["abs_pos"], self.bounds, out=s["outside"])
+        torch.mul(s["outside"], self._bounce_gain, out=s["bounce"])
+        s["bounce"].add_(1.0)
+        vel.mul_(s["bounce"])
+        pos.clamp_(min=self._neg_bounds, max=self.bounds)
+
+        # 5. Apply friction
+        vel.mul_(self.friction)
+
+    def _apply_pair_sums(self, weight, target, delta, sign=1.0, inv_mass=True):
+        """target[:, i] += sign * sum_j weight[:, i, j] * normal[:, i, j] (optionally / m_i)."""
+        s = self._scratch
+        torch.mul(weight, s["nx"], out=s["pair_tmp"])
+        torch.sum(s["pair_tmp"], dim=2, out=delta[:, :, 0])
+        torch.mul(weight, s["ny"], out=s["pair_tmp"])
+        torch.sum(s["pair_tmp"], dim=2, out=delta[:, :, 1])
+        if inv_mass:
+            delta.mul_(self._inv_mass)
+        target.add_(delta, alpha=sign)
+
+    def get_state(self) -> Dict[str, torch.Tensor]:
+        return {
+            "ball_pos": self.pos[:, 0, :],
+            "player_pos": self.pos[:, 1:, :],
+            "ball_vel": self.vel[:, 0, :],
+            "player_vel": self.vel[:, 1:, :],
+        }
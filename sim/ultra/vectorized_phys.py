@@ -1,90 +1,82 @@
-from typing import Dict
+from typing import Dict, Optional
 
-import torch
+import numpy as np
+
+BACKENDS = ("torch", "numpy")
 
 
 class VectorizedNeonPhysics:
     """
     ULTRA Vectorized Physics Engine.
-    Simulates N parallel environments using PyTorch tensors.
-    Optimized for CUDA performance.
+    Simulates N parallel environments as batched arrays.
+
+    backend="torch" steps PyTorch tensors (optimized for CUDA, also runs on CPU);
+    backend="numpy" steps NumPy arrays on the CPU without importing torch.
+    Both expose the same attributes, reset()/step() and get_state() layout.
+    ball_path [N, 2, 2] is the ball's path over the last step (start, end before the
+    boundary clamp), for swept goal checks that the clamp would otherwise hide.
     """
 
-    def __init__(self, num_envs: int, device: str = "cuda"):
+    def __new__(
+        cls,
+        num_envs: int,
+        device: str = "cuda",
+        friction: float = 0.98,
+        backend: str = "torch",
+        seed: Optional[int] = None,
+    ):
+        if cls is VectorizedNeonPhysics:
+            if backend == "torch":
+                from sim.ultra.torch_phys import TorchNeonPhysics as cls
+            elif backend == "numpy":
+                from sim.ultra.numpy_phys import NumpyNeonPhysics as cls
+            else:
+                raise ValueError(f"Unknown physics backend {backend!r}, expected one of {BACKENDS}")
+        return super().__new__(cls)
+
+    def _init_bodies(self, num_envs: int, friction: float) -> Dict[str, np.ndarray]:
+        """Set the shared scalars and return the float32 body/pair tables for a backend."""
         self.num_envs = num_envs
-        self.device = torch.device(device if torch.cuda.is_available() else "cpu")
 
         # Grid boundaries
         self.field_width = 60.0
         self.field_height = 40.0
 
-        # State tensors: [N, num_entities, 2] (pos) and [N, num_entities, 2] (vel)
-        # Entity 0: Ball, Entities 1-7: Team Blue, Entities 8-14: Team Red
-        self.pos = torch.zeros((num_envs, 15, 2), device=self.device)
-        self.vel = torch.zeros((num_envs, 15, 2), device=self.device)
-        self.mass = torch.ones((15,), device=self.device)
-        self.mass[0] = 0.5  # Ball is lighter
-
-        self.friction = 0.98
+        self.wall_elasticity = 0.8
+        self.wall_radius = 0.5
+        self.friction = friction  # per-tick velocity retention (tools/physics_parity.py fits it)
         self.dt = 1 / 60.0
 
-    def reset(self, indices: torch.Tensor = None):
-        if indices is None:
-            indices = torch.arange(self.num_envs, device=self.device)
-
-        # Randomize ball
-        self.pos[indices, 0] = torch.rand((len(indices), 2), device=self.device) * 10 - 5
-        self.vel[indices, 0] = 0
-
-        # Reset players to formation
-        # (Simplified for now: random scatter)
-        self.pos[indices, 1:] = torch.randn((len(indices), 14, 2), device=self.device) * 5
-        self.vel[indices, 1:] = 0
-
-    def step(self, actions: torch.Tensor):
-        """
-        actions: [N, 14, 2] (force for 14 players)
-        """
-        # 1. Apply actions to players (entities 1-14)
-        self.vel[:, 1:, :] += actions * self.dt
-
-        # 2. Integrate position
-        self.pos += self.vel * self.dt
-
-        # 3. Handle Ball-Player Collisions (Vectorized)
-        # dist: [N, 14]
-        diff = self.pos[:, 1:, :] - self.pos[:, 0, :].unsqueeze(1)
-        dist = torch.norm(diff, dim=-1)
-        collision_mask = dist < 1.0
-
-        # Impulse transfer (simplified elastic)
-        # If player hits ball, ball gets player velocity
-        if collision_mask.any():
-            env_ids, player_ids = torch.where(collision_mask)
-            self.vel[env_ids, 0] = self.vel[env_ids, player_ids + 1] * 1.5
-
-        # 4. Field boundaries (Bounce)
-        # x-bounds
-        mask_x = self.pos[:, :, 0].abs() > self.field_width / 2
-        self.vel[:, :, 0][mask_x] *= -0.5
-        self.pos[:, :, 0] = torch.clamp(
-            self.pos[:, :, 0], -self.field_width / 2, self.field_width / 2
-        )
-
-        # y-bounds
-        mask_y = self.pos[:, :, 1].abs() > self.field_height / 2
-        self.vel[:, :, 1][mask_y] *= -0.5
-        self.pos[:, :, 1] = torch.clamp(
-            self.pos[:, :, 1], -self.field_height / 2, self.field_height / 2
-        )
-
-        # 5. Apply friction
-        self.vel *= self.friction
-
-    def get_state(self) -> Dict[str, torch.Tensor]:
+        # Entity 0: Ball, Entities 1-7: Team Blue, Entities 8-14: Team Red
+        # Body constants mirror PhysicsEngine (pitch units are 1/10 of its pixels)
+        mass = np.full(15, 70.0, dtype=np.float32)
+        mass[0] = 0.45  # Ball is lighter
+        radius = np.full(15, 1.2, dtype=np.float32)
+        radius[0] = 0.8
+        elasticity = np.full(15, 0.1, dtype=np.float32)
+        elasticity[0] = 0.9
+
+        half_extent = np.array([self.field_width / 2, self.field_height / 2], dtype=np.float32)
+        # Pair tables (Chipmunk combines elasticity multiplicatively)
+        inv_mass = np.float32(1.0) / mass
+        pair_inv_mass = inv_mass[:, None] + inv_mass[None, :]
+        pair_e = elasticity[:, None] * elasticity[None, :]
+        contact_dist = radius[:, None] + radius[None, :]
+        np.fill_diagonal(contact_dist, 0.0)  # a body never touches itself
+        # Centre limits per body: walls are segments of wall_radius on the field edge
+        bounds = half_extent - self.wall_radius - radius[:, None]  # [15, 2]
+        wall_bounce = (-np.float32(self.wall_elasticity) * elasticity)[:, None]  # [15, 1]
         return {
-            "ball_pos": self.pos[:, 0, :],
-            "player_pos": self.pos[:, 1:, :],
-            "ball_vel": self.vel[:, 0, :],
-            "player_vel": self.vel[:, 1:, :],
+            "mass": mass,
+            "radius": radius,
+            "elasticity": elasticity,
+            "bounds": bounds,
+            "neg_bounds": -bounds,
+            "contact_dist": contact_dist,  # [15, 15]
+            "impulse": (np.float32(1.0) + pair_e) / pair_inv_mass,  # [15, 15]
+            "inv_mass": inv_mass[:, None],  # [15, 1]
+            "push_share": inv_mass[:, None] / pair_inv_mass,  # [15, 15]
+            "wall_bounce": wall_bounce,
+            # Velocity factor - 1 on a wall hit: reflect with wall restitution
+            "bounce_gain": wall_bounce - np.float32(1.0),  # [15, 1]
         }
@@ -13,6 +13,66 @@ def test_physics_engine_init():
     assert engine is not None
 
 
+def test_physics_read_state():
+    """Verify that the bulk readout matches the per-body accessors."""
+    rng = DeterministicRNG(seed=42)
+    engine = PhysicsEngine(pitch_dim=(600.0, 400.0), rng=rng)
+    engine.spawn_ball((300.0, 200.0))
+    engine.spawn_player("blue_0", (100.0, 100.0))
+    engine.spawn_player("red_0", (500.0, 300.0))
+    engine.apply_action("blue_0", (1.0, 0.5))
+    engine.step(1.0 / 60.0)
+
+    out = np.zeros((3, 4))
+    engine.read_state(out)
+    bp, bv = engine.get_ball_data()
+    assert np.array_equal(out[0], np.concatenate([bp, bv]))
+    for row, pid in enumerate(["blue_0", "red_0"], start=1):
+        p, v = engine.get_player_data(pid)
+        assert np.array_equal(out[row], np.concatenate([p, v]))
+
+
+def test_match_state_columns_are_shared():
+    """Verify that PlayerState views read and write the columnar match arrays."""
+    env = NeonFootballEnv({"seed": 3})
+    env.reset()
+    cols = env.state.columns()
+    assert cols is env.state.arrays
+
+    player = env.state.players[9]
+    player.stamina = 42.0
+    player.pos = np.array([10.0, 20.0])
+    assert cols.stamina[9] == 42.0
+    assert np.array_equal(cols.pos[9], [10.0, 20.0])
+    assert player.team == TeamID.RED
+
+    env.step(np.zeros(env.action_space.shape, dtype=np.float32))
+    assert np.array_equal(player.pos, cols.pos[9])
+    assert np.array_equal(env.state.ball.pos, cols.ball_pos)
+
+
+def test_match_state_copies_keep_views_linked():
+    """Verify that deep-copied and pickled states still write through to their own arrays."""
+    import copy
+    import pickle
+
+    env = NeonFootballEnv({})
+    env.reset(seed=3)
+    for clone in (copy.deepcopy(env.state), pickle.loads(pickle.dumps(env.state))):
+        cols = clone.arrays
+        assert cols is not env.state.arrays
+        assert np.shares_memory(cols.pos, cols.kinematics)
+        player = clone.players[9]
+        player.pos = np.array([10.0, 20.0])
+        player.stamina = 42.0
+        clone.ball.vel = np.array([3.0, -4.0])
+        assert np.array_equal(cols.kinematics[10, 0:2], [10.0, 20.0])
+        assert cols.stamina[9] == 42.0
+        assert np.array_equal(cols.kinematics[0, 2:4], [3.0, -4.0])
+        assert not np.array_equal(env.state.players[9].pos, [10.0, 20.0])
+        assert player.team == TeamID.RED and player.id == env.state.players[9].id
+
+
 def test_env_step():
     """Verify standard step logic in Gymnasium environment."""
     env = NeonFootballEnv({"seed": 1})
@@ -35,3 +95,495 @@ def test_team_assignment():
     red_team = [p for p in env.state.players if p.team == TeamID.RED]
     assert len(blue_team) == 7
     assert len(red_team) == 7
+
+
+def test_vectorized_contacts():
+    """Verify that vectorized players collide instead of passing through and the ball bounces off walls."""
+    import torch
+
+    from sim.ultra.vectorized_phys import VectorizedNeonPhysics
+
+    phys = VectorizedNeonPhysics(1, device="cpu")
+    phys.vel.zero_()
+    phys.pos[0] = torch.stack([torch.linspace(-25.0, 25.0, 15), torch.full((15,), 15.0)], dim=1)
+    phys.pos[0, 0] = torch.tensor([20.0, -10.0])
+    phys.vel[0, 0] = torch.tensor([60.0, 0.0])
+    phys.pos[0, 1] = torch.tensor([-2.0, 0.0])
+    phys.pos[0, 2] = torch.tensor([2.0, 0.0])
+    phys.vel[0, 1] = torch.tensor([10.0, 0.0])
+    phys.vel[0, 2] = torch.tensor([-10.0, 0.0])
+
+    for _ in range(30):
+        phys.step(torch.zeros((1, 14, 2)))
+
+    # Players stay apart and nearly stop (restitution 0.1 * 0.1)
+    assert phys.pos[0, 1, 0] < phys.pos[0, 2, 0]
+    assert phys.vel[0, 1:3, 0].abs().max() < 0.5
+    # Ball came back off the end wall
+    assert phys.vel[0, 0, 0] < 0.0
+    assert phys.pos[0, 0, 0] <= phys.bounds[0, 0]
+
+
+def test_vectorized_backends_agree():
+    """Verify that the numpy and torch physics backends produce the same get_state()."""
+    import torch
+
+    from sim.ultra.vectorized_phys import VectorizedNeonPhysics
+
+    ref = VectorizedNeonPhysics(16, device="cpu", backend="torch", seed=0)
+    fast = VectorizedNeonPhysics(16, backend="numpy")
+    ref.reset()
+    fast.pos[:] = ref.pos.numpy()
+    fast.vel[:] = ref.vel.numpy()
+
+    actions = np.random.default_rng(0).uniform(-30.0, 30.0, (20, 16, 14, 2)).astype(np.float32)
+    for step_actions in actions:
+        ref.step(torch.from_numpy(step_actions))
+        fast.step(step_actions)
+
+    ref_state, fast_state = ref.get_state(), fast.get_state()
+    assert ref_state.keys() == fast_state.keys()
+    for key, value in fast_state.items():
+        assert value.shape == tuple(ref_state[key].shape) and value.dtype == np.float32
+        assert np.allclose(value, ref_state[key].numpy(), atol=1e-3)
+
+
+def test_physics_batch_matches_serial_engines():
+    """Verify that threaded PhysicsBatch stepping matches stepping each engine alone."""
+    from sim.core.physics_batch import PhysicsBatch
+
+    formation = NeonFootballEnv._kickoff_formation()
+    forces = np.random.default_rng(0).uniform(-1.0, 1.0, (30, 3, 14, 2)).astype(np.float32)
+    batch = PhysicsBatch(3, (300.0, 200.0), formation, max_workers=3)
+    for tick_forces in forces:
+        batch.step(tick_forces)
+    batch.close()
+
+    no_dash, everyone = np.zeros(14, dtype=bool), np.ones(14, dtype=bool)
+    for k in range(3):
+        engine = PhysicsEngine((600.0, 400.0), DeterministicRNG(k))
+        engine.spawn_ball((300.0, 200.0))
+        for player_id, pos in formation.items():
+            engine.spawn_player(player_id, pos)
+        for tick_forces in forces:
+            engine.apply_actions(tick_forces[k], no_dash, everyone)
+            engine.step(1.0 / 60.0)
+        assert np.array_equal(engine.read_state(np.zeros((15, 4))), batch.state[k])
+
+
+def test_reward_batch_matches_scalar():
+    """Verify that RewardEngine.calculate_batch reproduces calculate() per match and component."""
+    from types import SimpleNamespace
+
+    from ai.training.reward_engine import EVENT_COLUMNS, RewardEngine
+    from configs.compiler import compile_config
+    from sim.core.state import GoalEvent
+
+    engine = RewardEngine()
+    env = NeonFootballEnv({})
+    rng = np.random.default_rng(3)
+    balls, players, stamina, possession, counts, expected = [], [], [], [], [], []
+    for k in range(4):
+        env.reset(seed=k)
+        for _ in range(20):
+            env.step(rng.uniform(-1.0, 1.0, 56).astype(np.float32))
+        cols = env.state.columns()
+        cols.stamina[:] = rng.uniform(0.0, 40.0, cols.stamina.shape)
+        env.state.possession_team = [None, TeamID.BLUE, TeamID.RED, TeamID.RED][k]
+        # Match k: k BLUE passes, a RED shot, and a goal for BLUE (k=1) or RED (k=3)
+        events = [SimpleNamespace(event_type="PASS", actor_team=TeamID.BLUE)] * k
+        events.append(SimpleNamespace(event_type="SHOT", actor_team=TeamID.RED))
+        if k % 2:
+            events.append(GoalEvent(f"goal_{k}", 0, team_scored=TeamID(k // 2)))
+        for team in (TeamID.BLUE, TeamID.RED):
+            expected.append(engine.calculate(env.state, events, team))
+            row = np.zeros(len(EVENT_COLUMNS))
+            for e in events:
+                if e.event_type == "GOAL":
+                    row[2 if e.team_scored == team else 3] += 1
+                elif e.actor_team == team:
+                    row[EVENT_COLUMNS.index(e.event_type)] += 1
+            counts.append(row)
+        balls.append(np.array(env.state.ball.pos, dtype=np.float64))
+        players.append(cols.pos.copy())
+        stamina.append(cols.stamina.copy())
+        possession.append(-1 if k == 0 else env.state.possession_team.value)
+
+    batch = dict(
+        ball_pos=np.stack(balls), player_pos=np.stack(players),
+        stamina=np.stack(stamina), possession=np.array(possession),
+    )
+    counts = np.array(counts)
+    blue, parts = engine.calculate_batch(team=TeamID.BLUE, event_counts=counts[0::2], **batch)
+    red, _ = engine.calculate_batch(team=TeamID.RED, event_counts=counts[1::2], **batch)
+    assert np.array_equal(np.stack([blue, red], axis=1).ravel(), expected)
+    assert np.allclose(sum(parts.values()), blue)
+    assert np.all(parts["pressure"][[0, 1]] == 0.0)
+    assert parts["goal_scored"].tolist() == [0.0, 10.0, 0.0, 0.0]
+    assert parts["goal_conceded"].tolist() == [0.0, 0.0, 0.0, -10.0]
+
+    # The compiled weight vector overlays the full profile: untracked terms survive
+    compiled = RewardEngine(table=compile_config(None))
+    assert compiled.cfg == engine.cfg
+    assert compiled.cfg["team"]["compactness"] == 0.02
+    assert compiled.cfg["dense_defense"]["interception"] == 0.5
+
+
+def test_relabel_rewards_matches_env(tmp_path):
+    """Verify that relabeling a recorded env episode reproduces the env's reward stream."""
+    import json
+
+    from tools.relabel_rewards import COMPONENTS, frames_to_arrays, relabel
+
+    env = NeonFootballEnv({})
+    env.reset(seed=5)
+    # RED keeps the ball: BLUE pressure counts and the analyst flags the carousel
+    env.state.possession_team = TeamID.RED
+    env.state.possession_player_id = "red_3"
+    rng = np.random.default_rng(5)
+    rewards = [0.0]
+    frames = [env.get_telemetry_frame()]
+    for _ in range(400):
+        action = rng.uniform(-1.0, 1.0, 56).astype(np.float32)
+        _, reward, terminated, truncated, _ = env.step(action)
+        rewards.append(reward)
+        frames.append(env.get_telemetry_frame())
+        if terminated or truncated:
+            break
+    path = tmp_path / "match.jsonl"
+    path.write_text("\n".join(json.dumps(frame) for frame in frames))
+
+    out = relabel([str(path)], ["baseline"], str(tmp_path / "relabel"))
+    relabeled = np.load(tmp_path / "relabel" / "baseline.rewards.npy", mmap_mode="r")
+    components = np.load(tmp_path / "relabel" / "baseline.components.npy")
+    assert relabeled.shape == (len(frames),)
+    assert np.array_equal(relabeled[1:], rewards[1:])
+    assert np.array_equal(out["baseline"], relabeled)
+    assert components[:, COMPONENTS.index("degenerate_penalty")].min() == -0.1
+    assert components[:, COMPONENTS.index("pressure")].max() > 0.0
+
+    # Frames without a recorded possession team fall back to the "poss" player's team
+    for frame in frames[:2]:
+        del frame["possession"]
+        frame["poss"] = "blue_4" if frame is frames[0] else None
+    assert frames_to_arrays(frames[:2])["possession"].tolist() == [0, -1]
+
+
+def test_rolling_stats_match_numpy_windows():
+    """Verify that RollingStats tracks np.std over each trailing window and survives a copy."""
+    from ai.explainability.rolling_stats import RollingStats
+
+    values = np.random.default_rng(2).normal(300.0, 25.0, 1000)
+    stats = RollingStats((50, 300))
+    for t, x in enumerate(values):
+        stats.push(float(x))
+        for j, w in enumerate(stats.windows):
+            if t + 1 >= w:
+                assert np.isclose(stats.std(j), np.std(values[t + 1 - w:t + 1]), rtol=1e-9)
+            else:
+                assert stats.std(j) is None
+        if t == 700:
+            saved = stats.get_state()
+
+    restored = RollingStats((50, 300))
+    restored.load_state(saved)
+    for x in values[701:]:
+        restored.push(float(x))
+    assert restored.get_state()["m2"] == stats.get_state()["m2"]
+
+
+def test_analyst_carousel_per_team():
+    """Verify that carousel detection fills per team and a turnover clears the other team."""
+    from ai.explainability.tactical_analyst import TacticalAnalyst
+
+    env = NeonFootballEnv({})
+    env.reset(seed=0)
+    analyst = TacticalAnalyst(possession_windows=(10, 40))
+    env.state.possession_team = TeamID.BLUE
+    scores = [analyst._detect_degenerate_possession(env.state) for _ in range(10)]
+    assert scores == [0.0] * 9 + [1.0]
+
+    env.state.possession_team = TeamID.RED
+    assert analyst._detect_degenerate_possession(env.state) == 0.0
+    assert analyst.possession_windows[TeamID.BLUE].count == 0
+    assert analyst.possession_windows[TeamID.RED].count == 1
+
+    # The ring buffers travel with env snapshots, mid-spell
+    env.state.possession_player_id = "red_3"
+    for _ in range(20):
+        env.step(np.zeros(56, dtype=np.float32))
+    fork = NeonFootballEnv({})
+    fork.restore(env.snapshot())
+    env.step(np.zeros(56, dtype=np.float32))
+    fork.step(np.zeros(56, dtype=np.float32))
+    for team in (TeamID.BLUE, TeamID.RED):
+        original = env.analyst.possession_windows[team].get_state()
+        restored = fork.analyst.possession_windows[team].get_state()
+        assert original["count"] == restored["count"] == (21 if team is TeamID.RED else 0)
+        assert np.array_equal(original["values"], restored["values"])
+        assert original["m2"] == restored["m2"]
+
+
+def test_batch_analyst_matches_scalar():
+    """Verify that BatchTacticalAnalyst agrees with TacticalAnalyst match by match."""
+    from ai.explainability.batch_analyst import BatchTacticalAnalyst
+    from ai.explainability.tactical_analyst import TacticalAnalyst
+
+    env = NeonFootballEnv({})
+    rng = np.random.default_rng(4)
+    states = []
+    for k in range(3):
+        env.reset(seed=k)
+        for _ in range(30):
+            env.step(rng.uniform(-1.0, 1.0, 56).astype(np.float32))
+        states.append((env.state.columns().pos.copy(), env.state.ball.pos.copy()))
+    positions = np.stack([pos for pos, _ in states])
+    ball_x = np.array([ball[0] for _, ball in states])
+    carrier = np.zeros((3, 14), dtype=bool)
+    carrier[1, 2] = carrier[2, 9] = True  # match 0: loose ball
+
+    batch = BatchTacticalAnalyst(3, possession_windows=(5,))
+    analysts = [TacticalAnalyst(possession_windows=(5,)) for _ in range(3)]
+    for _ in range(6):
+        out = batch.analyze(positions, env.state.arrays.team, carrier, ball_x)
+        for k, analyst in enumerate(analysts):
+            env.state.arrays.kinematics[1:, 0:2] = positions[k]
+            env.state.arrays.kinematics[0, 0] = ball_x[k]
+            holder = np.flatnonzero(carrier[k])
+            arrays = env.state.arrays
+            env.state.possession_player_id = arrays.ids[holder[0]] if holder.size else None
+            env.state.possession_team = TeamID(int(arrays.team[holder[0]])) if holder.size else None
+            ref = analyst.analyze_tick(env.state)
+            compactness = [ref["compactness"][TeamID.BLUE], ref["compactness"][TeamID.RED]]
+            assert np.allclose(out["compactness"][k], compactness)
+            assert np.isclose(out["pressure_index"][k], ref["pressure_index"])
+            assert out["degenerate_score"][k] == ref["degenerate_score"]
+    assert out["degenerate_score"].tolist() == [0.0, 1.0, 1.0]
+
+    # Resetting one match clears only its windows; the others keep flagging
+    batch.reset(np.array([1]))
+    out = batch.analyze(positions, env.state.arrays.team, carrier, ball_x)
+    assert out["degenerate_score"].tolist() == [0.0, 0.0, 1.0]
+    assert batch.count.tolist() == [[0, 0], [1, 0], [0, 7]]
+
+
+def test_spatial_context_shared_by_consumers():
+    """Verify that SpatialContext answers match each module's own distance computation."""
+    from ai.explainability.tactical_analyst import TacticalAnalyst
+    from ai.training.reward_engine import RewardEngine
+    from ai.training.rewards import RewardShaper
+    from sim.core.spatial import SpatialContext
+
+    env = NeonFootballEnv({})
+    env.reset(seed=1)
+    cols = env.state.columns()
+    cols.pos[3] = env.state.ball.pos + (5.0, 0.0)
+    cols.pos[9] = env.state.ball.pos + (0.0, -12.0)
+    env.state.possession_team = TeamID.RED
+    env.state.possession_player_id = cols.ids[9]
+    spatial = SpatialContext.from_state(env.state)
+
+    assert spatial.owner_candidates.tolist() == [3, 9] and spatial.owner == 3
+    assert spatial.distances.shape == (15, 15)
+    assert np.allclose(spatial.ball_dist, np.linalg.norm(cols.pos - env.state.ball.pos, axis=1))
+    # The env builds one context per tick and hands the same one to every consumer
+    assert env.spatial_context() is env.spatial_context()
+    for i in range(14):
+        d = np.linalg.norm(cols.pos - cols.pos[i], axis=1)
+        mates = np.flatnonzero((cols.team == cols.team[i]) & (np.arange(14) != i))
+        opps = np.flatnonzero(cols.team != cols.team[i])
+        assert spatial.nearest_teammate[i] == mates[np.argmin(d[mates])]
+        assert spatial.nearest_opponent[i] == opps[np.argmin(d[opps])]
+        assert env.rules.check_interaction(cols.pos[i], env.state.ball.pos, spatial, i) == (
+            env.rules.check_interaction(cols.pos[i], env.state.ball.pos)
+        )
+
+    engine = RewardEngine()
+    assert engine.calculate(env.state, [], TeamID.BLUE, spatial) == engine.calculate(
+        env.state, [], TeamID.BLUE
+    )
+    analyst = TacticalAnalyst()
+    assert np.isclose(analyst._calc_pressure(env.state, spatial), analyst._calc_pressure(env.state))
+    shaper = RewardShaper()
+    assert np.isclose(
+        shaper.compute_meta_reward(env.state, [], spatial)["dense"],
+        shaper.compute_meta_reward(env.state, [])["dense"],
+    )
+    cached = env.spatial_context()
+    env.step(np.zeros(56, dtype=np.float32))
+    assert env.spatial_context() is not cached
+
+
+def test_ability_batch_cast_matches_per_player():
+    """Verify that [N,14] batched casting matches per-player casting on separate managers."""
+    from sim.core.abilities import AbilityManager
+    from sim.core.state import PlayerState
+
+    rng = np.random.default_rng(8)
+    batch = AbilityManager(num_envs=3)
+    energy = rng.uniform(0.0, 100.0, (3, 14))
+    stamina = np.full((3, 14), 100.0)
+    heat = rng.uniform(0.0, 100.0, (3, 14))
+    managers = [AbilityManager() for _ in range(3)]
+    players = [
+        [PlayerState(f"p{i}", TeamID.BLUE, energy=energy[k, i], heat=heat[k, i]) for i in range(14)]
+        for k in range(3)
+    ]
+    for tick in range(0, 400, 20):
+        requests = rng.integers(-1, len(batch.ability_ids), (3, 14))
+        cast = batch.cast_batch(requests, energy, stamina, heat, tick)
+        batch.update_columns(energy, heat)
+        for k, manager in enumerate(managers):
+            for i, player in enumerate(players[k]):
+                if requests[k, i] >= 0:
+                    ability = manager.cast(player, batch.ability_ids[requests[k, i]], tick)
+                    assert (ability is not None) == cast[k, i]
+            manager.update(players[k])
+            assert np.allclose([p.energy for p in players[k]], energy[k])
+            assert np.allclose([p.heat for p in players[k]], heat[k])
+            assert np.allclose([p.stamina for p in players[k]], stamina[k])
+    assert cast.dtype == bool and batch.expiry.shape == (3, 14, len(batch.ability_ids))
+
+
+def test_config_compiler_season_cache_and_hot_swap(tmp_path):
+    """Verify that season overrides apply, tables are cached read-only and edits hot-swap."""
+    import shutil
+
+    import pytest
+    from pydantic import ValidationError
+
+    from ai.training.reward_engine import RewardEngine
+    from configs.compiler import ConfigStore, compile_config
+
+    config_dir = tmp_path / "configs"
+    shutil.copytree("configs", config_dir, ignore=shutil.ignore_patterns("*.py"))
+    cache_dir = tmp_path / "cache"
+    dirs = dict(config_dir=str(config_dir), patches_dir="patches", cache_dir=str(cache_dir))
+
+    base = compile_config(None, **dirs)
+    season = compile_config("season_01", **dirs)
+    row = season.catalogue_ids.index("ABL_001")
+    assert base.catalogue[row, 1] == 300 and season.catalogue[row, 1] == 360
+    assert len(list(cache_dir.glob("*.npz"))) == 2
+    cached = compile_config("season_01", **dirs)
+    assert cached.key == season.key and np.array_equal(cached.catalogue, season.catalogue)
+    assert not cached.reward_weights.flags.writeable
+    assert RewardEngine(table=base).weights.tolist() == RewardEngine().weights.tolist()
+
+    store = ConfigStore(None, **dirs)
+    engine = RewardEngine(table=store.table)
+    assert store.refresh() is store.table
+    rewards = config_dir / "rewards.yaml"
+    rewards.write_text(rewards.read_text().replace("goal_scored: 10.0", "goal_scored: 12.0"))
+    engine.load_table(store.refresh())
+    assert store.swaps == 1 and engine.cfg["sparse"]["goal_scored"] == 12.0
+
+    rewards.write_text(rewards.read_text().replace("progression: 0.1", "progression: fast"))
+    with pytest.raises(ValidationError):
+        store.refresh()
+
+
+def test_shared_config_store_reuses_the_disk_cache(tmp_path):
+    """Verify that a second process builds its env from the cached table, skipping YAML."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys; import configs.compiler as compiler; "
+        f"compiler.DEFAULT_CACHE_DIR = {str(tmp_path)!r}; "
+        "from ai.env.neon_env import NeonFootballEnv; NeonFootballEnv({}); "
+        "print(int('yaml' in sys.modules), int('pydantic' in sys.modules))"
+    )
+    runs = [
+        subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        for _ in range(2)
+    ]
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+    assert [run.stdout.split() for run in runs] == [["1", "1"], ["0", "0"]]
+
+
+def test_season_overrides_change_the_simulation():
+    """Verify that season regen, cooldown, spectacle and air drag levers reach the sim."""
+    from ai.env.neon_env import NeonFootballEnv
+    from ai.training.reward_engine import RewardEngine
+    from configs.compiler import compile_config
+    from sim.core.abilities import AbilityManager
+    from sim.core.state import PlayerState
+
+    base, season_01, season_03 = (compile_config(s) for s in (None, "season_01", "season_03"))
+
+    # Energy regen bonus and the ABL_001 cooldown patch (5s -> 6s)
+    regen, ready = [], []
+    for table in (base, season_01):
+        manager = AbilityManager(table=table)
+        player = PlayerState("p0", TeamID.BLUE, energy=100.0)
+        assert manager.cast(player, "ABL_001", 0) is not None
+        spent = player.energy
+        manager.update([player])
+        regen.append(player.energy - spent)
+        ready.append(manager.can_cast(player, "ABL_001", 330))
+    assert np.allclose(regen, [0.2, 0.22])
+    assert ready == [True, False]
+
+    shot = RewardEngine(table=season_03).cfg["dense_offense"]["shot_taken"]
+    assert shot == 2.0 * RewardEngine(table=base).cfg["dense_offense"]["shot_taken"]
+
+    # Lower air drag: a kicked ball keeps more of its speed
+    speeds = []
+    for config in ({}, {"season": "season_03"}):
+        env = NeonFootballEnv(config)
+        env.reset(seed=0)
+        ball = env.physics.ball_elements[0]
+        ball.velocity = (300.0, 0.0)
+        for _ in range(60):
+            env.physics.step(1.0 / 60.0)
+        speeds.append(ball.velocity.length)
+        assert env.reload_config() is False
+    assert speeds[1] > speeds[0]
+
+
+def test_light_modules_skip_heavy_imports():
+    """Verify that worker/tooling modules import without torch, pymunk, yaml or pydantic."""
+    import pickle
+
+    from configs.compiler import ConfigStore
+    from tools.import_budget import heavy_imports, measure
+
+    for module in ("ai.env.subproc_env", "configs.compiler", "ai.training.orchestrator"):
+        _, loaded = measure(module)
+        assert heavy_imports(loaded) == set(), module
+    _, loaded = measure("ai.env.neon_env")
+    assert heavy_imports(loaded) == {"gymnasium"}
+
+    # Workers receive the parent's compiled table instead of re-reading configs
+    table = pickle.loads(pickle.dumps(ConfigStore.shared().table))
+    assert not table.abilities.flags.writeable and table.scalars["physics.damping"] > 0
+    assert ConfigStore.adopt(table).refresh() is table
+
+
+def test_player_contacts_drive_referee():
+    """Verify that player impacts land in the contact buffer and the referee cards the charger."""
+    from sim.core.referee import Referee
+
+    engine = PhysicsEngine(pitch_dim=(600.0, 400.0), rng=DeterministicRNG(seed=42))
+    engine.spawn_player("blue_0", (200.0, 200.0))
+    engine.spawn_player("red_0", (240.0, 200.0))
+    engine.player_map["blue_0"][0].velocity = (1200.0, 0.0)
+    hits = []
+    for _ in range(5):
+        engine.step(1.0 / 60.0)
+        hits += list(zip(*engine.contacts.view()))
+    assert len(hits) == 1 and hits[0][:2] == (0, 1) and hits[0][2] > Referee().foul_threshold
+
+    # Red stood still, so the blue charger is booked whichever way round the pair is listed
+    referee = Referee(foul_threshold=15.0, yellow_limit=40.0, red_limit=100.0)
+    referee.bind(["blue_0", "red_0"])
+    kin = np.array([[200.0, 200.0, 1200.0, 0.0], [240.0, 200.0, 0.0, 0.0]])
+    events = referee.process_contacts(
+        np.array([1, 1]), np.array([0, 0]), np.array([120.0, 140.0]), 7, kin[:, 2:], kin[:, :2]
+    )
+    assert [(e.event_type, e.actor_id) for e in events] == [
+        ("FOUL", "blue_0"), ("YELLOW", "blue_0"), ("FOUL", "blue_0"), ("RED", "blue_0")
+    ]
+    points, cards = referee.discipline_table(["blue_0", "red_0"])
+    assert points.tolist() == [115.0, 0.0] and cards.tolist() == [2, 0]
@@ -24,6 +24,280 @@ def test_env_smoke():
     env.close()
 
 
+def test_env_action_repeat():
+    """Verify that action_repeat advances several physics ticks per decision."""
+    env = NeonFootballEnv({"seed": 42, "action_repeat": 4})
+    env.reset()
+    action = np.zeros(56, dtype=np.float32)
+
+    obs, reward, terminated, truncated, info = env.step(action)
+    assert info["ticks"] == 4
+    assert env.state.tick == 4
+
+    decisions = 1
+    while not (terminated or truncated):
+        obs, reward, terminated, truncated, info = env.step(action)
+        decisions += 1
+    assert truncated and decisions == env.max_steps // 4
+
+
+def test_carousel_penalty_timescale_ignores_action_repeat():
+    """Verify that a static possession is flagged after the same number of ticks for any repeat."""
+    from sim.core.state import TeamID
+
+    flagged_at = {}
+    for repeat in (1, 4, 7):
+        env = NeonFootballEnv({"action_repeat": repeat})
+        env.reset(seed=0)
+        env.state.possession_team = TeamID.BLUE
+        while repeat not in flagged_at and env.state.tick < env.max_steps:
+            env.step(np.zeros(56, dtype=np.float32))
+            if env.tactical_analysis()["degenerate_score"] > 0:
+                flagged_at[repeat] = env.state.tick
+    # Windows round up to whole decisions: 300, 75 * 4 and 43 * 7 ticks
+    assert flagged_at == {1: 300, 4: 300, 7: 301}
+
+
+def test_env_step_many_matches_step():
+    """Verify that step_many reproduces a sequence of step() calls and stops at episode end."""
+    actions = np.random.default_rng(3).uniform(-1.0, 1.0, (700, 56)).astype(np.float32)
+
+    env = NeonFootballEnv({"seed": 5})
+    env.reset()
+    obs, rewards, terminated, truncated, info = env.step_many(actions)
+
+    ref = NeonFootballEnv({"seed": 5})
+    ref.reset()
+    for t in range(info["steps"]):
+        ref_obs, ref_reward, ref_term, ref_trunc, _ = ref.step(actions[t])
+        assert np.array_equal(obs[t], ref_obs)
+        assert rewards[t] == ref_reward
+        assert (terminated[t], truncated[t]) == (ref_term, ref_trunc)
+
+    assert info["steps"] < len(actions)
+    assert terminated[-1] or truncated[-1]
+
+
+def test_ultra_vec_env_auto_reset():
+    """Verify that the batched env steps, truncates and auto-resets every match."""
+    import torch
+
+    from ai.env.ultra_vec_env import UltraVectorizedEnv
+
+    env = UltraVectorizedEnv(num_envs=8, device="cpu", max_steps=50, seed=0)
+    obs, _ = env.reset()
+    assert obs.shape == (8, env.obs_dim)
+
+    actions = torch.zeros((8, 14, 2))
+    for _ in range(50):
+        obs, rewards, terminated, truncated, info = env.step(actions)
+        assert rewards.shape == (8,)
+
+    assert bool(info["done"].all())
+    assert bool((info["episode_length"] <= 50).all())
+    stats = env.get_stats()
+    assert stats["episodes"] >= 8
+    assert bool((env.episode_length == 0).all())
+    # Averaged over completed episodes, not the freshly reset counters
+    assert 0 < stats["mean_episode_length"] <= 50
+
+    # Same seed, same kickoff jitter, without touching the global torch RNG
+    torch.manual_seed(123)
+    before = torch.rand(1)
+    torch.manual_seed(123)
+    first = UltraVectorizedEnv(num_envs=8, device="cpu", seed=0).reset()[0]
+    second = UltraVectorizedEnv(num_envs=8, device="cpu", seed=0).reset()[0]
+    assert torch.equal(first, second)
+    assert torch.equal(torch.rand(1), before)
+    assert torch.isfinite(obs).all()
+
+
+def test_sharded_vec_env_shared_views():
+    """Verify that sharded workers step shared buffers in lockstep and auto-reset."""
+    from ai.env.sharded_vec_env import ShardedVectorizedEnv
+
+    with ShardedVectorizedEnv(num_envs=16, num_workers=2, max_steps=10, seed=0) as env:
+        obs, _ = env.reset()
+        assert obs.shape == (16, env.obs_dim)
+        for _ in range(10):
+            step_obs, rewards, terminated, truncated, info = env.step(np.zeros((16, 14, 2)))
+            assert step_obs is obs
+
+        assert bool((terminated | truncated).all())
+        assert (info["final_length"] <= 10).all()
+        assert (env.episode_length == 0).all()
+        assert np.isfinite(obs).all()
+
+
+def test_vec_envs_hot_swap_reward_config(tmp_path):
+    """Verify that both vectorized envs take rewards from the compiled table and hot-swap it."""
+    import shutil
+
+    import torch
+
+    from ai.env.sharded_vec_env import ShardedVectorizedEnv
+    from ai.env.ultra_vec_env import UltraVectorizedEnv
+    from ai.training.reward_engine import RewardEngine
+    from configs.compiler import ConfigStore
+
+    season = UltraVectorizedEnv(num_envs=2, device="cpu", season="season_03", seed=0)
+    expected = RewardEngine(table=ConfigStore.shared("season_03").table).cfg
+    assert season.reward_engine.cfg == expected
+    assert season.reward_engine.cfg != RewardEngine().cfg
+
+    config_dir = tmp_path / "configs"
+    shutil.copytree("configs", config_dir, ignore=shutil.ignore_patterns("*.py"))
+    rewards_yaml = config_dir / "rewards.yaml"
+    store = ConfigStore(None, config_dir=str(config_dir))
+
+    ultra = UltraVectorizedEnv(num_envs=4, device="cpu", seed=0)
+    with ShardedVectorizedEnv(num_envs=4, num_workers=2, seed=0) as sharded:
+        before = []
+        for env, zeros in ((ultra, torch.zeros((4, 14, 2))), (sharded, np.zeros((4, 14, 2)))):
+            # The first reload adopts the swapped-in store's table; the next one is a no-op
+            env.config_store = store
+            env.reset()
+            before.append(np.abs(np.asarray(env.step(zeros)[1])).max())
+            assert env.reload_config() is True and env.reload_config() is False
+
+        rewards_yaml.write_text(
+            rewards_yaml.read_text().replace("progression: 0.1", "progression: 100.0")
+        )
+        for env, zeros, old in zip(
+            (ultra, sharded), (torch.zeros((4, 14, 2)), np.zeros((4, 14, 2))), before
+        ):
+            assert env.reload_config() is True
+            env.reset()
+            assert np.abs(np.asarray(env.step(zeros)[1])).max() > 100 * old
+    assert ultra.reward_engine.cfg["dense_offense"]["progression"] == 100.0
+
+
+def test_swept_goal_detection():
+    """Verify that shots tunnelling past the goal line between ticks are still scored."""
+    from ai.env.vec_rules import swept_goal_masks
+    from sim.core.state import TeamID
+
+    # Scalar env: one 1/60s tick carries the ball ~1000px through the end wall and
+    # out of the mouth's y range; only the crossing point is inside the mouth
+    env = NeonFootballEnv({"seed": 1})
+    env.reset()
+    ball = env.physics.ball_elements[0]
+    ball.position, ball.velocity = (590.0, 230.0), (60000.0, 12000.0)
+    env.physics.read_state(env.state.arrays.kinematics)
+    _, reward, terminated, _, info = env.step(np.zeros(56, dtype=np.float32))
+    assert env.rules.check_goal(env.state.ball.pos) is None
+    assert terminated and env.state.score[TeamID.BLUE] == 1
+    assert reward > env.reward_engine.cfg["sparse"]["goal_scored"] - 1.0
+    assert abs(info["goal_time"] - 0.01) < 1e-6
+
+    # Vectorized rule on centred coordinates (goal line x=+-28, mouth |y| < 4)
+    start = np.array([[25.0, 0.0], [25.0, 0.0], [-20.0, 0.0], [28.0, 3.0]])
+    end = np.array([[35.0, 6.0], [35.0, 20.0], [-40.0, 1.0], [28.0, 3.5]])
+    blue, red, fraction = swept_goal_masks(start, end, 28.0, 4.0)
+    assert blue.tolist() == [True, False, False, True]
+    assert red.tolist() == [False, False, True, False]
+    assert np.allclose(fraction, [0.3, 0.3, 0.4, 1.0])
+
+    # Goals reach the reward through calculate_batch's GOAL_FOR/GOAL_AGAINST columns
+    from ai.env.vec_rules import shaped_rewards
+    from ai.training.reward_engine import RewardEngine
+
+    engine = RewardEngine(pitch_width=56.0)
+    counts = np.zeros((4, 4))
+    scored = shaped_rewards(engine, end, blue, red, 56.0, counts)
+    plain = shaped_rewards(engine, end, blue & False, red & False, 56.0, counts)
+    assert np.allclose(scored - plain, [10.0, 0.0, -10.0, 10.0])
+
+
+def test_subproc_vec_env_auto_reset():
+    """Verify that the subprocess vector env matches a local env and auto-resets on truncation."""
+    from ai.env.subproc_env import NeonSubprocVecEnv
+
+    config = {"action_repeat": 8}
+    local = NeonFootballEnv(config)
+    local_obs, _ = local.reset()
+
+    with NeonSubprocVecEnv(2, config=config, seed=0) as env:
+        obs, _ = env.reset()
+        assert np.array_equal(obs[0], local_obs)
+
+        actions = np.zeros((2, 56), dtype=np.float32)
+        actions[:, 0::4] = 0.5
+        for _ in range(local.max_steps // 8):
+            obs, rewards, terminated, truncated, info = env.step(actions)
+
+        assert truncated.all()
+        assert (info["ticks"] == 8).all()
+        assert np.array_equal(obs[0], local_obs)
+        assert not np.array_equal(info["final_obs"][0], local_obs)
+
+
+def test_telemetry_reuses_tick_analysis():
+    """Verify that telemetry reuses the step's analyst output and caches drop on reset/restore."""
+    from sim.core.state import TeamID
+
+    env = NeonFootballEnv({"seed": 3})
+    env.reset()
+    env.state.possession_team = TeamID.BLUE
+    env.step(np.zeros(56, dtype=np.float32))
+    snap = env.snapshot()
+    frame = env.get_telemetry_frame()
+    assert env.analyst.possession_windows[TeamID.BLUE].count == 1
+    assert env.metrics.hits >= 1
+    assert frame["pressure"] == env.tactical_analysis()["pressure_index"]
+
+    env.step(np.zeros(56, dtype=np.float32))
+    env.restore(snap)
+    assert env.metrics.tick is None
+    dists = env.spatial_context().distances
+    assert dists.shape == (15, 15) and np.allclose(np.diag(dists), 0.0)
+    env.reset()
+    assert env.metrics.tick is None
+
+
+def test_chasing_the_ball_draws_fouls(monkeypatch):
+    """Verify that ordinary play books fouls and that judging contacts leaves play unchanged."""
+    import pymunk
+
+    def chase(env):
+        # Every player runs at the ball and tries to kick it
+        kin = env.state.arrays.kinematics
+        heading = kin[0, 0:2] - kin[1:, 0:2]
+        heading /= np.linalg.norm(heading, axis=1, keepdims=True) + 1e-6
+        controls = np.zeros((14, 4), dtype=np.float32)
+        controls[:, 0:2] = heading
+        controls[:, 2] = 1.0
+        return controls.ravel()
+
+    judged = NeonFootballEnv({"seed": 3})
+    contacts, fouls = [], []
+    process_contacts = judged.referee.process_contacts
+
+    def spy(slot_a, slot_b, impulse, *args):
+        events = process_contacts(slot_a, slot_b, impulse, *args)
+        contacts.extend(impulse.tolist())
+        fouls.extend(e for e in events if e.event_type == "FOUL")
+        return events
+
+    monkeypatch.setattr(judged.referee, "process_contacts", spy)
+
+    # The same match without a contact handler: physics alone
+    with monkeypatch.context() as m:
+        m.setattr(pymunk.Space, "on_collision", lambda *args, **kwargs: None)
+        unjudged = NeonFootballEnv({"seed": 3})
+
+    judged.reset()
+    unjudged.reset()
+    for step in range(300):
+        obs, reward, *_ = judged.step(chase(judged))
+        expected, expected_reward, *_ = unjudged.step(chase(unjudged))
+        assert np.array_equal(obs, expected) and reward == expected_reward, step
+
+    assert 0 < len(fouls) < len(contacts)
+    assert all(e.params["severity"] > judged.referee.foul_threshold for e in fouls)
+    assert judged.referee.points.sum() > 0
+
+
 if __name__ == "__main__":
     test_env_smoke()
     print("✅ Smoke test passed!")
@@ -51,5 +51,125 @@ def test_seed_reset():
         assert np.array_equal(states1[i], states2[i]), f"Divergence at step {i} after reset"
 
 
+@pytest.mark.parametrize("in_place", [True, False])
+def test_reset_in_place_matches_fresh_env(in_place, monkeypatch):
+    """Verify that a reset, in place or rebuilt, replays a freshly built env bit-for-bit."""
+    from sim.core import physics
+
+    if in_place and not physics.REWIND_IN_PLACE:
+        pytest.skip("installed pymunk does not export the Space rewind setters")
+    monkeypatch.setattr(physics, "REWIND_IN_PLACE", in_place)
+    rng = np.random.default_rng(3)
+    actions = rng.uniform(-1.0, 1.0, size=(300, 56)).astype(np.float32)
+    # Drive both teams towards the centre so bodies pile up and collide
+    actions[:, 0:28:4] = np.abs(actions[:, 0:28:4])
+    actions[:, 28:56:4] = -np.abs(actions[:, 28:56:4])
+
+    reused = NeonFootballEnv({"seed": 5})
+    reused.reset()
+    space = reused.physics.space
+    for a in actions[::-1]:
+        reused.step(a)
+
+    fresh = NeonFootballEnv({"seed": 5})
+    obs_fresh, _ = fresh.reset()
+    obs_reused, _ = reused.reset()
+    assert (reused.physics.space is space) == in_place
+    assert np.array_equal(obs_fresh, obs_reused)
+
+    for step, a in enumerate(actions):
+        obs_fresh, rew_fresh, _, _, _ = fresh.step(a)
+        obs_reused, rew_reused, _, _, _ = reused.step(a)
+        assert np.array_equal(obs_fresh, obs_reused), f"Divergence at step {step} after reset"
+        assert rew_fresh == rew_reused
+
+
+def test_public_pymunk_fallback_matches_raw_handles(monkeypatch):
+    """Verify that the public-API fallbacks of the raw chipmunk paths replay the same match."""
+    from sim.core import physics
+
+    rng = np.random.default_rng(8)
+    actions = rng.uniform(-1.0, 1.0, size=(150, 56)).astype(np.float32)
+    actions[:, 0:28:4] = np.abs(actions[:, 0:28:4])
+    actions[:, 28:56:4] = -np.abs(actions[:, 28:56:4])
+
+    def play():
+        env = NeonFootballEnv({"seed": 6})
+        env.reset()
+        trace = [env.step(a)[:2] for a in actions[:100]]
+        snap = env.snapshot()
+        trace += [env.step(a)[:2] for a in actions[100:]]
+        env.restore(snap)
+        trace += [env.step(a)[:2] for a in actions[100:]]
+        env.reset()
+        return trace + [env.step(a)[:2] for a in actions[:50]]
+
+    raw = play()
+    monkeypatch.setattr(physics, "REWIND_IN_PLACE", False)
+    monkeypatch.setattr(physics, "RAW_BODY_ACCESS", False)
+    public = play()
+    for step, ((o1, r1), (o2, r2)) in enumerate(zip(raw, public)):
+        assert np.array_equal(o1, o2) and r1 == r2, f"Fallback diverged at step {step}"
+
+
+def test_snapshot_restore_and_fork():
+    """Verify that restoring a snapshot replays the same branch, in place or in another env."""
+    rng = np.random.default_rng(11)
+    warmup = rng.uniform(-1.0, 1.0, size=(120, 56)).astype(np.float32)
+    branch = rng.uniform(-1.0, 1.0, size=(80, 56)).astype(np.float32)
+    branch[:, 0:28:4] = np.abs(branch[:, 0:28:4])
+    branch[:, 28:56:4] = -np.abs(branch[:, 28:56:4])
+
+    env = NeonFootballEnv({"seed": 9})
+    env.reset()
+    for a in warmup:
+        env.step(a)
+    snap = env.snapshot(canonicalize=True)
+
+    def rollout(target):
+        return [target.step(a)[:2] for a in branch]
+
+    original = rollout(env)
+    obs = env.restore(snap)
+    assert env.state.tick == snap.tick
+    replayed = rollout(env)
+
+    fork = NeonFootballEnv({"seed": 123})
+    fork_obs = fork.restore(snap)
+    assert np.array_equal(obs, fork_obs)
+    forked = rollout(fork)
+
+    for step, ((o1, r1), (o2, r2), (o3, r3)) in enumerate(zip(original, replayed, forked)):
+        assert np.array_equal(o1, o2) and np.array_equal(o1, o3), f"Branch diverged at step {step}"
+        assert r1 == r2 == r3
+
+
+def test_snapshot_is_read_only():
+    """Verify that taking a snapshot mid-match leaves the following steps bit-identical."""
+    # Teams charging head-on keep players in contact, so warm solver caches matter
+    actions = np.zeros((200, 56), dtype=np.float32)
+    actions[:, 0:28:4] = 1.0
+    actions[:, 28:56:4] = -1.0
+
+    plain = NeonFootballEnv({"seed": 4})
+    observed = NeonFootballEnv({"seed": 4})
+    plain.reset()
+    observed.reset()
+    for step, a in enumerate(actions):
+        if step % 25 == 0:
+            observed.snapshot()
+        o1, r1, *_ = plain.step(a)
+        o2, r2, *_ = observed.step(a)
+        assert np.array_equal(o1, o2) and r1 == r2, f"Snapshot perturbed step {step}"
+
+    # Restores of one snapshot agree with each other, whatever the source went on to do
+    snap = observed.snapshot()
+    first, second = NeonFootballEnv({"seed": 1}), NeonFootballEnv({"seed": 2})
+    first.restore(snap)
+    second.restore(snap)
+    for a in actions[:60]:
+        assert np.array_equal(first.step(a)[0], second.step(a)[0])
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,99 @@
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, Set, Tuple
+
+# Packages that must only be imported by code that really uses them
+HEAVY = ("torch", "pymunk", "pygame", "gymnasium", "pydantic", "yaml")
+
+# module -> (cumulative import budget in ms, heavy packages it may pull in); the
+# heavy-package sets are enforced strictly, the timings with slack (see check())
+BUDGETS: Dict[str, Tuple[float, Tuple[str, ...]]] = {
+    "sim.core.state": (160.0, ()),
+    "sim.core.spatial": (160.0, ()),
+    "ai.env.vec_rules": (50.0, ()),
+    "ai.explainability.tactical_analyst": (200.0, ()),
+    "ai.training.reward_engine": (220.0, ()),
+    "ai.training.orchestrator": (80.0, ()),
+    "configs.compiler": (250.0, ()),
+    "ai.env.sharded_vec_env": (250.0, ()),
+    "ai.env.subproc_env": (300.0, ()),
+    "tools.relabel_rewards": (250.0, ("yaml",)),
+    "sim.core.physics": (250.0, ("pymunk",)),
+    "ai.env.neon_env": (350.0, ("gymnasium",)),
+}
+
+_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|( +)(\S+)")
+
+
+def _importtime(code: str) -> str:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [".", env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, env=env
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{code!r} failed:\n{proc.stderr[-2000:]}")
+    return proc.stderr
+
+
+def measure(module: str) -> Tuple[float, Set[str]]:
+    """
+    (cumulative ms, every module imported) for `import module` in a fresh interpreter,
+    read from `python -X importtime`. Interpreter start-up imports are not counted.
+    """
+    startup = {m.group(3) for m in map(_LINE.match, _importtime("pass").splitlines()) if m}
+    total, loaded = 0.0, set()
+    for line in _importtime(f"import {module}").splitlines():
+        match = _LINE.match(line)
+        if match is None or match.group(3) in startup:
+            continue
+        cumulative, indent, name = match.groups()
+        loaded.add(name)
+        # Top-level entries: the module, its parent packages and anything they pulled in
+        if len(indent) == 1:
+            total += int(cumulative) / 1000.0
+    return total, loaded
+
+
+def heavy_imports(loaded: Set[str]) -> Set[str]:
+    return {name.split(".")[0] for name in loaded} & set(HEAVY)
+
+
+def check(repeat: int = 5, slack: float = 1.5, strict_time: bool = False) -> int:
+    """
+    Print a budget table; returns the number of regressions.
+    A heavy package outside a module's allowed set always fails. Timing is the median
+    of `repeat` runs against budget * slack and only warns unless strict_time is set.
+    """
+    failures = 0
+    for module, (budget, allowed) in BUDGETS.items():
+        runs = [measure(module) for _ in range(repeat)]
+        ms = statistics.median(total for total, _ in runs)
+        pulled = set().union(*(heavy_imports(loaded) for _, loaded in runs))
+        unexpected = sorted(pulled - set(allowed))
+        over = ms > budget * slack
+        failures += bool(unexpected) + (over and strict_time)
+        status = "❌" if unexpected or (over and strict_time) else "⚠️ " if over else "✅"
+        extra = f"  pulls in {', '.join(unexpected)}" if unexpected else ""
+        print(f"{status} {module:<36} {ms:>7.1f} ms / {budget * slack:>6.0f} ms{extra}")
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import-time regression check (-X importtime)")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per module (median is kept)")
+    parser.add_argument("--slack", type=float, default=1.5, help="multiplier on every budget")
+    parser.add_argument(
+        "--strict-time", action="store_true", help="fail (not just warn) on timing overruns"
+    )
+    args = parser.parse_args()
+
+    failures = check(args.repeat, args.slack, args.strict_time)
+    if failures:
+        print(f"\n{failures} import budget regression(s)")
+        sys.exit(1)
+    print("\nAll modules within their import budget")
@@ -0,0 +1,152 @@
+import argparse
+import json
+from typing import Dict, Optional
+
+import numpy as np
+
+from ai.env.neon_env import NeonFootballEnv
+from sim.core.physics import PhysicsEngine
+from sim.core.rng import DeterministicRNG
+from sim.ultra.vectorized_phys import VectorizedNeonPhysics
+
+PITCH = (600.0, 400.0)
+CENTER = np.array([300.0, 200.0])
+UNIT = 10.0  # pymunk pixels per vectorized pitch unit
+DT = 1.0 / 60.0
+
+
+def make_actions(seed: int, ticks: int, hold: int = 10) -> np.ndarray:
+    """Seeded [ticks, 14, 2] force sequence; each random command is held for `hold` ticks."""
+    rng = np.random.default_rng(seed)
+    commands = rng.uniform(-1.0, 1.0, ((ticks + hold - 1) // hold, 14, 2)).astype(np.float32)
+    return np.repeat(commands, hold, axis=0)[:ticks]
+
+
+def run_reference(actions: np.ndarray, seed: int = 0) -> np.ndarray:
+    """Roll the pymunk PhysicsEngine from kickoff; returns [ticks + 1, 15, 4] (x, y, vx, vy)."""
+    physics = PhysicsEngine(PITCH, DeterministicRNG(seed))
+    physics.spawn_ball(tuple(CENTER))
+    for pid, pos in NeonFootballEnv._kickoff_formation().items():
+        physics.spawn_player(pid, pos)
+
+    traj = np.zeros((len(actions) + 1, 15, 4))
+    physics.read_state(traj[0])
+    no_dash = np.zeros(14, dtype=bool)
+    everyone = np.ones(14, dtype=bool)
+    for t, forces in enumerate(actions):
+        physics.apply_actions(forces, no_dash, everyone)
+        physics.step(DT)
+        physics.read_state(traj[t + 1])
+    return traj
+
+
+def run_vectorized(
+    actions: np.ndarray, start: np.ndarray, friction: float, action_scale: float
+) -> np.ndarray:
+    """
+    Roll VectorizedNeonPhysics for a batch of episodes from reference start states.
+    actions is [E, ticks, 14, 2], start is [E, 15, 4] in pymunk pixels;
+    returns [E, ticks + 1, 15, 4] converted back to pymunk pixels.
+    """
+    episodes, ticks = actions.shape[:2]
+    phys = VectorizedNeonPhysics(episodes, friction=friction, backend="numpy")
+    phys.pos[:] = (start[:, :, 0:2] - CENTER) / UNIT
+    phys.vel[:] = start[:, :, 2:4] / UNIT
+
+    traj = np.zeros((episodes, ticks + 1, 15, 4))
+    traj[:, 0] = start
+    forces = (actions * action_scale).astype(np.float32)
+    for t in range(ticks):
+        phys.step(forces[:, t])
+        traj[:, t + 1, :, 0:2] = phys.pos * UNIT + CENTER
+        traj[:, t + 1, :, 2:4] = phys.vel * UNIT
+    return traj
+
+
+def divergence(ref: np.ndarray, fast: np.ndarray) -> Dict[str, np.ndarray]:
+    """Per-tick position error in pymunk pixels, averaged over episodes ([E, T, 15, 4] inputs)."""
+    err = np.linalg.norm(ref[..., 0:2] - fast[..., 0:2], axis=-1)  # [E, T, 15]
+    return {
+        "ball": err[:, :, 0].mean(axis=0),
+        "player_mean": err[:, :, 1:].mean(axis=(0, 2)),
+        "player_max": err[:, :, 1:].max(axis=(0, 2)),
+    }
+
+
+def fit_calibration(ref: np.ndarray, actions: np.ndarray, margin: float = 30.0) -> Dict[str, float]:
+    """
+    Least-squares fit of the vectorized player update v' = f * (v + s * u * dt)
+    against reference trajectories, using only contact-free samples
+    (every player more than `margin` px from walls, other players and the ball).
+    Returns the per-tick friction f and action_scale s (pitch units / s^2).
+    """
+    pos = ref[:, :-1, :, 0:2]
+    gaps = np.linalg.norm(pos[:, :, :, None] - pos[:, :, None, :], axis=-1)
+    gaps[:, :, np.arange(15), np.arange(15)] = np.inf
+    lo = np.array([5.0 + 12.0, 5.0 + 12.0])
+    hi = np.array(PITCH) - lo
+    wall_gap = np.minimum(pos - lo, hi - pos).min(axis=-1)
+    free = (gaps.min(axis=-1) > 24.0 + margin) & (wall_gap > margin)  # [E, T, 15]
+    free = free[:, :, 1:]
+
+    v = ref[:, :-1, 1:, 2:4][free].reshape(-1)
+    v_next = ref[:, 1:, 1:, 2:4][free].reshape(-1)
+    u = actions[free].reshape(-1).astype(np.float64)
+    design = np.stack([v, u], axis=1)
+    (alpha, beta), *_ = np.linalg.lstsq(design, v_next, rcond=None)
+    return {
+        "friction": float(alpha),
+        "action_scale": float(beta / (alpha * DT) / UNIT),
+        "samples": int(v.size),
+    }
+
+
+def report(name: str, stats: Dict[str, np.ndarray], ticks=(1, 10, 60, 120, 300, 600)):
+    print(f"--- {name} (position error, px) ---")
+    print(f"{'tick':>6} {'ball':>10} {'player mean':>12} {'player max':>11}")
+    for t in ticks:
+        if t < len(stats["ball"]):
+            print(
+                f"{t:>6} {stats['ball'][t]:>10.2f} {stats['player_mean'][t]:>12.2f}"
+                f" {stats['player_max'][t]:>11.2f}"
+            )
+    over = np.flatnonzero(stats["player_mean"] > 12.0)
+    first = int(over[0]) if over.size else None
+    print(f"Mean player error exceeds one player radius at tick: {first}")
+
+
+def run_parity(
+    episodes: int = 4, ticks: int = 300, seed: int = 0, out: Optional[str] = None
+) -> Dict[str, float]:
+    """Compare both engines on seeded action sequences, then fit and re-check a calibration."""
+    print(f"⚖️  Physics parity: {episodes} episodes x {ticks} ticks (seed {seed})")
+    actions = np.stack([make_actions(seed + e, ticks) for e in range(episodes)])
+    ref = np.stack([run_reference(actions[e], seed + e) for e in range(episodes)])
+
+    default_scale = 2000.0 / 70.0 / UNIT  # UltraVectorizedEnv.action_scale
+    baseline = run_vectorized(actions, ref[:, 0], 0.98, default_scale)
+    report("default (friction 0.98)", divergence(ref, baseline))
+
+    calibration = fit_calibration(ref, actions)
+    print(
+        f"Fitted friction={calibration['friction']:.6f} action_scale="
+        f"{calibration['action_scale']:.4f} from {calibration['samples']} samples"
+    )
+    tuned = run_vectorized(actions, ref[:, 0], calibration["friction"], calibration["action_scale"])
+    report("calibrated", divergence(ref, tuned))
+
+    if out:
+        with open(out, "w") as f:
+            json.dump(calibration, f, indent=2)
+        print(f"Calibration written to {out}")
+    return calibration
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="VectorizedNeonPhysics vs PhysicsEngine parity")
+    parser.add_argument("--episodes", type=int, default=4)
+    parser.add_argument("--ticks", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None, help="write the fitted calibration as JSON")
+    args = parser.parse_args()
+    run_parity(args.episodes, args.ticks, args.seed, args.out)
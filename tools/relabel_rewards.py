@@ -0,0 +1,195 @@
+import argparse
+import json
+import os
+from typing import Any, Dict, List, Sequence
+
+import msgpack
+import numpy as np
+import yaml
+
+from ai.training.reward_engine import (
+    DEGENERATE_PENALTY,
+    DEGENERATE_THRESHOLD,
+    EVENT_COLUMNS,
+    REWARD_TERMS,
+    RewardEngine,
+)
+from sim.core.state import TeamID
+
+COMPONENTS = [key for _, key in REWARD_TERMS] + ["degenerate_penalty"]
+
+
+def frames_to_arrays(frames: Sequence[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """
+    Column arrays from recorded frames. Understands SimulationEncoder dicts (JSONL logs),
+    NeonFootballEnv.get_telemetry_frame() and TelemetryFrame replays.
+    Possession is the frame's "possession" TeamID value when recorded, otherwise the team
+    of the player whose id is in "poss"; "degenerate" is the analyst's carousel score.
+    """
+    num_ticks, num_players = len(frames), len(frames[0]["p"])
+    arrays = {
+        "ball_pos": np.zeros((num_ticks, 2)),
+        "player_pos": np.zeros((num_ticks, num_players, 2)),
+        "stamina": np.full((num_ticks, num_players), 100.0),
+        "team": np.array([p["team"] for p in frames[0]["p"]], dtype=np.int64),
+        "score": np.zeros((num_ticks, 2), dtype=np.int64),
+        "possession": np.full(num_ticks, -1, dtype=np.int64),
+        "degenerate": np.zeros(num_ticks),
+        # Per-team PASS/SHOT counts; only events that name their team are credited
+        "team_events": np.zeros((num_ticks, 2, 2)),
+    }
+    for t, frame in enumerate(frames):
+        ball = frame["b"]
+        arrays["ball_pos"][t] = ball["p"] if isinstance(ball, dict) else ball
+        score = frame.get("s", (0, 0))
+        arrays["score"][t] = (score["BLUE"], score["RED"]) if isinstance(score, dict) else score
+        if frame.get("possession") is not None:
+            arrays["possession"][t] = frame["possession"]
+        elif frame.get("poss") is not None:
+            slot = [player.get("id") for player in frame["p"]].index(frame["poss"])
+            arrays["possession"][t] = arrays["team"][slot]
+        arrays["degenerate"][t] = frame.get("degenerate", 0.0)
+        for i, player in enumerate(frame["p"]):
+            arrays["player_pos"][t, i] = player["pos"]
+            arrays["stamina"][t, i] = player.get("stm", player.get("st", 100.0))
+        for event in frame.get("e", []):
+            if not isinstance(event, dict):
+                continue
+            kind = event.get("event_type", event.get("type"))
+            team = event.get("actor_team", event.get("team"))
+            if kind in EVENT_COLUMNS[:2] and team in (0, 1):
+                arrays["team_events"][t, team, EVENT_COLUMNS.index(kind)] += 1
+    return arrays
+
+
+def load_trajectory(path: str) -> Dict[str, np.ndarray]:
+    """
+    Load one recorded match as column arrays. Accepted formats:
+      .npz          arrays named like frames_to_arrays() output (ball_pos, player_pos, team
+                    required; stamina, score, possession, degenerate, team_events optional)
+      .jsonl        one SimulationEncoder / telemetry frame per line
+      .neon_replay  msgpack list of frames (ReplayRecorder)
+    """
+    if path.endswith(".npz"):
+        with np.load(path) as data:
+            return {key: data[key] for key in data.files}
+    if path.endswith(".jsonl"):
+        with open(path, "r") as f:
+            frames = [json.loads(line) for line in f if line.strip()]
+    else:
+        with open(path, "rb") as f:
+            frames = msgpack.unpackb(f.read(), raw=False)
+    return frames_to_arrays(frames)
+
+
+def batch_inputs(arrays: Dict[str, np.ndarray], team: TeamID) -> Dict[str, Any]:
+    """RewardEngine.calculate_batch() keyword arguments for a whole trajectory."""
+    num_ticks = len(arrays["ball_pos"])
+    counts = np.zeros((num_ticks, len(EVENT_COLUMNS)))
+    if "team_events" in arrays:
+        counts[:, :2] = arrays["team_events"][:, team.value]
+    if "score" in arrays:
+        # Goals are the per-tick score deltas, as NeonFootballEnv credits them
+        delta = np.diff(arrays["score"], axis=0, prepend=arrays["score"][:1])
+        counts[:, 2] = delta[:, team.value]
+        counts[:, 3] = delta[:, 1 - team.value]
+    return {
+        "ball_pos": arrays["ball_pos"],
+        "player_pos": arrays["player_pos"],
+        "possession": arrays.get("possession", np.full(num_ticks, -1)),
+        "event_counts": counts,
+        "stamina": arrays.get("stamina"),
+        "team": team,
+        "team_slots": np.flatnonzero(arrays["team"] == team.value),
+    }
+
+
+def degenerate_penalties(arrays: Dict[str, np.ndarray]) -> np.ndarray:
+    """NeonFootballEnv's carousel penalty per frame (one frame per step, action_repeat=1)."""
+    degenerate = arrays.get("degenerate", np.zeros(len(arrays["ball_pos"])))
+    return np.where(degenerate > DEGENERATE_THRESHOLD, DEGENERATE_PENALTY, 0.0)
+
+
+def relabel(
+    paths: List[str],
+    profiles: List[str],
+    out_dir: str,
+    config_path: str = "configs/rewards.yaml",
+    team: TeamID = TeamID.BLUE,
+) -> Dict[str, np.memmap]:
+    """
+    Recompute the reward stream of every recorded trajectory under each profile.
+    Writes <out_dir>/<profile>.rewards.npy [T] and <profile>.components.npy [T, C]
+    (memory-mapped, trajectories concatenated) plus index.json with the offsets.
+    """
+    with open(config_path, "r") as f:
+        known = set(yaml.safe_load(f))
+    missing = [p for p in profiles if p not in known]
+    if missing:
+        raise ValueError(f"Unknown reward profiles {missing} in {config_path}")
+
+    # Each trajectory is loaded once; every profile then costs one batched pass over it
+    loaded = [load_trajectory(path) for path in paths]
+    trajectories = [batch_inputs(arrays, team) for arrays in loaded]
+    penalties = [degenerate_penalties(arrays) for arrays in loaded]
+    lengths = [len(traj["ball_pos"]) for traj in trajectories]
+    offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(int).tolist()
+    total = offsets[-1]
+
+    os.makedirs(out_dir, exist_ok=True)
+    outputs = {}
+    for profile in profiles:
+        engine = RewardEngine(config_path, profile)
+        rewards = np.lib.format.open_memmap(
+            os.path.join(out_dir, f"{profile}.rewards.npy"), mode="w+", shape=(total,)
+        )
+        components = np.lib.format.open_memmap(
+            os.path.join(out_dir, f"{profile}.components.npy"), mode="w+",
+            shape=(total, len(COMPONENTS)),
+        )
+        for traj, penalty, lo, hi in zip(
+            trajectories, penalties, offsets[:-1], offsets[1:], strict=True
+        ):
+            shaped, breakdown = engine.calculate_batch(**traj)
+            breakdown["degenerate_penalty"] = penalty
+            rewards[lo:hi] = shaped + penalty
+            for c, key in enumerate(COMPONENTS):
+                components[lo:hi, c] = breakdown[key]
+        rewards.flush()
+        components.flush()
+        outputs[profile] = rewards
+
+    with open(os.path.join(out_dir, "index.json"), "w") as f:
+        json.dump({
+            "team": team.name,
+            "profiles": profiles,
+            "components": COMPONENTS,
+            "trajectories": [
+                {"path": path, "offset": lo, "length": n}
+                for path, lo, n in zip(paths, offsets[:-1], lengths, strict=True)
+            ],
+        }, f, indent=2)
+    return outputs
+
+
+def report(outputs: Dict[str, np.memmap], out_dir: str):
+    with open(os.path.join(out_dir, "index.json"), "r") as f:
+        index = json.load(f)
+    print(f"🏷️  Relabeled {len(index['trajectories'])} trajectories -> {out_dir}")
+    for profile, rewards in outputs.items():
+        returns = [float(rewards[t["offset"]:t["offset"] + t["length"]].sum())
+                   for t in index["trajectories"]]
+        print(f"  {profile:<16} mean return {np.mean(returns):>10.3f} | "
+              f"min {np.min(returns):>10.3f} | max {np.max(returns):>10.3f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recompute recorded reward streams offline")
+    parser.add_argument("paths", nargs="+", help=".npz / .jsonl / .neon_replay recordings")
+    parser.add_argument("--profiles", nargs="+", default=["baseline"])
+    parser.add_argument("--config", default="configs/rewards.yaml")
+    parser.add_argument("--team", choices=["BLUE", "RED"], default="BLUE")
+    parser.add_argument("--out", default="data/relabel")
+    args = parser.parse_args()
+    outputs = relabel(args.paths, args.profiles, args.out, args.config, TeamID[args.team])
+    report(outputs, args.out)